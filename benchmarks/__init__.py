@@ -0,0 +1,9 @@
+# ==========================================================================
+# File: __init__.py
+# Description: Benchmarks for the PROTEUS application. They are not part
+#              of the test suite, run them as modules from the repository
+#              root, e.g. python -m benchmarks.project_xml
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
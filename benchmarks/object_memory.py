@@ -0,0 +1,102 @@
+# ==========================================================================
+# File: object_memory.py
+# Description: Benchmark of the memory used by the objects of a loaded
+#              project, measured with tracemalloc.
+#              Run with: python -m benchmarks.object_memory [sizes...]
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+import gc
+import sys
+import logging
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+# --------------------------------------------------------------------------
+# Project specific imports (starting from root)
+# --------------------------------------------------------------------------
+
+from proteus.services.project_service import ProjectService
+from benchmarks.synthetic_project import create_synthetic_project
+
+# Constants
+DEFAULT_SIZES = [50000]
+TOP_ALLOCATIONS = 8
+
+
+# --------------------------------------------------------------------------
+# Function: traced_memory
+# Description: Returns the memory currently traced by tracemalloc.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def traced_memory() -> int:
+    """
+    Returns the memory in bytes currently allocated by Python objects after
+    a full garbage collection.
+    """
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+# --------------------------------------------------------------------------
+# Function: main
+# Description: Runs the benchmark.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def main(sizes: List[int]) -> None:
+    """
+    Loads a synthetic project of each size and reports the bytes per object
+    right after loading and after every property has been created (e.g.
+    after rendering every document). Memory allocated by libxml2 is not
+    traced, only Python objects are.
+    """
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'objects':>8} {'loaded (B/obj)':>15} {'all properties (B/obj)':>23}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            project_path = create_synthetic_project(Path(directory) / "project", size)
+
+            tracemalloc.start()
+            baseline = traced_memory()
+
+            project_service = ProjectService()
+            project_service.load_project(
+                project_path.as_posix(), loading_threads=1, use_snapshot=False
+            )
+            objects_number = len(project_service.project_index)
+            loaded = traced_memory() - baseline
+
+            for element in project_service.project_index.values():
+                for _ in element.properties.values():
+                    pass
+            materialized = traced_memory() - baseline
+
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+            print(
+                f"{objects_number:>8} {loaded / objects_number:>15.0f} "
+                f"{materialized / objects_number:>23.0f}"
+            )
+
+            print(f"\nTop {TOP_ALLOCATIONS} allocation lines:")
+            for statistic in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+                print(f"  {statistic}")
+            print()
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
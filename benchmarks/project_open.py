@@ -0,0 +1,85 @@
+# ==========================================================================
+# File: project_open.py
+# Description: Benchmark of the project open time with a cold and a warm
+#              snapshot cache.
+#              Run with: python -m benchmarks.project_open [sizes...]
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+import sys
+import logging
+import tempfile
+from pathlib import Path
+from typing import List
+from unittest import mock
+
+# --------------------------------------------------------------------------
+# Project specific imports (starting from root)
+# --------------------------------------------------------------------------
+
+from proteus.services.project_service import ProjectService
+from benchmarks.synthetic_project import create_synthetic_project
+from benchmarks.project_xml import best_time
+
+# Constants
+DEFAULT_SIZES = [1000, 5000, 10000, 25000]
+LOADING_THREADS = [1, 4]
+
+
+# --------------------------------------------------------------------------
+# Function: open_project
+# Description: Opens a project with the project service.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def open_project(project_path: Path, loading_threads: int, use_snapshot: bool) -> None:
+    """
+    Opens the project in the given path.
+    """
+    ProjectService().load_project(
+        project_path.as_posix(), loading_threads=loading_threads, use_snapshot=use_snapshot
+    )
+
+
+# --------------------------------------------------------------------------
+# Function: main
+# Description: Runs the benchmark.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def main(sizes: List[int]) -> None:
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'objects':>8} {'threads':>8} {'cold (s)':>9} {'warm (s)':>9} {'speedup':>8}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            directory = Path(directory)
+            project_path = create_synthetic_project(directory / "project", size)
+
+            # Keep benchmark snapshots out of the application directory
+            with mock.patch(
+                "proteus.model.snapshot.PROTEUS_SNAPSHOTS_DIR", directory / "snapshots"
+            ):
+                for threads in LOADING_THREADS:
+                    cold = best_time(lambda: open_project(project_path, threads, False))
+
+                    # First open writes the snapshot
+                    open_project(project_path, threads, True)
+                    warm = best_time(lambda: open_project(project_path, threads, True))
+
+                    print(
+                        f"{size:>8} {threads:>8} {cold:>9.3f} {warm:>9.3f} "
+                        f"{cold / warm:>7.1f}x"
+                    )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
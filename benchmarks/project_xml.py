@@ -0,0 +1,126 @@
+# ==========================================================================
+# File: project_xml.py
+# Description: Benchmark of the project XML generation used for rendering.
+#              Run with: python -m benchmarks.project_xml [sizes...]
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+import sys
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+# --------------------------------------------------------------------------
+# Third-party library imports
+# --------------------------------------------------------------------------
+
+import lxml.etree as ET
+
+# --------------------------------------------------------------------------
+# Project specific imports (starting from root)
+# --------------------------------------------------------------------------
+
+from proteus.model import CHILD_TAG, DOCUMENT_TAG, ID_ATTRIBUTE
+from proteus.model.abstract_object import ProteusState
+from proteus.services.project_service import ProjectService
+from benchmarks.synthetic_project import create_synthetic_project
+
+# Constants
+DEFAULT_SIZES = [1000, 5000, 10000, 25000, 50000]
+REPETITIONS = 3
+
+
+# --------------------------------------------------------------------------
+# Function: legacy_generate_project_xml
+# Description: Placeholder replacement loop used before the single pass
+#              builder, kept for comparison.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def legacy_generate_project_xml(project_service: ProjectService) -> ET._Element:
+    """
+    Generates the project xml replacing <document> and <child> tags until
+    no child tags are found. Every iteration searches the whole tree.
+    """
+    root = project_service.project.generate_xml()
+    for document_element in root.findall(f".//{DOCUMENT_TAG}"):
+        document = project_service._get_element_by_id(
+            document_element.attrib[ID_ATTRIBUTE]
+        )
+        document_element.getparent().replace(document_element, document.generate_xml())
+
+    while root.findall(f".//{CHILD_TAG}"):
+        for child_element in root.findall(f".//{CHILD_TAG}"):
+            child = project_service._get_element_by_id(child_element.attrib[ID_ATTRIBUTE])
+            parent_element = child_element.getparent()
+            if child.state == ProteusState.DEAD:
+                parent_element.remove(child_element)
+            else:
+                parent_element.replace(child_element, child.generate_xml())
+
+    return root
+
+
+# --------------------------------------------------------------------------
+# Function: best_time
+# Description: Returns the best execution time of a function.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def best_time(function: Callable, repetitions: int = REPETITIONS) -> float:
+    """
+    Returns the best wall time in seconds of the given function.
+    """
+    times: List[float] = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+# --------------------------------------------------------------------------
+# Function: main
+# Description: Runs the benchmark.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def main(sizes: List[int]) -> None:
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'objects':>8} {'builder (s)':>12} {'us/object':>10} {'legacy (s)':>11}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            project_path = create_synthetic_project(Path(directory), size)
+            project_service = ProjectService()
+            project_service.load_project(project_path.as_posix())
+            objects_number = len(project_service.project_index) - 1
+
+            builder = best_time(project_service.generate_project_xml)
+
+            # Legacy loop is quadratic on depth x size, skip it on big sizes
+            legacy = (
+                f"{best_time(lambda: legacy_generate_project_xml(project_service), 1):11.3f}"
+                if size <= 10000
+                else f"{'-':>11}"
+            )
+
+            print(
+                f"{objects_number:>8} {builder:>12.3f} "
+                f"{builder / objects_number * 1e6:>10.1f} {legacy}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
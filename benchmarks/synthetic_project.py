@@ -0,0 +1,211 @@
+# ==========================================================================
+# File: synthetic_project.py
+# Description: Synthetic PROTEUS projects generator for benchmarks.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+from pathlib import Path
+from typing import List
+
+# --------------------------------------------------------------------------
+# Third-party library imports
+# --------------------------------------------------------------------------
+
+import lxml.etree as ET
+
+# --------------------------------------------------------------------------
+# Project specific imports (starting from root)
+# --------------------------------------------------------------------------
+
+from proteus.model import (
+    PROJECT_FILE_NAME,
+    OBJECTS_REPOSITORY,
+    ASSETS_REPOSITORY,
+    PROTEUS_DOCUMENT,
+    PROTEUS_ANY,
+    PROTEUS_NAME,
+    PROTEUS_CODE,
+    PROTEUS_DEPENDENCY,
+)
+
+# Constants
+SECTIONS_PER_DOCUMENT = 10
+REQUIREMENT_CODE_PREFIX = "REQ-"
+DESCRIPTION = (
+    "The system shall store the information described in this requirement. "
+    "This text emulates a medium size **markdown** description."
+)
+
+
+# --------------------------------------------------------------------------
+# Function: _write_element
+# Description: Writes an XML element to the given path.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def _write_element(element: ET._Element, path: Path) -> None:
+    """
+    Writes the given element to the given path using the same format used
+    by PROTEUS when saving objects.
+    """
+    ET.ElementTree(element).write(
+        path, pretty_print=True, xml_declaration=True, encoding="utf-8"
+    )
+
+
+# --------------------------------------------------------------------------
+# Function: _object_element
+# Description: Creates a synthetic object XML element.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def _object_element(
+    id: str, classes: str, name: str, children_ids: List[str]
+) -> ET._Element:
+    """
+    Creates an object element with a name and a comments property and the
+    given children ids.
+    """
+    element = ET.Element("object")
+    element.set("id", id)
+    element.set("classes", classes)
+    element.set("acceptedChildren", PROTEUS_ANY)
+    element.set("acceptedParents", PROTEUS_ANY)
+
+    properties = ET.SubElement(element, "properties")
+    name_property = ET.SubElement(properties, "stringProperty")
+    name_property.set("name", PROTEUS_NAME)
+    name_property.set("category", "general")
+    name_property.text = ET.CDATA(name)
+
+    comments_property = ET.SubElement(properties, "markdownProperty")
+    comments_property.set("name", "comments")
+    comments_property.set("category", "comments")
+    comments_property.text = ET.CDATA("")
+
+    children = ET.SubElement(element, "children")
+    for child_id in children_ids:
+        ET.SubElement(children, "child").set("id", child_id)
+
+    return element
+
+
+# --------------------------------------------------------------------------
+# Function: create_synthetic_project
+# Description: Creates a synthetic project with the given number of objects.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def create_synthetic_project(
+    path: Path, objects_number: int, documents_number: int = 10
+) -> Path:
+    """
+    Creates a synthetic project in the given directory with approximately
+    the given number of objects (documents and sections included). Each
+    document contains SECTIONS_PER_DOCUMENT sections and each section
+    contains requirements with a code, a markdown description and a
+    dependency trace to the previous requirement.
+
+    :param path: Directory where the project is created.
+    :param objects_number: Number of objects of the project.
+    :param documents_number: Number of documents of the project.
+    :return: Path to the project directory.
+    """
+    path = Path(path)
+    objects_path = path / OBJECTS_REPOSITORY
+    objects_path.mkdir(parents=True, exist_ok=True)
+    (path / ASSETS_REPOSITORY).mkdir(exist_ok=True)
+
+    sections_number = documents_number * SECTIONS_PER_DOCUMENT
+    requirements_number = max(objects_number - documents_number - sections_number, 0)
+
+    requirement_index = 0
+    previous_requirement_id: str = None
+    document_ids: List[str] = []
+
+    for d in range(documents_number):
+        document_id = f"doc{d:06d}"
+        section_ids: List[str] = []
+
+        for s in range(SECTIONS_PER_DOCUMENT):
+            section_number = d * SECTIONS_PER_DOCUMENT + s
+            section_id = f"sec{section_number:06d}"
+
+            # Distribute requirements evenly among sections
+            start = requirements_number * section_number // sections_number
+            end = requirements_number * (section_number + 1) // sections_number
+
+            requirement_ids: List[str] = []
+            for _ in range(start, end):
+                requirement_index += 1
+                requirement_id = f"req{requirement_index:06d}"
+                requirement = _object_element(
+                    requirement_id,
+                    "software-requirement functional-requirement",
+                    f"Requirement {requirement_index}",
+                    [],
+                )
+                properties = requirement.find("properties")
+
+                code = ET.Element("codeProperty")
+                code.set("name", PROTEUS_CODE)
+                code.set("category", "general")
+                ET.SubElement(code, "prefix").text = ET.CDATA(REQUIREMENT_CODE_PREFIX)
+                ET.SubElement(code, "number").text = f"{requirement_index:03d}"
+                ET.SubElement(code, "suffix").text = ET.CDATA("")
+                properties.insert(0, code)
+
+                description = ET.SubElement(properties, "markdownProperty")
+                description.set("name", "description")
+                description.set("category", "general")
+                description.text = ET.CDATA(DESCRIPTION)
+
+                trace = ET.SubElement(properties, "traceProperty")
+                trace.set("name", "dependencies")
+                trace.set("category", "traceability")
+                trace.set("acceptedTargets", "software-requirement")
+                trace.set("traceType", PROTEUS_DEPENDENCY)
+                if previous_requirement_id is not None:
+                    target = ET.SubElement(trace, "trace")
+                    target.set("target", previous_requirement_id)
+                    target.set("traceType", PROTEUS_DEPENDENCY)
+
+                _write_element(requirement, objects_path / f"{requirement_id}.xml")
+                requirement_ids.append(requirement_id)
+                previous_requirement_id = requirement_id
+
+            section = _object_element(
+                section_id, "section", f"Section {section_number}", requirement_ids
+            )
+            _write_element(section, objects_path / f"{section_id}.xml")
+            section_ids.append(section_id)
+
+        document = _object_element(
+            document_id, PROTEUS_DOCUMENT, f"Document {d}", section_ids
+        )
+        _write_element(document, objects_path / f"{document_id}.xml")
+        document_ids.append(document_id)
+
+    # Project file
+    project = ET.Element("project")
+    project.set("id", "synthetic0project")
+    properties = ET.SubElement(project, "properties")
+    name_property = ET.SubElement(properties, "stringProperty")
+    name_property.set("name", PROTEUS_NAME)
+    name_property.set("category", "general")
+    name_property.text = ET.CDATA("Synthetic project")
+    documents = ET.SubElement(project, "documents")
+    for document_id in document_ids:
+        ET.SubElement(documents, "document").set("id", document_id)
+    _write_element(project, path / PROJECT_FILE_NAME)
+
+    return path
@@ -2,7 +2,7 @@
 # File: glossary_handler.py
 # Description: PyQT6 glossary handler for the REMUS plugin
 # Date: 09/01/2024
-# Version: 0.1
+# Version: 0.2
 # Author: José María Delgado Sánchez
 # ==========================================================================
 
@@ -11,7 +11,7 @@
 # --------------------------------------------------------------------------
 
 import logging
-from typing import Dict, List, MutableSet
+from typing import Dict, FrozenSet, List, NamedTuple
 import re
 from io import StringIO
 from html import escape
@@ -40,6 +40,7 @@ from proteus.application.events import (
     AddObjectEvent,
     DeleteObjectEvent,
     ModifyObjectEvent,
+    ModifyObjectsEvent,
 )
 
 
@@ -50,6 +51,28 @@ GLOSSARY_CLASS = "glossary-item"
 GLOSSARY_DESCRIPTION = "description"
 
 
+# --------------------------------------------------------------------------
+# Class: GlossaryState
+# Description: Glossary items read by the highlighting function
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+class GlossaryState(NamedTuple):
+    """
+    Glossary items descriptions, ids and regex pattern. The highlighting
+    function is called from the render thread, so the state is never
+    modified in place. A new state is built and replaced in a single
+    assignment.
+    """
+
+    items_descriptions: Dict[ProteusID, str]  # k: ProteusID, v: description
+    object_ids_by_item: Dict[
+        str, FrozenSet[ProteusID]
+    ]  # k: glossary item name, v: FrozenSet[ProteusID]
+    pattern: re.Pattern | None
+
+
 # ==========================================================================
 # Markdown patch
 # ==========================================================================
@@ -84,7 +107,7 @@ markdown.Markdown.output_formats["plain"] = unmark_element
 # Class: GlossaryHandler
 # Description: Glossary handler class for the REMUS plugin
 # Date: 09/01/2024
-# Version: 0.1
+# Version: 0.2
 # Author: José María Delgado Sánchez
 # --------------------------------------------------------------------------
 class GlossaryHandler(ProteusComponent):
@@ -104,12 +127,8 @@ class GlossaryHandler(ProteusComponent):
     """
 
     # Class attributes
-    items_descriptions: Dict[ProteusID, str] = dict()  # k: ProteusID, v: description
-    object_ids_by_item: Dict[
-        str, MutableSet[ProteusID]
-    ] = dict()  # k: glossary item name, v: Set[ProteusID]
-    
-    pattern: re.Pattern = None
+    # NOTE: Read from the render thread, it must be replaced atomically
+    state: GlossaryState = GlossaryState(dict(), dict(), None)
 
     # NOTE: This pattern is build using <code> tags because text is already converted to html
     code_block_pattern: re.Pattern = re.compile(
@@ -138,12 +157,13 @@ class GlossaryHandler(ProteusComponent):
         AddObjectEvent().connect(self.update_on_add_object)
         DeleteObjectEvent().connect(self.update_on_delete_object)
         ModifyObjectEvent().connect(self.update_on_modify_object)
+        ModifyObjectsEvent().connect(self.update_on_modify_objects)
 
     # --------------------------------------------------------------------------
     # Method: update_on_project_open
     # Description: It loads the glossary items from the project.
     # Date: 09/01/2024
-    # Version: 0.1
+    # Version: 0.2
     # Author: José María Delgado Sánchez
     # --------------------------------------------------------------------------
     def update_on_project_open(self) -> None:
@@ -153,8 +173,8 @@ class GlossaryHandler(ProteusComponent):
         Triggered by: OpenProjectEvent
         """
         # Clear the glossary items
-        GlossaryHandler.items_descriptions = dict()
-        GlossaryHandler.object_ids_by_item = dict()
+        items_descriptions: Dict[ProteusID, str] = dict()
+        object_ids_by_item: Dict[str, FrozenSet[ProteusID]] = dict()
 
         # Iterate over the project objects
         # NOTE: Iterating using ids to make it more readable
@@ -170,16 +190,16 @@ class GlossaryHandler(ProteusComponent):
 
             # Check if the object is a glossary item
             if self._is_glossary_item(object):
-                self._add_glossary_item(object)
+                self._add_glossary_item(object, items_descriptions, object_ids_by_item)
 
-        # Setup the pattern
-        self._setup_pattern()
+        # Setup the pattern and replace the state
+        self._setup_state(items_descriptions, object_ids_by_item)
 
     # --------------------------------------------------------------------------
     # Method: update_on_add_object
     # Description: It adds a glossary item to the glossary.
     # Date: 09/01/2024
-    # Version: 0.1
+    # Version: 0.2
     # Author: José María Delgado Sánchez
     # --------------------------------------------------------------------------
     def update_on_add_object(self, object_id: ProteusID) -> None:
@@ -192,21 +212,23 @@ class GlossaryHandler(ProteusComponent):
 
         :param object_id: Object id to add
         """
+        items_descriptions, object_ids_by_item = self._copy_state()
+
         # Get the object
         object: Object = self._controller.get_element(object_id)
 
         # Check if the object is a glossary item
         if self._is_glossary_item(object):
-            self._add_glossary_item(object)
+            self._add_glossary_item(object, items_descriptions, object_ids_by_item)
 
-        # Setup the pattern
-        self._setup_pattern()
+        # Setup the pattern and replace the state
+        self._setup_state(items_descriptions, object_ids_by_item)
 
     # --------------------------------------------------------------------------
     # Method: update_on_delete_object
     # Description: It deletes a glossary item from the glossary.
     # Date: 09/01/2024
-    # Version: 0.1
+    # Version: 0.2
     # Author: José María Delgado Sánchez
     # --------------------------------------------------------------------------
     def update_on_delete_object(self, object_id: ProteusID) -> None:
@@ -217,16 +239,18 @@ class GlossaryHandler(ProteusComponent):
 
         :param object_id: Object id to delete
         """
-        self._delete_glossary_item(object_id)
+        items_descriptions, object_ids_by_item = self._copy_state()
+
+        self._delete_glossary_item(object_id, items_descriptions, object_ids_by_item)
 
-        # Setup the pattern
-        self._setup_pattern()
+        # Setup the pattern and replace the state
+        self._setup_state(items_descriptions, object_ids_by_item)
 
     # --------------------------------------------------------------------------
     # Method: update_on_modify_object
     # Description: It modifies stored glossary item.
     # Date: 09/01/2024
-    # Version: 0.1
+    # Version: 0.2
     # Author: José María Delgado Sánchez
     # --------------------------------------------------------------------------
     def update_on_modify_object(self, object_id: ProteusID) -> None:
@@ -239,18 +263,90 @@ class GlossaryHandler(ProteusComponent):
 
         :param object_id: Object id to modify
         """
+        items_descriptions, object_ids_by_item = self._copy_state()
+
+        self._update_glossary_item(object_id, items_descriptions, object_ids_by_item)
+
+        # Setup the pattern and replace the state
+        self._setup_state(items_descriptions, object_ids_by_item)
+
+    # --------------------------------------------------------------------------
+    # Method: update_on_modify_objects
+    # Description: It modifies several stored glossary items.
+    # Date: 16/10/2026
+    # Version: 0.1
+    # Author: José María Delgado Sánchez
+    # --------------------------------------------------------------------------
+    def update_on_modify_objects(self, object_ids: List[ProteusID]) -> None:
+        """
+        It modifies several glossary items from the glossary (bulk
+        updates), see update_on_modify_object. The pattern is set up once.
+
+        Triggered by: ModifyObjectsEvent
+
+        :param object_ids: Ids of the modified objects
+        """
+        items_descriptions, object_ids_by_item = self._copy_state()
+
+        for object_id in object_ids:
+            self._update_glossary_item(
+                object_id, items_descriptions, object_ids_by_item
+            )
+
+        # Setup the pattern and replace the state
+        self._setup_state(items_descriptions, object_ids_by_item)
+
+    # --------------------------------------------------------------------------
+    # Method: _update_glossary_item
+    # Description: It updates a glossary item from the current object.
+    # Date: 16/10/2026
+    # Version: 0.1
+    # Author: José María Delgado Sánchez
+    # --------------------------------------------------------------------------
+    def _update_glossary_item(
+        self,
+        object_id: ProteusID,
+        items_descriptions: Dict[ProteusID, str],
+        object_ids_by_item: Dict[str, FrozenSet[ProteusID]],
+    ) -> None:
+        """
+        It deletes the glossary item of the given object, if exists, and
+        adds it again if the object is a glossary item.
+
+        :param object_id: Object id to update
+        :param items_descriptions: Descriptions by id to update
+        :param object_ids_by_item: Ids by item name to update
+        """
         # Delete the glossary item if exists
-        self._delete_glossary_item(object_id)
+        self._delete_glossary_item(object_id, items_descriptions, object_ids_by_item)
 
         # Get the object
         object: Object = self._controller.get_element(object_id)
 
         # Check if the object is a glossary item
         if self._is_glossary_item(object):
-            self._add_glossary_item(object)
+            self._add_glossary_item(object, items_descriptions, object_ids_by_item)
 
-        # Setup the pattern
-        self._setup_pattern()
+    # --------------------------------------------------------------------------
+    # Method: _copy_state
+    # Description: It copies the glossary items of the current state.
+    # Date: 16/10/2026
+    # Version: 0.1
+    # Author: José María Delgado Sánchez
+    # --------------------------------------------------------------------------
+    def _copy_state(
+        self,
+    ) -> tuple[Dict[ProteusID, str], Dict[str, FrozenSet[ProteusID]]]:
+        """
+        It returns a copy of the glossary items descriptions and ids of the
+        current state, so they can be modified without affecting a render
+        in progress. Ids sets are frozen, they are replaced instead of
+        modified.
+        """
+        return (
+            dict(GlossaryHandler.state.items_descriptions),
+            dict(GlossaryHandler.state.object_ids_by_item),
+        )
 
     # --------------------------------------------------------------------------
     # Method: _is_glossary_item
@@ -280,10 +376,15 @@ class GlossaryHandler(ProteusComponent):
     # Method: _add_glossary_item
     # Description: It adds a glossary item to the glossary.
     # Date: 09/01/2024
-    # Version: 0.1
+    # Version: 0.2
     # Author: José María Delgado Sánchez
     # --------------------------------------------------------------------------
-    def _add_glossary_item(self, object: Object) -> None:
+    def _add_glossary_item(
+        self,
+        object: Object,
+        items_descriptions: Dict[ProteusID, str],
+        object_ids_by_item: Dict[str, FrozenSet[ProteusID]],
+    ) -> None:
         """
         It adds a glossary item to the glossary. The description is stored
         by object id, previously converted from markdown to plaintext. The item
@@ -293,6 +394,8 @@ class GlossaryHandler(ProteusComponent):
         Glossary items names are stripped and converted to lowercase.
 
         :param object: Object to add
+        :param items_descriptions: Descriptions by id to update
+        :param object_ids_by_item: Ids by item name to update
         """
         # Get items ----------------------------------
 
@@ -340,86 +443,105 @@ class GlossaryHandler(ProteusComponent):
         for item in glossary_items:
             if item != "":
                 # Store the description by id
-                GlossaryHandler.items_descriptions[object.id] = description
+                items_descriptions[object.id] = description
 
                 # Store the id by item
                 lowercased_item = item.lower()
-                id_list: MutableSet[ProteusID] = GlossaryHandler.object_ids_by_item.get(
-                    lowercased_item, set()
-                )
-                id_list.add(object.id)
-                GlossaryHandler.object_ids_by_item[lowercased_item] = id_list
+                object_ids_by_item[lowercased_item] = object_ids_by_item.get(
+                    lowercased_item, frozenset()
+                ) | {object.id}
 
     # --------------------------------------------------------------------------
     # Method: _delete_glossary_item
     # Description: It deletes a glossary item from the glossary.
     # Date: 09/01/2024
-    # Version: 0.1
+    # Version: 0.2
     # Author: José María Delgado Sánchez
     # --------------------------------------------------------------------------
-    def _delete_glossary_item(self, object_id: ProteusID) -> None:
+    def _delete_glossary_item(
+        self,
+        object_id: ProteusID,
+        items_descriptions: Dict[ProteusID, str],
+        object_ids_by_item: Dict[str, FrozenSet[ProteusID]],
+    ) -> None:
         """
-        Delete a glossary item from the class attributed. It removes the
+        Delete a glossary item from the given glossary items. It removes the
         description by id. It also removes the id from the item list.
-        When an item list is empty, it is removed from the class attribute.
+        When an item list is empty, the item is removed.
 
         :param object_id: Object id to delete
+        :param items_descriptions: Descriptions by id to update
+        :param object_ids_by_item: Ids by item name to update
         """
         # Check if the description is in the stored descriptions by id
-        if object_id in GlossaryHandler.items_descriptions:
-            GlossaryHandler.items_descriptions.pop(object_id)
+        if object_id in items_descriptions:
+            items_descriptions.pop(object_id)
 
         # Check if the item is in the stored ids by item
-        items_with_empty_ids: List[str] = []
-        for item, ids in GlossaryHandler.object_ids_by_item.items():
-            if object_id in ids:
-                ids.remove(object_id)
-
-            if len(ids) == 0:
-                items_with_empty_ids.append(item)
+        for item, ids in list(object_ids_by_item.items()):
+            if object_id not in ids:
+                continue
 
-        # Remove the items with empty ids
-        for item in items_with_empty_ids:
-            GlossaryHandler.object_ids_by_item.pop(item)
+            # Remove the items with empty ids
+            if len(ids) == 1:
+                object_ids_by_item.pop(item)
+            else:
+                object_ids_by_item[item] = ids - {object_id}
 
-    def _setup_pattern(self) -> None:
+    # --------------------------------------------------------------------------
+    # Method: _setup_state
+    # Description: It sets up the regex pattern and replaces the state.
+    # Date: 16/10/2026
+    # Version: 0.1
+    # Author: José María Delgado Sánchez
+    # --------------------------------------------------------------------------
+    def _setup_state(
+        self,
+        items_descriptions: Dict[ProteusID, str],
+        object_ids_by_item: Dict[str, FrozenSet[ProteusID]],
+    ) -> None:
         """
-        It sets up the regex pattern to highlight the glossary items.
+        It sets up the regex pattern to highlight the given glossary items
+        and replaces the state with them in a single assignment.
 
         The pattern is created from a list of glossary items. The list is
         is converted to a TrieRegEx object and then to a regex pattern.
+
+        :param items_descriptions: Descriptions by id
+        :param object_ids_by_item: Ids by item name
         """
-        old_pattern = GlossaryHandler.pattern
+        pattern: re.Pattern | None = None
         try:
-            GlossaryHandler.pattern = None
-
             # Get the glossary items
-            glossary_items: List[str] = list(GlossaryHandler.object_ids_by_item.keys())
+            glossary_items: List[str] = list(object_ids_by_item.keys())
 
-            if len(glossary_items) == 0:
-                return
+            if len(glossary_items) > 0:
+                # Order the items by length so items that contain other items are processed first
+                glossary_items = sorted(glossary_items, key=len, reverse=True)
 
-            # Order the items by length so items that contain other items are processed first
-            glossary_items = sorted(glossary_items, key=len, reverse=True)
+                # Create the TrieRegEx object
+                trie = TRE(*glossary_items)
 
-            # Create the TrieRegEx object
-            trie = TRE(*glossary_items)
-
-            # Create the pattern
-            GlossaryHandler.pattern = re.compile(
-                rf"\b(?<!-){trie.regex()}(?!-)\b", re.IGNORECASE
-            )
+                # Create the pattern
+                pattern = re.compile(
+                    rf"\b(?<!-){trie.regex()}(?!-)\b", re.IGNORECASE
+                )
         except Exception as e:
             log.error(
                 f"There was an error while updating the glossary regex pattern: {e}"
             )
-            GlossaryHandler.pattern = old_pattern
+            # Keep the previous glossary
+            return
+
+        GlossaryHandler.state = GlossaryState(
+            items_descriptions, object_ids_by_item, pattern
+        )
 
     # --------------------------------------------------------------------------
     # Method: highlight_glossary_items (static)
     # Description: It highlights the glossary items in the text.
     # Date: 10/01/2024
-    # Version: 0.1
+    # Version: 0.2
     # Author: José María Delgado Sánchez
     # --------------------------------------------------------------------------
     @staticmethod
@@ -432,9 +554,11 @@ class GlossaryHandler(ProteusComponent):
         code block are not highlighted, this is done to prevent HTML
         loops errors when the tooltip is added.
 
-        Method used in the XSLT stylesheet.
+        Method used in the XSLT stylesheet. It is called from the render
+        thread, the state is read once so it is consistent during the call.
         """
         input_text = text
+        state: GlossaryState = GlossaryHandler.state
 
         try:
 
@@ -457,9 +581,9 @@ class GlossaryHandler(ProteusComponent):
                 item = match_text.lower()
 
                 # Get ids linked to the item
-                item_linked_ids = GlossaryHandler.object_ids_by_item[item]
+                item_linked_ids = state.object_ids_by_item[item]
                 descriptions: List[str] = [
-                    GlossaryHandler.items_descriptions[item_id]
+                    state.items_descriptions[item_id]
                     for item_id in item_linked_ids
                 ]
 
@@ -476,11 +600,11 @@ class GlossaryHandler(ProteusComponent):
 
                 return f'<a href="#{item_id}" onclick="selectAndNavigate(`{item_id}`, event)" title="{escape(description_html)}">{match_text}</a>'
 
-            if GlossaryHandler.pattern is None:
+            if state.pattern is None:
                 return text
 
             # Replace the items with the decorated items
-            text = re.sub(GlossaryHandler.pattern, highlight_item, text)
+            text = re.sub(state.pattern, highlight_item, text)
         except Exception as e:
             log.error(
                 f"There was an error while highlighting the glossary items in text {input_text}. Error: {e}"
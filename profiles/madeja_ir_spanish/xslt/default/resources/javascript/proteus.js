@@ -105,8 +105,8 @@ function selectAndNavigate(id, event) {
 // NOTE: This function is used to interact with Python code, if you are
 //       using this script outside PROTEUS application, you can remove
 //       this function to prevent errors.
-function suscribeProteusId() {
-    const elements = document.querySelectorAll('*[data-proteus-id]');
+function suscribeProteusId(root = document) {
+    const elements = querySelectorAllWithRoot(root, '*[data-proteus-id]');
     elements.forEach(element => {
 
         // propertiesDialog on double click event
@@ -155,8 +155,8 @@ function onTreeObjectSelected(id) {
 // Version     : 0.1
 // Author      : José María Delgado Sánchez
 // -----------------------------------------------------------------------
-function removeIdsInsideSymbolicLink() {
-    const symbolicLinkDivs = document.querySelectorAll('.symbolic-link');
+function removeIdsInsideSymbolicLink(root = document) {
+    const symbolicLinkDivs = querySelectorAllWithRoot(root, '.symbolic-link');
     symbolicLinkDivs.forEach(symbolicLinkDiv => {
         const elementsBelow = symbolicLinkDiv.querySelectorAll('*[id]');
         elementsBelow.forEach(element => {
@@ -172,9 +172,9 @@ function removeIdsInsideSymbolicLink() {
 // Version     : 0.1
 // Author      : José María Delgado Sánchez
 // -----------------------------------------------------------------------
-function traceabilityMatrixButtonsSetup() {
-    const reduce_font_buttons = document.querySelectorAll('button.reduce_font');
-    const increase_font_buttons = document.querySelectorAll('button.increase_font');
+function traceabilityMatrixButtonsSetup(root = document) {
+    const reduce_font_buttons = root.querySelectorAll('button.reduce_font');
+    const increase_font_buttons = root.querySelectorAll('button.increase_font');
 
     log('Setting up traceability matrix buttons')
 
@@ -220,6 +220,61 @@ function update_font_size(parent_table, size) {
 }
 
 
+// -----------------------------------------------------------------------
+// Function    : replaceProteusFragment
+// Description : Replace the element with the given Id with the given
+//               HTML fragment and subscribe the new elements to the
+//               necessary events. Returns false if the element cannot be
+//               replaced, so PROTEUS reloads the whole document.
+// Date        : 16/10/2026
+// Version     : 0.1
+// Author      : José María Delgado Sánchez
+// -----------------------------------------------------------------------
+// NOTE: This function is used to interact with Python code, if you are
+//       using this script outside PROTEUS application, you can remove
+//       this function to prevent errors.
+function replaceProteusFragment(id, html) {
+    const element = document.getElementById(id);
+    if (element == null) {
+        log("Fragment error, element with Id " + id + " not found.");
+        return false;
+    }
+
+    const template = document.createElement('template');
+    template.innerHTML = html.trim();
+
+    // Scripts are not executed when inserted this way
+    const fragment = template.content;
+    if (fragment.children.length != 1 || fragment.querySelector('script') != null) {
+        log("Fragment error, fragment for Id " + id + " cannot be inserted.");
+        return false;
+    }
+
+    const newElement = fragment.firstElementChild;
+    if (newElement.tagName != element.tagName) {
+        log("Fragment error, fragment for Id " + id + " does not match the element.");
+        return false;
+    }
+
+    element.replaceWith(newElement);
+
+    removeIdsInsideSymbolicLink(newElement);
+    suscribeProteusId(newElement);
+    traceabilityMatrixButtonsSetup(newElement);
+
+    return true;
+}
+
+// Helper function to select the elements below root including root
+function querySelectorAllWithRoot(root, selector) {
+    const elements = Array.from(root.querySelectorAll(selector));
+    if (root !== document && root.matches(selector)) {
+        elements.unshift(root);
+    }
+    return elements;
+}
+
+
 // =========================================================================
 // Execute code on DOMContentLoaded event
 // =========================================================================
@@ -39,6 +39,11 @@ PROTEUS_MAX_LOG_FILES  = 7
 
 PROTEUS_TEMP_DIR    = PROTEUS_APP_PATH / '.proteus'
 
+# Project snapshots directory (inside the temporal file directory)
+
+PROTEUS_SNAPSHOTS_DIR    = PROTEUS_TEMP_DIR / 'snapshots'
+PROTEUS_MAX_SNAPSHOTS    = 20
+
 # --------------------------------------------------------------------------
 # Argument parser
 # --------------------------------------------------------------------------
@@ -16,14 +16,18 @@ import sys
 import logging
 import traceback
 import shutil
-from typing import Dict, Callable
+from typing import Dict, Callable, List
 
 # --------------------------------------------------------------------------
 # Third party imports
 # --------------------------------------------------------------------------
 
 from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEngineSettings
+from PyQt6.QtWebEngineCore import (
+    QWebEngineProfile,
+    QWebEngineSettings,
+    QWebEngineUrlSchemeHandler,
+)
 
 # --------------------------------------------------------------------------
 # Project specific imports
@@ -40,6 +44,10 @@ from proteus.application.clipboard import Clipboard
 from proteus.controller.command_stack import Controller
 from proteus.views.components.main_window import MainWindow
 from proteus.views.components.dialogs.base_dialogs import MessageBox
+from proteus.views.url_scheme_handlers import (
+    register_url_schemes,
+    install_url_scheme_handlers,
+)
 
 # Module configuration
 log = logging.getLogger(__name__)  # Logger
@@ -70,6 +78,7 @@ class ProteusApplication:
         # PyQt6 application and main window
         self.app: QApplication = None
         self.main_window: MainWindow = None
+        self.url_scheme_handlers: List[QWebEngineUrlSchemeHandler] = []
 
         # Optional params
         self.project_path = project_path
@@ -84,6 +93,10 @@ class ProteusApplication:
         log.info(f"Home directory: {Path.home()}")
         log.info(f"{Path(__file__) = }")
 
+        # Register the document views URL schemes, it must be done
+        # before the application instance is created.
+        register_url_schemes()
+
         # Create the application instance and set the excepthook
         # to handle uncaught exceptions in every thread.
         sys.excepthook = self.excepthook
@@ -128,7 +141,7 @@ class ProteusApplication:
         Initial configuration that must be done before the app start.
 
         It handles initialization of translator, icons, plugins,
-        request interceptor and stylesheet
+        request interceptor, stylesheet and URL scheme handlers
         """
         # App settings resources ------------------------------
         self.translator.set_language(self.config.app_settings.language)
@@ -171,6 +184,10 @@ class ProteusApplication:
             QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True
         )
 
+        # Serve the rendered views, assets and templates on demand
+        # NOTE: References are kept to avoid garbage collection
+        self.url_scheme_handlers = install_url_scheme_handlers(profile)
+
     # --------------------------------------------------------------------------
     # Method: load_plugin_components
     # Description: Load the ProteusComponents from the plugins.
@@ -10,3 +10,6 @@
 RESOURCES_SEARCH_PATH = "resources"
 TEMPLATE_DUMMY_SEARCH_PATH = "templates"
 ASSETS_DUMMY_SEARCH_PATH = "assets"
+
+# QtWebEngine URL scheme of the rendered views
+RENDER_SCHEME = "proteus-render"
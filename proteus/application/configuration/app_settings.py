@@ -52,6 +52,9 @@ SETTING_OPEN_PROJECT_ON_STARTUP: str = "open_project_on_startup"
 # Special advanced settings
 SETTING_XSLT_DEBUG_MODE: str = "xslt_debug_mode"
 SETTING_DEVELOPER_FEATURES: str = "developer_features"
+SETTING_LOADING_THREADS: str = "loading_threads"
+SETTING_SNAPSHOT_CACHE: str = "snapshot_cache"
+SETTING_RENDER_CACHE_SIZE: str = "render_cache_size"
 
 # User session data
 SESSION: str = "session"
@@ -91,6 +94,9 @@ class AppSettings:
     # These settings must be set manually in the configuration file
     xslt_debug_mode: bool = False
     developer_features: bool = False
+    loading_threads: int = 4  # 0 or 1 to load projects serially
+    snapshot_cache: bool = True
+    render_cache_size: int = 64  # MB, 0 to disable the render cache
 
     # --------------------------------------------------------------------------
     # Method: load
@@ -264,6 +270,29 @@ class AppSettings:
         # Raw model editor ------------------------
         self.developer_features = settings.getboolean(SETTING_DEVELOPER_FEATURES, False)
 
+        # Project loading threads ------------------------
+        try:
+            self.loading_threads = max(settings.getint(SETTING_LOADING_THREADS, 4), 0)
+        except ValueError:
+            log.error(
+                f"Invalid '{SETTING_LOADING_THREADS}' value in {self.settings_file_path}. Using default value..."
+            )
+            self.loading_threads = 4
+
+        # Project snapshot cache ------------------------
+        self.snapshot_cache = settings.getboolean(SETTING_SNAPSHOT_CACHE, True)
+
+        # Render cache size ------------------------
+        try:
+            self.render_cache_size = max(
+                settings.getint(SETTING_RENDER_CACHE_SIZE, 64), 0
+            )
+        except ValueError:
+            log.error(
+                f"Invalid '{SETTING_RENDER_CACHE_SIZE}' value in {self.settings_file_path}. Using default value..."
+            )
+            self.render_cache_size = 64
+
         log.info(f"Loaded app user settings from {self.settings_file_path}.")
         log.info(f"{self.language = }")
         log.info(f"{self.default_view = }")
@@ -273,6 +302,9 @@ class AppSettings:
         log.info(f"{self.open_project_on_startup = }")
         log.info(f"{self.xslt_debug_mode = }")
         log.info(f"{self.developer_features = }")
+        log.info(f"{self.loading_threads = }")
+        log.info(f"{self.snapshot_cache = }")
+        log.info(f"{self.render_cache_size = }")
 
     # --------------------------------------------------------------------------
     # Method: _validate_profile_path
@@ -12,7 +12,7 @@
 
 from threading import Lock
 import logging
-from typing import Callable
+from typing import Callable, List
 from abc import ABC, abstractmethod
 
 # --------------------------------------------------------------------------
@@ -332,6 +332,50 @@ class ModifyObjectEvent(ProteusEvent):
         self.signal.connect(method)
 
 
+# --------------------------------------------------------------------------
+# Class: ModifyObjectsEvent
+# Description: Class for the modify objects event in the PROTEUS application.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+class ModifyObjectsEvent(ProteusEvent):
+    """
+    Event to handle the modification of several objects at once in the
+    PROTEUS application (bulk updates). It is notified once instead of a
+    ModifyObjectEvent for each object.
+    """
+
+    signal = pyqtSignal([list, bool])
+
+    def notify(self, object_ids: List[ProteusID], update_view: bool = True) -> None:
+        """
+        Notify the event that several objects have been modified. Receives
+        the ids of the objects that have been modified and a boolean
+        indicating whether the view should be updated.
+
+        :param object_ids: The ids of the objects that have been modified.
+        :param update_view: Whether the view should be updated.
+        """
+        log.debug(
+            f"Emitting MODIFY OBJECTS EVENT signal... | object_ids: {object_ids} update_view: {update_view}"
+        )
+
+        assert object_ids is not None, "Object ids cannot be None"
+
+        self.signal.emit(list(object_ids), update_view)
+
+    def connect(self, method: Callable[[List[ProteusID], bool], None]) -> None:
+        """
+        Connect a method to the modify objects event. The method should take
+        two arguments: the ids of the objects that have been modified and a
+        boolean indicating whether the view should be updated.
+
+        :param method: The method to connect to the event.
+        """
+        self.signal.connect(method)
+
+
 # --------------------------------------------------------------------------
 # Class: AddObjectEvent
 # Description: Class for the add object event in the PROTEUS application.
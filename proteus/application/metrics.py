@@ -43,6 +43,9 @@ class Metrics:
     _html_load_time_start: float = 0
     html_load_time: int = 0  # QWebEngineView load time (ms)
 
+    save_time: int = None  # Project save time (ms), None until first save
+    save_files_written: int = 0  # Files written in the last save
+
     # --------------------------------------------------------------------------
     # HTML generation time methods
     # --------------------------------------------------------------------------
@@ -52,16 +55,54 @@ class Metrics:
         """
         Decorator to measure the time it takes to generate the HTML.
 
-        It is meant to be used with get_html_view_path() method in the controller.
+        It is meant to be used with get_html_view() method in the controller.
+        """
+
+        def wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+            result = func(*args, **kwargs)
+            end_time = time.perf_counter()
+            Metrics.set_html_generation_time(int((end_time - start_time) * 1000))
+            return result
+
+        return wrapper
+
+    @staticmethod
+    def set_html_generation_time(generation_time: int):
+        """
+        Set the time it takes to generate the HTML (ms).
+
+        It is meant to be used when the HTML is generated outside the GUI
+        thread, the time is measured by the render worker.
+        """
+        Metrics.html_generation_time = generation_time
+        UpdateMetricsEvent().notify()
+        log.debug(f"HTML generation time: {Metrics.html_generation_time} ms")
+
+    # --------------------------------------------------------------------------
+    # Save time methods
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def save_time_decorator(func: callable):
+        """
+        Decorator to measure the time it takes to save the project and the
+        number of files written.
+
+        It is meant to be used with save_project() method in the project service,
+        which returns the number of files written.
         """
 
         def wrapper(*args, **kwargs):
             start_time = time.perf_counter()
             result = func(*args, **kwargs)
             end_time = time.perf_counter()
-            Metrics.html_generation_time = int((end_time - start_time) * 1000)
+            Metrics.save_time = int((end_time - start_time) * 1000)
+            Metrics.save_files_written = result
             UpdateMetricsEvent().notify()
-            log.debug(f"HTML generation time: {Metrics.html_generation_time} ms")
+            log.debug(
+                f"Save time: {Metrics.save_time} ms, files written: {Metrics.save_files_written}"
+            )
             return result
 
         return wrapper
@@ -53,6 +53,9 @@ class PluginInterface:
         :param register_qwebchannel_class: Function to register QWebChannel classes.
         :param register_proteus_component: Function to register ProteusComponent classes.
         :param register_xslt_class_and_methods: Function to register XSLT methods from a class.
+
+        XSLT functions and methods are called from the render thread. They
+        must only read the model and must not access widgets or notify events.
         """
 
 
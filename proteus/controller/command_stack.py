@@ -10,7 +10,7 @@
 # Standard library imports
 # --------------------------------------------------------------------------
 
-from typing import List, Set, Dict
+from typing import List, Set, Dict, Callable
 from pathlib import Path
 import logging
 
@@ -18,6 +18,7 @@ import logging
 # Third-party library imports
 # --------------------------------------------------------------------------
 
+from PyQt6.QtCore import QThreadPool, QTimer
 from PyQt6.QtGui import QUndoStack, QUndoCommand
 import lxml.etree as ET
 
@@ -25,11 +26,12 @@ import lxml.etree as ET
 # Project specific imports (starting from root)
 # --------------------------------------------------------------------------
 
-from proteus import PROTEUS_TEMP_DIR
-from proteus.model import ProteusID, ProteusClassTag, ASSETS_REPOSITORY
-from proteus.application import ASSETS_DUMMY_SEARCH_PATH, TEMPLATE_DUMMY_SEARCH_PATH
+from proteus.model import ProteusID, ProteusClassTag
 from proteus.application.metrics import Metrics
 from proteus.controller.commands.update_properties import UpdatePropertiesCommand
+from proteus.controller.commands.update_properties_bulk import (
+    UpdatePropertiesBulkCommand,
+)
 from proteus.controller.commands.clone_archetype_object import (
     CloneArchetypeObjectCommand,
 )
@@ -43,11 +45,13 @@ from proteus.controller.commands.change_object_position import (
     ChangeObjectPositionCommand,
 )
 from proteus.controller.commands.sort_children import SortChildrenCommand
+from proteus.controller.render_worker import RenderWorker
 from proteus.services.project_service import ProjectService
 from proteus.services.archetype_service import ArchetypeService
 from proteus.services.render_service import RenderService
 from proteus.application.state.manager import StateManager
 from proteus.application.utils.decorators import proteus_action
+from proteus.model.abstract_object import ProteusState
 from proteus.model.object import Object
 from proteus.model.project import Project
 from proteus.model.properties import Property
@@ -118,6 +122,20 @@ class Controller:
         self.stack.cleanChanged.connect(StackChangedEvent().notify)
         self.stack.indexChanged.connect(self.check_unsaved_changes)
 
+        # Render thread pool -------------------
+        # NOTE: Renders run one at a time, XSLT transformations and the
+        #       extension functions they call are not run concurrently.
+        self._render_pool: QThreadPool = QThreadPool()
+        self._render_pool.setMaxThreadCount(1)
+        self._render_generation: int = 0
+        # Function that repeats the latest render request, None when there
+        # is no render in progress
+        self._last_render_request: Callable[[], int] | None = None
+
+        # Model version, increased on every model modification. It is used
+        # to invalidate the rendered views cache.
+        self._model_version: int = 0
+
     # ======================================================================
     # Command stack methods
     # ======================================================================
@@ -135,8 +153,54 @@ class Controller:
 
         :param command: The command to push to the command stack.
         """
+        self._model_changed()
         self.stack.push(command)
 
+    # ----------------------------------------------------------------------
+    # Method     : _model_changed
+    # Description: Invalidate the data derived from the model.
+    # Date       : 16/10/2026
+    # Version    : 0.3
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _model_changed(self) -> None:
+        """
+        Increase the model version and clear the rendered views cache. Must
+        be called before the model is modified, so views requested while
+        the modification is notified are not served from the cache.
+
+        Renders in progress are interrupted (see _interrupt_renders).
+        """
+        self._model_version += 1
+        self._render_service.clear_cache()
+        self._interrupt_renders()
+
+    # ----------------------------------------------------------------------
+    # Method     : _interrupt_renders
+    # Description: Cancel the renders in progress and repeat the latest one.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _interrupt_renders(self) -> None:
+        """
+        Cancel the renders in progress before the model is written, they
+        could read a half-modified model. The latest request is repeated
+        once the write is done, unless a new request supersedes it. Not
+        every write refreshes the views (e.g. saving the project).
+        """
+        request: Callable[[], int] | None = self._last_render_request
+        self.cancel_html_view_requests()
+
+        if request is not None:
+            generation: int = self._render_generation
+
+            def repeat_request():
+                if self.is_current_render(generation):
+                    request()
+
+            QTimer.singleShot(0, repeat_request)
+
     # ----------------------------------------------------------------------
     # Method     : undo
     # Description: Undo the last command
@@ -150,6 +214,7 @@ class Controller:
         Undo the last command. Only works if the command is undoable.
         """
         log.info(f"Undoing last command [ {self.stack.undoText()} ]")
+        self._model_changed()
         self.stack.undo()
 
     # ----------------------------------------------------------------------
@@ -166,6 +231,7 @@ class Controller:
         undoable/redoable.
         """
         log.info(f"Redoing last command [ {self.stack.redoText()} ]")
+        self._model_changed()
         self.stack.redo()
 
     # ======================================================================
@@ -221,6 +287,56 @@ class Controller:
             )
         )
 
+    # ----------------------------------------------------------------------
+    # Method     : update_properties_bulk
+    # Description: Update the properties of several elements given their
+    #              ids. It pushes a single command to the command stack.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @proteus_action
+    def update_properties_bulk(
+        self, new_properties: Dict[ProteusID, List[Property]]
+    ) -> None:
+        """
+        Update the properties (and traces) of several elements given their
+        ids. It pushes a single command to the command stack, so the update
+        is undone at once.
+
+        Notify the frontend components once when the command is executed
+        passing the elements ids as a parameter. MODIFY_OBJECTS event is
+        triggered.
+
+        :param new_properties: The new properties of each element
+        {key: element id, value: list of properties}.
+        """
+        log.info(
+            f"Updating properties of {len(new_properties)} elements. New properties: {new_properties}"
+        )
+
+        # Check new_properties is a dictionary
+        assert isinstance(
+            new_properties, dict
+        ), f"New properties must be a dictionary. New properties: {new_properties}"
+
+        for element_id, properties in new_properties.items():
+            # Check element_id is not None
+            assert element_id is not None, "Element id can not be None"
+
+            # Check properties is a list of Property
+            assert isinstance(properties, list) and all(
+                isinstance(property, Property) for property in properties
+            ), f"New properties of element {element_id} must be a list of Property. New properties: {properties}"
+
+        # Push the command to the command stack
+        self._push(
+            UpdatePropertiesBulkCommand(
+                new_properties=new_properties,
+                project_service=self._project_service,
+            )
+        )
+
     # ----------------------------------------------------------------------
     # Method     : clone_object
     # Description: Clone an object given its id. It pushes the command to
@@ -451,6 +567,7 @@ class Controller:
             f"Changing position of document with id: {document_id} to {new_position}"
         )
         # Call ProjectService method
+        self._model_changed()
         self._project_service.change_object_position(
             document.id, self._project_service.project.id, new_position
         )
@@ -546,8 +663,12 @@ class Controller:
         log.info(f"Loading project from path: {project_path}")
 
         # Initialize the project service
+        self._model_changed()
         self._project_service = ProjectService()
 
+        # Do not repeat the renders of the previous project views
+        self.cancel_html_view_requests()
+
         # Load the project
         try:
             self._project_service.load_project(project_path)
@@ -643,7 +764,7 @@ class Controller:
     # Description: Save the current project state including all the children
     #              objects and documents.
     # Date       : 01/06/2023
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     @proteus_action
@@ -651,8 +772,13 @@ class Controller:
         """
         Save the current project state including all the children objects
         and documents.
+
+        Saving does not change how the project is rendered, so the model
+        version and the rendered views cache are kept. Only the renders in
+        progress are interrupted while the project is written.
         """
         log.info("Saving current project")
+        self._interrupt_renders()
         self._project_service.save_project()
         # TODO: Refactor redo/undo commands to handle objects states in a way
         # that does not stores the previous state but calculates it from the
@@ -761,70 +887,413 @@ class Controller:
     # Description: Get the HTML view of the document given a XSLT template
     #              name.
     # Date       : 23/06/2023
-    # Version    : 0.1
+    # Version    : 0.3
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
-    def get_html_view(self, xslt_name: str = "default") -> str:
+    @Metrics.html_generation_time_decorator
+    def get_html_view(
+        self, xslt_name: str = "default", whole_project: bool = False
+    ) -> str:
         """
         Get the HTML string view of the project XML processed with the given
         XSLT template.
 
+        By default, only the current document and the objects referenced by
+        its traces are included in the XML. If whole_project is True or there
+        is no current document, the whole project XML is generated.
+
         XSLT files are located in the xslt folder, defined in the config file.
 
-        :param document_id: The id of the document to get the view.
+        NOTE: The HTML is generated in the calling thread. Use the method
+        request_html_view to generate it outside the GUI thread.
+
+        :param xslt_name: The name of the xslt file to use.
+        :param whole_project: Whether to generate the whole project XML.
+        :return: The HTML string of the view.
+        """
+        document_id: ProteusID = None
+        if not whole_project:
+            document_id = StateManager().get_current_document()
+
+        return self._render_html_view(xslt_name, document_id, self._model_version)
+
+    # ----------------------------------------------------------------------
+    # Method     : _render_html_view
+    # Description: Render the HTML view of the given document.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _render_html_view(
+        self, xslt_name: str, document_id: ProteusID, model_version: int
+    ) -> str:
+        """
+        Render the HTML string view of the given document using the given
+        XSLT template. If the document id is None, the whole project XML is
+        rendered.
+
+        The rendered view is cached by document, template, language and
+        model version. If the view is cached, it is returned without
+        rendering it again.
+
+        It does not read the application state, so it can be called from
+        the render worker thread.
+
         :param xslt_name: The name of the xslt file to use.
+        :param document_id: The id of the document to render.
+        :param model_version: The model version the view is requested for.
         :return: The HTML string of the view.
         """
+        html_string: str = self._render_service.get_cached_render(
+            document_id, xslt_name, model_version
+        )
+        if html_string is not None:
+            log.info(f"Getting {xslt_name} render of project from cache.")
+            return html_string
+
         log.info(f"Getting {xslt_name} render of project.")
 
         # Get the document xml
-        xml: ET.Element = self._project_service.generate_project_xml()
-
-        html_string: str = self._render_service.render(xml, xslt_name)
+        xml: ET.Element
+        if document_id is None:
+            xml = self._project_service.generate_project_xml()
+        else:
+            xml = self._project_service.generate_document_xml(document_id)
+
+        html_string = self._render_service.render(xml, xslt_name)
+
+        # Do not cache renders of a model modified while rendering
+        if model_version == self._model_version:
+            self._render_service.cache_render(
+                document_id, xslt_name, model_version, html_string
+            )
 
         return html_string
 
     # ----------------------------------------------------------------------
-    # Method     : get_html_view_path
-    # Description: Get the HTML view of the document given a XSLT template
-    #              name.
-    # Date       : 01/10/2024
+    # Method     : request_html_view
+    # Description: Request the HTML view of the current document to be
+    #              generated outside the GUI thread.
+    # Date       : 16/10/2026
     # Version    : 0.1
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
-    @Metrics.html_generation_time_decorator
-    def get_html_view_path(self, xslt_name: str = "default") -> str:
+    def request_html_view(
+        self,
+        xslt_name: str,
+        on_finished: Callable[[str], None],
+        on_failed: Callable[[str], None] = None,
+    ) -> int:
         """
-        Generate a temporary HTML file that contains the view of the project
-        XML processed with the given XSLT template.
+        Request the HTML view of the current document processed with the
+        given XSLT template. The view is generated in the render thread
+        pool and the HTML string is passed to the on_finished callback,
+        which is called in the GUI thread.
 
-        XSLT files are located in the xslt folder, defined in the config file.
+        The HTML keeps the dummy search paths (assets and templates), they
+        are resolved by the views URL scheme handlers.
+
+        Every request supersedes the previous ones. Pending requests are
+        cancelled and the results of in-flight renders are discarded, so
+        the callbacks are only called for the latest request.
+
+        Renders run one at a time. XSLT extension functions registered by
+        plugins are called from the render thread, they must only read the
+        model and must not access widgets or notify events.
 
-        :param document_id: The id of the document to get the view.
         :param xslt_name: The name of the xslt file to use.
-        :return: The path of the generated HTML file.
+        :param on_finished: Callback called with the HTML string.
+        :param on_failed: Callback called with the error message.
+        :return: The generation number of the request.
+        """
+        # Supersede pending and in-flight renders
+        self.cancel_html_view_requests()
+        self._last_render_request = lambda: self.request_html_view(
+            xslt_name, on_finished, on_failed
+        )
+
+        # Capture the application state in the GUI thread
+        worker = RenderWorker(
+            generation=self._render_generation,
+            xslt_name=xslt_name,
+            document_id=StateManager().get_current_document(),
+            model_version=self._model_version,
+            render=self._render_html_view,
+            is_current=self.is_current_render,
+        )
+        self._start_render_worker(worker, on_finished, on_failed)
+
+        return self._render_generation
+
+    # ----------------------------------------------------------------------
+    # Method     : can_update_html_fragments
+    # Description: Check if the current view can be updated rendering only
+    #              the given objects.
+    # Date       : 16/10/2026
+    # Version    : 0.2
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def can_update_html_fragments(
+        self, xslt_name: str, object_ids: List[ProteusID]
+    ) -> bool:
+        """
+        Check if the view of the current document can be updated rendering
+        only the given objects after modifying them, instead of rendering
+        the whole document.
+
+        It is not possible if the template does not support fragment
+        updates, the current document contains an object of a class listed
+        as full reload document class (traceability matrices, etc.) or any
+        of the objects:
+            - is not a non DEAD object of the current document (documents
+              are rendered along with the cover and the table of contents).
+            - is of a class listed as full reload class (sections, glossary
+              items, etc.).
+            - is a descendant of an object of a class listed as full reload
+              children class, since it is rendered by the template of its
+              ancestor (tables of children, etc.).
+            - is the target of a trace, since its sources render some of
+              its properties (name, code, symbolic links, etc.).
+
+        :param xslt_name: The name of the xslt file to use.
+        :param object_ids: The ids of the modified objects.
+        """
+        template: Template = self.get_template_by_name(xslt_name)
+        document_id: ProteusID = StateManager().get_current_document()
+
+        if (
+            not template.fragment_updates
+            or not object_ids
+            or document_id is None
+            or self._project_service is None
+        ):
+            return False
+
+        # Check the document does not contain objects that depend on the
+        # rest of the document
+        for class_name in template.full_reload_document_classes:
+            for object_id in self._project_service.classes_index.get(class_name, ()):
+                object = self._project_service._get_element_by_id(object_id)
+                if self._get_object_document_id(object) == document_id:
+                    return False
+
+        for object_id in object_ids:
+            object = self._project_service._get_element_by_id(object_id)
+
+            if (
+                not isinstance(object, Object)
+                or object.state == ProteusState.DEAD
+                or object.id == document_id
+                or self._get_object_document_id(object) != document_id
+            ):
+                return False
+
+            if not set(template.full_reload_classes).isdisjoint(object.classes):
+                return False
+
+            ancestor = object.parent
+            while isinstance(ancestor, Object):
+                if not set(template.full_reload_children_classes).isdisjoint(
+                    ancestor.classes
+                ):
+                    return False
+                ancestor = ancestor.parent
+
+            if self._project_service.traces_index.get(object_id):
+                return False
+
+        return True
+
+    # ----------------------------------------------------------------------
+    # Method     : _get_object_document_id
+    # Description: Get the id of the document that contains the object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _get_object_document_id(self, object: Object) -> ProteusID:
         """
-        html_string = self.get_html_view(xslt_name)
+        Get the id of the document that contains the given object, the
+        object id if it is a document.
 
-        # Replace the dummy search paths with the real paths
-        assets_dir = (
-            StateManager().current_project_path / ASSETS_REPOSITORY
-        ).as_posix()
-        xslt_dir = Config().profile_settings.xslt_directory.as_posix()
+        :param object: The object to check.
+        """
+        while isinstance(object.parent, Object):
+            object = object.parent
+
+        return object.id
+
+    # ----------------------------------------------------------------------
+    # Method     : request_html_fragments
+    # Description: Request the HTML fragments of the given objects to be
+    #              generated outside the GUI thread.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def request_html_fragments(
+        self,
+        xslt_name: str,
+        object_ids: List[ProteusID],
+        on_finished: Callable[[Dict[ProteusID, str] | None], None],
+        on_failed: Callable[[str], None] = None,
+    ) -> int:
+        """
+        Request the HTML fragments of the given objects of the current
+        document processed with the given XSLT template. Each fragment is
+        rendered by the archetype template of the object. The fragments
+        (None if any of them could not be rendered) are passed to the
+        on_finished callback, which is called in the GUI thread.
+
+        The request supersedes any previous render request, see
+        request_html_view.
 
-        html_string = html_string.replace(
-            f"{ASSETS_DUMMY_SEARCH_PATH}:///", f"file:///{assets_dir}/"
+        :param xslt_name: The name of the xslt file to use.
+        :param object_ids: The ids of the objects to render.
+        :param on_finished: Callback called with the fragments by object id.
+        :param on_failed: Callback called with the error message.
+        :return: The generation number of the request.
+        """
+        # Supersede pending and in-flight renders
+        self.cancel_html_view_requests()
+
+        object_ids = list(object_ids)
+        self._last_render_request = lambda: self.request_html_fragments(
+            xslt_name, object_ids, on_finished, on_failed
         )
-        html_string = html_string.replace(
-            f"{TEMPLATE_DUMMY_SEARCH_PATH}:///", f"file:///{xslt_dir}/"
+
+        # Capture the application state in the GUI thread
+        worker = RenderWorker(
+            generation=self._render_generation,
+            xslt_name=xslt_name,
+            document_id=StateManager().get_current_document(),
+            model_version=self._model_version,
+            render=lambda xslt_name, document_id, _: self._render_html_fragments(
+                xslt_name, document_id, object_ids
+            ),
+            is_current=self.is_current_render,
         )
+        self._start_render_worker(worker, on_finished, on_failed)
+
+        return self._render_generation
+
+    # ----------------------------------------------------------------------
+    # Method     : _render_html_fragments
+    # Description: Render the HTML fragments of the given objects.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _render_html_fragments(
+        self,
+        xslt_name: str,
+        document_id: ProteusID,
+        object_ids: List[ProteusID],
+    ) -> Dict[ProteusID, str] | None:
+        """
+        Render the HTML fragments of the given objects of the given document
+        using the given XSLT template. The whole document XML is generated
+        so the templates can navigate it, but only the objects are
+        transformed.
+
+        It does not read the application state, so it can be called from
+        the render worker thread.
+
+        :param xslt_name: The name of the xslt file to use.
+        :param document_id: The id of the document that contains the objects.
+        :param object_ids: The ids of the objects to render.
+        :return: The fragments by object id, None if any of them could not
+                 be rendered.
+        """
+        log.info(f"Getting {xslt_name} render of objects {object_ids}.")
+
+        xml: ET.Element = self._project_service.generate_document_xml(document_id)
+
+        fragments: Dict[ProteusID, str] = {}
+        for object_id in object_ids:
+            fragment: str = self._render_service.render_fragment(
+                xml, xslt_name, object_id
+            )
+            if fragment is None:
+                return None
+
+            fragments[object_id] = fragment
+
+        return fragments
+
+    # ----------------------------------------------------------------------
+    # Method     : _start_render_worker
+    # Description: Start a render worker in the render thread pool.
+    # Date       : 16/10/2026
+    # Version    : 0.2
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _start_render_worker(
+        self,
+        worker: RenderWorker,
+        on_finished: Callable,
+        on_failed: Callable[[str], None] = None,
+    ) -> None:
+        """
+        Connect the worker signals to the given callbacks, discarding the
+        results of superseded renders, and start the worker.
+
+        :param worker: The render worker to start.
+        :param on_finished: Callback called with the render result.
+        :param on_failed: Callback called with the error message.
+        """
+
+        def finished(generation: int, result, generation_time: int):
+            if not self.is_current_render(generation):
+                log.debug(f"Discarding stale render {generation}")
+                return
+            self._last_render_request = None
+            Metrics.set_html_generation_time(generation_time)
+            on_finished(result)
+
+        def failed(generation: int, message: str):
+            if not self.is_current_render(generation):
+                return
+            self._last_render_request = None
+            if on_failed is not None:
+                on_failed(message)
 
-        # Save the html file
-        html_dir = Path(PROTEUS_TEMP_DIR) / "temp_project_render.html"
-        with open(html_dir.as_posix(), "w", encoding="utf-8") as f:
-            f.write(html_string)
+        # Connect before starting the worker so no result is lost
+        worker.signals.finished.connect(finished)
+        worker.signals.failed.connect(failed)
+        self._render_pool.start(worker)
 
-        return html_dir.as_posix()
+    # ----------------------------------------------------------------------
+    # Method     : cancel_html_view_requests
+    # Description: Cancel the pending and in-flight render requests.
+    # Date       : 16/10/2026
+    # Version    : 0.2
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def cancel_html_view_requests(self) -> None:
+        """
+        Cancel the pending render requests and discard the results of the
+        in-flight renders. Their callbacks are never called.
+        """
+        self._last_render_request = None
+        self._render_generation += 1
+        self._render_pool.clear()
+
+    # ----------------------------------------------------------------------
+    # Method     : is_current_render
+    # Description: Check if the given render generation is the current one.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def is_current_render(self, generation: int) -> bool:
+        """
+        Check if the given render generation is the latest requested one.
+        It is safe to call from the render thread.
+
+        :param generation: The generation number of the render request.
+        """
+        return generation == self._render_generation
 
     # ----------------------------------------------------------------------
     # Method     : get_available_xslt
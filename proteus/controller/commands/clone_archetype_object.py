@@ -115,12 +115,19 @@ class CloneArchetypeObjectCommand(QUndoCommand):
 
             # Clone the archetype object
             self.cloned_object = self.archetype_service.create_object(
-                self.archetype_id, parent, project
+                self.archetype_id,
+                parent,
+                project,
+                codes_map=self.project_service.get_biggest_codes(),
             )
 
             # Get the list of cloned objects in this operation
             self.cloned_objects_list = self.cloned_object.get_ids()
 
+            # Add the cloned objects to the indexes
+            self.project_service.add_to_index(self.cloned_object)
+            self.project_service.refresh_indexes(self.cloned_objects_list)
+
             # Save the parent state after clone
             self.after_clone_parent_state = parent.state
         else:
@@ -131,6 +138,9 @@ class CloneArchetypeObjectCommand(QUndoCommand):
             for id in self.cloned_objects_list:
                 self.project_service._get_element_by_id(id).state = ProteusState.FRESH
 
+            # Restore the cloned objects in the indexes
+            self.project_service.refresh_indexes(self.cloned_objects_list)
+
             # Set the parent state to the state after clone stored in the first redo
             parent = self.project_service._get_element_by_id(self.parent_id)
             parent.state = self.after_clone_parent_state
@@ -156,6 +166,9 @@ class CloneArchetypeObjectCommand(QUndoCommand):
         for id in self.cloned_objects_list:
             self.project_service._get_element_by_id(id).state = ProteusState.DEAD
 
+        # Remove the DEAD objects from the indexes
+        self.project_service.refresh_indexes(self.cloned_objects_list)
+
         # Set the parent state to the old state
         parent = self.project_service._get_element_by_id(self.parent_id)
         parent.state = self.before_clone_parent_state
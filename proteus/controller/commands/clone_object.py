@@ -118,6 +118,9 @@ class CloneObjectCommand(QUndoCommand):
             for id in self.cloned_objects_list:
                 self.project_service._get_element_by_id(id).state = ProteusState.FRESH
 
+            # Restore the cloned objects in the indexes
+            self.project_service.refresh_indexes(self.cloned_objects_list)
+
             # Set the new parent state to the state after clone stored in the first redo
             parent: Union[Project, Object] = self.project_service._get_element_by_id(self.new_parent_id)
             parent.state = self.after_clone_parent_state
@@ -143,6 +146,9 @@ class CloneObjectCommand(QUndoCommand):
         for id in self.cloned_objects_list:
             self.project_service._get_element_by_id(id).state = ProteusState.DEAD
 
+        # Remove the DEAD objects from the indexes
+        self.project_service.refresh_indexes(self.cloned_objects_list)
+
         # Set the new parent state to the old state
         parent: Union[Project, Object] = self.project_service._get_element_by_id(self.new_parent_id)
         parent.state = self.before_clone_parent_state
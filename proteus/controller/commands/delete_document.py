@@ -105,6 +105,9 @@ class DeleteDocumentCommand(QUndoCommand):
             object: Object = self.project_service._get_element_by_id(id)
             object.state = ProteusState.DEAD
 
+        # Remove the DEAD objects from the indexes
+        self.project_service.refresh_indexes(self.old_object_states.keys())
+
         # Modify the parent state depending on its current state
         self.before_clone_parent_state: ProteusState = self.document.parent.state
 
@@ -147,6 +150,9 @@ class DeleteDocumentCommand(QUndoCommand):
             object: Object = self.project_service._get_element_by_id(id)
             object.state = self.old_object_states[id]
 
+        # Restore the objects in the indexes
+        self.project_service.refresh_indexes(self.old_object_states.keys())
+
         # Set the parent state to the old state
         self.document.parent.state = self.before_clone_parent_state
 
@@ -101,6 +101,9 @@ class DeleteObjectCommand(QUndoCommand):
             object: Object = self.project_service._get_element_by_id(id)
             object.state = ProteusState.DEAD
 
+        # Remove the DEAD objects from the indexes
+        self.project_service.refresh_indexes(self.old_object_states.keys())
+
         # Modify the parent state depending on its current state
         self.before_delete_parent_state = self.object.parent.state
 
@@ -146,6 +149,9 @@ class DeleteObjectCommand(QUndoCommand):
             object: Object = self.project_service._get_element_by_id(id)
             object.state = self.old_object_states[id]
 
+        # Restore the objects in the indexes
+        self.project_service.refresh_indexes(self.old_object_states.keys())
+
         # Set the parent state to the old state
         self.object.parent.state = self.before_delete_parent_state
 
@@ -13,7 +13,7 @@
 # Standard library imports
 # --------------------------------------------------------------------------
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 # --------------------------------------------------------------------------
 # Third-party library imports
@@ -29,6 +29,7 @@ from proteus.model import ProteusClassTag
 from proteus.model.object import Object
 from proteus.model.properties import Property
 from proteus.model.abstract_object import ProteusState
+from proteus.services.project_service import ProjectService
 from proteus.application.events import (
     ModifyObjectEvent,
 )
@@ -54,7 +55,7 @@ class UpdateObjectMetaModelCommand(QUndoCommand):
     # Method     : __init__
     # Description: Class constructor, invoke the parents class constructors.
     # Date       : 15/10/2024
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def __init__(
@@ -66,9 +67,16 @@ class UpdateObjectMetaModelCommand(QUndoCommand):
         new_selectedCategory: str,
         new_numbered: bool,
         new_properties: Dict[str, Property],
+        project_service: ProjectService,
     ):
         super(UpdateObjectMetaModelCommand, self).__init__()
 
+        # Dependency injection
+        assert isinstance(
+            project_service, ProjectService
+        ), "Must provide a project service instance to the command"
+        self.project_service = project_service
+
         self.object: Object = object
 
         self.new_classes: List[ProteusClassTag] = new_classes
@@ -78,11 +86,12 @@ class UpdateObjectMetaModelCommand(QUndoCommand):
         self.new_numbered: bool = new_numbered
         self.new_properties: Dict[str, Property] = new_properties
 
-        self.old_classes: List[ProteusClassTag] = object.classes.copy()
-        self.old_acceptedChildren: List[ProteusClassTag] = (
-            object.acceptedChildren.copy()
+        # Class tags are immutable tuples, copies are not needed
+        self.old_classes: Tuple[ProteusClassTag, ...] = object.classes
+        self.old_acceptedChildren: Tuple[ProteusClassTag, ...] = (
+            object.acceptedChildren
         )
-        self.old_acceptedParents: List[ProteusClassTag] = object.acceptedParents.copy()
+        self.old_acceptedParents: Tuple[ProteusClassTag, ...] = object.acceptedParents
         self.old_selectedCategory: str = str(object.selectedCategory)
         self.old_numbered: bool = object.numbered
         self.old_properties: Dict[str, Property] = (
@@ -109,6 +118,9 @@ class UpdateObjectMetaModelCommand(QUndoCommand):
         self.object.properties = self.new_properties
         self.object.state = ProteusState.DIRTY
 
+        # Classes and traces may have changed
+        self.project_service.refresh_indexes([self.object.id])
+
         ModifyObjectEvent().notify(self.object.id)
 
     # ----------------------------------------------------------------------
@@ -130,4 +142,7 @@ class UpdateObjectMetaModelCommand(QUndoCommand):
         self.object.properties = self.old_properties
         self.object.state = self.old_state
 
+        # Classes and traces may have changed
+        self.project_service.refresh_indexes([self.object.id])
+
         ModifyObjectEvent().notify(self.object.id)
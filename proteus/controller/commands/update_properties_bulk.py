@@ -0,0 +1,139 @@
+# ==========================================================================
+# File: update_properties_bulk.py
+# Description: Controller to update the properties of several elements.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+from typing import List, Dict, Union
+
+# --------------------------------------------------------------------------
+# Third-party library imports
+# --------------------------------------------------------------------------
+
+from PyQt6.QtGui import QUndoCommand
+
+# --------------------------------------------------------------------------
+# Project specific imports (starting from root)
+# --------------------------------------------------------------------------
+
+from proteus.model import ProteusID
+from proteus.model.object import Object
+from proteus.model.project import Project
+from proteus.model.properties import Property
+from proteus.model.abstract_object import ProteusState
+from proteus.services.project_service import ProjectService
+from proteus.application.events import (
+    ModifyObjectsEvent,
+)
+
+
+# --------------------------------------------------------------------------
+# Class: UpdatePropertiesBulkCommand
+# Description: Controller class to update the properties of several
+#              elements.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+class UpdatePropertiesBulkCommand(QUndoCommand):
+    """
+    Controller class to update the properties of several elements in a
+    single undoable command. The properties are updated in one call to the
+    project service and a single MODIFY OBJECTS event is notified.
+    """
+
+    # ----------------------------------------------------------------------
+    # Method     : __init__
+    # Description: Class constructor, invoke the parents class constructors.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        new_properties: Dict[ProteusID, List[Property]],
+        project_service: ProjectService,
+    ):
+        super(UpdatePropertiesBulkCommand, self).__init__()
+
+        # Dependency injection
+        assert isinstance(
+            project_service, ProjectService
+        ), "Must provide a project service instance to the command"
+        self.project_service = project_service
+
+        # Check new properties
+        assert isinstance(
+            new_properties, Dict
+        ), "The new properties must be provided as a dictionary"
+
+        # Properties to update of each element
+        self.new_properties: Dict[ProteusID, List[Property]] = new_properties
+
+        # Get old properties values and states before updating
+        self.old_properties: Dict[ProteusID, List[Property]] = {}
+        self.old_states: Dict[ProteusID, ProteusState] = {}
+        for element_id, properties in self.new_properties.items():
+            element: Union[Object, Project] = self.project_service._get_element_by_id(
+                element_id
+            )
+
+            old_properties_dict: Dict[str, Property] = element.properties
+            self.old_properties[element_id] = [
+                old_properties_dict[prop.name] for prop in properties
+            ]
+            self.old_states[element_id] = element.state
+
+    # ----------------------------------------------------------------------
+    # Method     : redo
+    # Description: Redo the command, updating the properties of the
+    #              elements.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def redo(self):
+        """
+        Do the command, updating the properties of the elements using the
+        new properties.
+        """
+        # Set redo command text
+        self.setText(f"Update properties of {len(self.new_properties)} elements")
+
+        # Update the properties of the elements and change their state
+        self.project_service.update_properties_bulk(self.new_properties)
+
+        # Notify the frontend components
+        ModifyObjectsEvent().notify(list(self.new_properties.keys()))
+
+    # ----------------------------------------------------------------------
+    # Method     : undo
+    # Description: Undo the command, updating the properties of the
+    #              elements to the previous state.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def undo(self):
+        """
+        Undo the command, updating the properties of the elements to the
+        previous values.
+        """
+        # Set undo command text
+        self.setText(f"Undo update properties of {len(self.new_properties)} elements")
+
+        # Restore the properties of the elements
+        self.project_service.update_properties_bulk(self.old_properties)
+
+        # Change the state of the elements to the previous state
+        for element_id, old_state in self.old_states.items():
+            self.project_service._get_element_by_id(element_id).state = old_state
+
+        # Notify the frontend components
+        ModifyObjectsEvent().notify(list(self.new_properties.keys()))
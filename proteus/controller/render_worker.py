@@ -0,0 +1,164 @@
+# ==========================================================================
+# File: render_worker.py
+# Description: Worker to render the HTML views outside the GUI thread.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+import time
+import logging
+from typing import Any, Callable
+
+# --------------------------------------------------------------------------
+# Third-party library imports
+# --------------------------------------------------------------------------
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+# --------------------------------------------------------------------------
+# Project specific imports (starting from root)
+# --------------------------------------------------------------------------
+
+from proteus.model import ProteusID
+
+# logging configuration
+log = logging.getLogger(__name__)
+
+
+# --------------------------------------------------------------------------
+# Class: RenderWorkerSignals
+# Description: Signals emitted by the render worker.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+class RenderWorkerSignals(QObject):
+    """
+    Signals emitted by the render worker. QRunnable is not a QObject, so
+    the signals are stored in a separate object created in the GUI thread.
+    Slots connected from the GUI thread are invoked through a queued
+    connection, so they always run in the GUI thread.
+
+    finished: generation, render result (html string or rendered
+              fragments) and generation time (ms).
+    failed: generation and error message.
+    """
+
+    finished = pyqtSignal(int, object, int)
+    failed = pyqtSignal(int, str)
+
+
+# --------------------------------------------------------------------------
+# Class: RenderWorker
+# Description: Worker to render the HTML views outside the GUI thread.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+class RenderWorker(QRunnable):
+    """
+    Run the render pipeline (XML generation and XSLT transformation)
+    outside the GUI thread. The render result is served from memory by the
+    views, it is never written to disk.
+
+    Every render request is identified by a generation number. The worker
+    checks if its generation is still the current one before each step of
+    the pipeline, so a render superseded by a newer request stops as soon
+    as possible. The result is discarded by the controller in any case if
+    it arrives after a newer request.
+
+    The model is only modified in the GUI thread. Any modification cancels
+    the renders in progress, so a render that reads the model while it is
+    being modified is always stale and its result (or error) is discarded.
+    The only write made by the render is the creation of raw properties
+    on first access, which never overwrites a property set meanwhile in
+    the GUI thread (see LazyProperties).
+    """
+
+    # ----------------------------------------------------------------------
+    # Method     : __init__
+    # Description: Class constructor, invoke the parents class constructors.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        generation: int,
+        xslt_name: str,
+        document_id: ProteusID,
+        model_version: int,
+        render: Callable[[str, ProteusID, int], Any],
+        is_current: Callable[[int], bool],
+    ) -> None:
+        """
+        Initialize the worker. Every value read from the application state
+        (current document) must be captured in the GUI thread
+        and passed to the worker.
+
+        :param generation: Generation number of the render request.
+        :param xslt_name: Name of the XSLT template to use.
+        :param document_id: Id of the document to render, None to render
+                            the whole project.
+        :param model_version: Version of the model when requested.
+        :param render: Function that generates the render result.
+        :param is_current: Function that checks if a generation is still
+                           the current one.
+        """
+        super(RenderWorker, self).__init__()
+
+        self.generation: int = generation
+        self.xslt_name: str = xslt_name
+        self.document_id: ProteusID = document_id
+        self.model_version: int = model_version
+
+        self._render = render
+        self._is_current = is_current
+
+        # Signals must be created in the GUI thread
+        self.signals: RenderWorkerSignals = RenderWorkerSignals()
+
+    # ----------------------------------------------------------------------
+    # Method     : run
+    # Description: Run the render pipeline.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def run(self) -> None:
+        """
+        Run the render pipeline. Stop if the generation is superseded by
+        a newer render request before or after the XSLT transformation.
+        Emit the finished signal with the render result (HTML string or
+        rendered fragments) or the failed signal if an error is raised.
+        """
+        if not self._is_current(self.generation):
+            log.debug(f"Render {self.generation} superseded before starting")
+            return
+
+        start_time = time.perf_counter()
+        try:
+            result: Any = self._render(
+                self.xslt_name, self.document_id, self.model_version
+            )
+
+            if not self._is_current(self.generation):
+                log.debug(f"Render {self.generation} superseded after transform")
+                return
+        except Exception as e:
+            # Errors raised by stale renders are expected if the model was
+            # modified while the render was running
+            if self._is_current(self.generation):
+                log.error(f"Error rendering view {self.xslt_name}: {e}")
+                self.signals.failed.emit(self.generation, str(e))
+            else:
+                log.debug(f"Render {self.generation} superseded with error: {e}")
+            return
+
+        generation_time = int((time.perf_counter() - start_time) * 1000)
+        self.signals.finished.emit(self.generation, result, generation_time)
@@ -33,6 +33,7 @@ DOCUMENT_TAG       = str('document')
 DOCUMENTS_TAG      = str('documents')
 CHILD_TAG          = str('child')
 CHILDREN_TAG       = str('children')
+REFERENCES_TAG     = str('references')
 
 
 # XML attributes
@@ -75,6 +76,7 @@ PROTEUS_DEPENDENCY          = str(':Proteus-dependency')
 PROTEUS_AUTHOR              = str(':Proteus-author')
 PROTEUS_INFORMATION_SOURCE  = str(':Proteus-information-source')
 PROTEUS_WORKS_FOR           = str(':Proteus-works-for')
+PROTEUS_LINK                = str(':Proteus-link')
 
 
 # Name prefix for cloned objects
@@ -16,9 +16,12 @@
 # Standard library imports
 # --------------------------------------------------------------------------
 
+import sys
 import logging
+import hashlib
+import itertools
 from enum import Enum
-from typing import Type, List, Set
+from typing import Type, List, Set, Mapping, Iterator
 from abc import ABC, abstractmethod
 
 # --------------------------------------------------------------------------
@@ -36,12 +39,16 @@ from proteus.model import (
     NAME_ATTRIBUTE,
     PROPERTIES_TAG,
 )
-from proteus.model.properties import Property, PropertyFactory
+from proteus.model.properties import Property, LazyProperties
 
 
 # logging configuration
 log = logging.getLogger(__name__)
 
+# Versions counter shared by every abstract object. Versions are unique so
+# copies of an object never match the version of the original one.
+_versions_counter = itertools.count(1)
+
 # --------------------------------------------------------------------------
 # Class: ProteusStates
 # Description: Enumeration for abstract object's state
@@ -80,6 +87,10 @@ class AbstractObject(ABC):
     its properties (and probably more in the future).
     """
 
+    # Slots avoid storing a dictionary per instance, subclasses must also
+    # declare their attributes in __slots__
+    __slots__ = ("path", "id", "version", "_state", "_properties", "content_hash")
+
     # ----------------------------------------------------------------------
     # Method     : __init__
     # Description: It initializes a PROTEUS abstract project.
@@ -103,23 +114,218 @@ class AbstractObject(ABC):
         # short UUID (to be initialized in other methods?)
         self.id: ProteusID = None
 
+        # version, updated every time the object is modified
+        self.version: int = next(_versions_counter)
+
         # state (to be initialized in other methods?)
-        self.state: ProteusState = ProteusState.CLEAN
+        # NOTE: CLEAN objects are not tracked by the project, so the state
+        # is initialized without notifying it.
+        self._state: ProteusState = ProteusState.CLEAN
+
+        # Properties dictionary (indexed by property names). Properties are
+        # created from their XML elements when they are first accessed.
+        self._properties: LazyProperties = LazyProperties()
+
+        # Hash of the file content, used to skip writing unchanged files.
+        # Set when the file is parsed or written.
+        self.content_hash: bytes = None
+
+    # ----------------------------------------------------------------------
+    # Method     : properties (property)
+    # Description: It returns the properties of a PROTEUS abstract object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @property
+    def properties(self) -> LazyProperties:
+        """
+        It returns the properties dictionary of the abstract object.
+
+        :return: the properties dictionary indexed by property names.
+        """
+        return self._properties
+
+    # ----------------------------------------------------------------------
+    # Method     : properties (setter)
+    # Description: It sets the properties of a PROTEUS abstract object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @properties.setter
+    def properties(self, new_properties: Mapping[str, Property]) -> None:
+        """
+        It sets the properties dictionary of the abstract object. Regular
+        dictionaries are converted to a LazyProperties dictionary.
+
+        :param new_properties: the new properties indexed by property names.
+        """
+        if not isinstance(new_properties, LazyProperties):
+            new_properties = LazyProperties(new_properties)
+        self._properties = new_properties
+
+    # ----------------------------------------------------------------------
+    # Method     : state (property)
+    # Description: It returns the state of a PROTEUS abstract object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @property
+    def state(self) -> ProteusState:
+        """
+        It returns the state of the abstract object.
+
+        :return: the state of the abstract object.
+        """
+        return self._state
+
+    # ----------------------------------------------------------------------
+    # Method     : state (setter)
+    # Description: It sets the state of a PROTEUS abstract object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @state.setter
+    def state(self, new_state: ProteusState) -> None:
+        """
+        It sets the state of the abstract object. Every state assignment
+        increases the object version since state changes are made along
+        with changes in the object or its children list.
+
+        The project the object belongs to is notified, so it can keep
+        track of the objects with unsaved changes.
+
+        :param new_state: the new state of the abstract object.
+        """
+        self._state = new_state
+        self.increase_version()
+
+        project = self.get_project()
+        if project is not None:
+            project.update_state_registry(self)
+
+    # ----------------------------------------------------------------------
+    # Method     : increase_version
+    # Description: It increases the version of a PROTEUS abstract object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def increase_version(self) -> None:
+        """
+        It increases the version of the abstract object. It must be called
+        every time the object data used to generate its XML changes
+        (properties, attributes or children list), so cached XML fragments
+        are discarded.
+        """
+        self.version = next(_versions_counter)
+
+    # ----------------------------------------------------------------------
+    # Method     : write_xml
+    # Description: It writes the XML of a PROTEUS abstract object to its
+    #              file.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def write_xml(self) -> bool:
+        """
+        It writes the XML of the abstract object to its file and sets its
+        state to CLEAN. The file is not written if the serialized XML has
+        the same hash as the file content (e.g. after undoing an edit).
+
+        :return: True if the file was written, False otherwise.
+        """
+        data: bytes = ET.tostring(
+            self.generate_xml(),
+            pretty_print=True,
+            xml_declaration=True,
+            encoding="utf-8",
+        )
+        data_hash: bytes = AbstractObject.hash_content(data)
+
+        written: bool = data_hash != self.content_hash
+        if written:
+            with open(self.path, "wb") as file:
+                file.write(data)
+            self.content_hash = data_hash
+        else:
+            log.debug(f"Skipped writing unchanged file '{self.path}'.")
+
+        self.state = ProteusState.CLEAN
+        return written
+
+    # ----------------------------------------------------------------------
+    # Method     : parse_xml
+    # Description: It parses the XML file of a PROTEUS abstract object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def parse_xml(self) -> ET._Element:
+        """
+        It parses the XML file of the abstract object and stores the hash
+        of its content.
+
+        :return: the XML root element.
+        """
+        with open(self.path, "rb") as file:
+            data: bytes = file.read()
+
+        self.content_hash = AbstractObject.hash_content(data)
+        return ET.fromstring(data)
+
+    # ----------------------------------------------------------------------
+    # Method     : hash_content (static)
+    # Description: It returns the hash of a file content.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def hash_content(data: bytes) -> bytes:
+        """
+        It returns the hash of the given file content.
+
+        :param data: file content.
+        :return: hash of the content.
+        """
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    # ----------------------------------------------------------------------
+    # Method     : get_project
+    # Description: It returns the project of a PROTEUS abstract object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @abstractmethod
+    def get_project(self):
+        """
+        It returns the project the abstract object belongs to, None if it
+        does not belong to a project (e.g. archetypes).
 
-        # Properties dictionary (indexed by property names)
-        self.properties: dict[str, Property] = dict[str, Property]()
+        :return: the project of the abstract object.
+        """
+        pass
 
     # ----------------------------------------------------------------------
     # Method     : load_properties
     # Description: It loads the properties of a PROTEUS abstract object.
     # Date       : 26/09/2022 (using get with None as default value)
-    # Version    : 0.3
+    # Version    : 0.4
     # Author     : Amador Durán Toro
+    #              José María Delgado Sánchez
     # ----------------------------------------------------------------------
 
     def load_properties(self, root: ET._Element) -> None:
         """
         It loads a PROTEUS abstract object's properties from an XML root element.
+        Properties XML elements are stored raw, properties are created when
+        they are first accessed.
 
         :param root: the XML root element.
         :type root: ET._Element
@@ -145,11 +351,11 @@ class AbstractObject(ABC):
                 property_name is not None
             ), f"PROTEUS file {self.path} includes an unnamed property."
 
-            # Add the property to the properties dictionary
-            property: Property = PropertyFactory.create(property_element)
-            if property is not None:
-                self.properties[property_name] = property
-            else:
+            # Add the property XML element to the properties dictionary
+            # NOTE: Property names are repeated in every object of the same
+            # class, they are interned so dictionaries share the same keys
+            property_name = sys.intern(property_name)
+            if not self.properties.set_raw(property_name, property_element):
                 log.error(
                     f"Property {property_name} could not be created from {self.path}."
                 )
@@ -174,17 +380,16 @@ class AbstractObject(ABC):
         return self.properties.get(key, None)
 
     # ----------------------------------------------------------------------
-    # Method     : set_property
-    # Description: It sets an object's property.
-    # Date       : 17/09/2022
-    # Version    : 0.2
-    # Author     : Pablo Rivera Jiménez
-    #              Amador Durán Toro
+    # Method     : check_property
+    # Description: It checks a property can be set in an object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
-
-    def set_property(self, new_property: Property) -> None:
+    def check_property(self, new_property: Property) -> None:
         """
-        It sets an abstract object's (Object and Project) property.
+        It checks the given property can be set in the abstract object. The
+        object must have a property with the same name and class.
 
         :param new_property: the new property to be set.
         :type new_property: Property
@@ -212,8 +417,30 @@ class AbstractObject(ABC):
             current_property_class == new_property_class
         ), f"Current and new property types are different in {self.id}: {current_property_class} != {new_property_class}"
 
+    # ----------------------------------------------------------------------
+    # Method     : set_property
+    # Description: It sets an object's property.
+    # Date       : 17/09/2022
+    # Version    : 0.3
+    # Author     : Pablo Rivera Jiménez
+    #              Amador Durán Toro
+    # ----------------------------------------------------------------------
+
+    def set_property(self, new_property: Property) -> None:
+        """
+        It sets an abstract object's (Object and Project) property.
+
+        :param new_property: the new property to be set.
+        :type new_property: Property
+        """
+        self.check_property(new_property)
+
+        # Get new property name
+        new_property_name: str = new_property.name
+
         # Update property
         self.properties[new_property_name] = new_property
+        self.increase_version()
 
         # Update object's state
         if self.state == ProteusState.CLEAN:
@@ -266,19 +493,73 @@ class AbstractObject(ABC):
 
         :return: A set with all the ids of the object including its children recursively.
         """
+        return {element.id for element in self.walk_preorder()}
+
+    # ----------------------------------------------------------------------
+    # Method     : walk_preorder
+    # Description: It iterates over the object and its descendants in
+    #              preorder.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+
+    def walk_preorder(self, skip_dead: bool = False) -> Iterator["AbstractObject"]:
+        """
+        Generator that yields the object and its descendants in preorder
+        (parents before their children, children in list order). The tree
+        is traversed iteratively, so its depth is not limited by the
+        recursion limit.
+
+        :param skip_dead: If True, DEAD elements and their descendants are
+        not yielded.
+        :return: Iterator over the object and its descendants.
+        """
+        pending: List[AbstractObject] = [self]
+        while pending:
+            element: AbstractObject = pending.pop()
+            if skip_dead and element.state == ProteusState.DEAD:
+                continue
 
-        # Initialize an empty set of ids
-        ids: Set[ProteusID] = set()
+            yield element
 
-        # For each object in the project or object, we get the ids of the objects
-        # and their children recursively
-        descendant: AbstractObject
-        for descendant in self.get_descendants():
-            ids.update(descendant.get_ids())
+            # Children are pushed reversed so they are popped in list order
+            pending.extend(reversed(element.get_descendants()))
 
-        ids.add(self.id)
+    # ----------------------------------------------------------------------
+    # Method     : walk_postorder
+    # Description: It iterates over the object and its descendants in
+    #              postorder.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
 
-        return ids
+    def walk_postorder(self, skip_dead: bool = False) -> Iterator["AbstractObject"]:
+        """
+        Generator that yields the object and its descendants in postorder
+        (children before their parents, children in list order). The tree
+        is traversed iteratively, so its depth is not limited by the
+        recursion limit.
+
+        :param skip_dead: If True, DEAD elements and their descendants are
+        not yielded.
+        :return: Iterator over the object and its descendants.
+        """
+        if skip_dead and self.state == ProteusState.DEAD:
+            return
+
+        # Stack of elements and the iterator over their children
+        pending: List[tuple] = [(self, iter(self.get_descendants()))]
+        while pending:
+            element, children = pending[-1]
+            for child in children:
+                if not (skip_dead and child.state == ProteusState.DEAD):
+                    pending.append((child, iter(child.get_descendants())))
+                    break
+            else:
+                pending.pop()
+                yield element
 
     # ----------------------------------------------------------------------
     # Method     : get_descendants
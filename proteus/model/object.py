@@ -24,8 +24,9 @@ from __future__ import annotations  # it has to be the first import
 
 import pathlib
 import os
+import sys
 import logging
-from typing import List, NewType, Union, Dict, Set
+from typing import List, NewType, Union, Dict, Set, Tuple, Iterable
 import copy
 import shutil
 import datetime
@@ -68,6 +69,7 @@ from proteus.model.properties import (
     DateProperty,
     CodeProperty,
     TraceProperty,
+    LazyProperties,
 )
 from proteus.model.properties.code_property import ProteusCode
 from proteus.application.resources.translator import translate as _
@@ -82,9 +84,109 @@ class Project(AbstractObject):
 # Type for Class tags in Proteus
 ProteusClassTag = NewType("ProteusClassTag", str)
 
+# Object attributes read from the XML file that are stored in the project
+# snapshot (see proteus.model.snapshot)
+SNAPSHOT_ATTRIBUTES: Tuple[str, ...] = (
+    "id",
+    "classes",
+    "acceptedChildren",
+    "acceptedParents",
+    "selectedCategory",
+    "numbered",
+    "properties",
+    "content_hash",
+    "_children_ids",
+)
+
 # Module configuration
 log = logging.getLogger(__name__)  # Logger
 
+# Shared class tags tuples, identical class lists of different objects are
+# stored as the same tuple (see shared_class_tags)
+_class_tags_pool: Dict[Tuple[ProteusClassTag, ...], Tuple[ProteusClassTag, ...]] = {}
+
+# Parent and child acceptance by class signatures, see accepts_class_signature
+_acceptance_matrix: Dict[Tuple[Tuple[ProteusClassTag, ...], ...], bool] = {}
+
+
+# ----------------------------------------------------------------------
+# Function   : shared_class_tags
+# Description: It returns the shared tuple of a list of class tags.
+# Date       : 16/10/2026
+# Version    : 0.1
+# Author     : José María Delgado Sánchez
+# ----------------------------------------------------------------------
+def shared_class_tags(
+    class_tags: Iterable[ProteusClassTag],
+) -> Tuple[ProteusClassTag, ...]:
+    """
+    It returns an immutable tuple with the given class tags. Class tags are
+    interned and identical tuples are shared, so objects of the same class
+    do not store their own copy of the classes lists.
+
+    :param class_tags: class tags (e.g. classes attribute split).
+    :return: shared tuple of class tags.
+    """
+    class_tags = tuple(sys.intern(class_tag) for class_tag in class_tags)
+    return _class_tags_pool.setdefault(class_tags, class_tags)
+
+
+# ----------------------------------------------------------------------
+# Function   : accepts_class_signature
+# Description: It checks if a parent class signature accepts a child class
+#              signature.
+# Date       : 16/10/2026
+# Version    : 0.1
+# Author     : José María Delgado Sánchez
+# ----------------------------------------------------------------------
+def accepts_class_signature(
+    parent_classes: Iterable[ProteusClassTag],
+    parent_accepted_children: Iterable[ProteusClassTag],
+    child_classes: Iterable[ProteusClassTag],
+    child_accepted_parents: Iterable[ProteusClassTag],
+) -> bool:
+    """
+    It checks if a parent accepts a child given their class signatures
+    (classes and accepted classes). Both conditions must be true:
+
+    1 - Child accepted parents must be PROTEUS_ANY or contain one of the
+    parent classes.
+
+    2 - Parent accepted children must be PROTEUS_ANY or contain one of the
+    child classes.
+
+    Results are stored in the acceptance matrix, so each pair of signatures
+    is only checked once.
+
+    :param parent_classes: parent classes.
+    :param parent_accepted_children: parent accepted children classes.
+    :param child_classes: child classes.
+    :param child_accepted_parents: child accepted parents classes.
+    :return: True if the child is accepted by the parent, False otherwise.
+    """
+    # NOTE: tuple() returns the same instance for the shared class tags tuples
+    key = (
+        tuple(parent_classes),
+        tuple(parent_accepted_children),
+        tuple(child_classes),
+        tuple(child_accepted_parents),
+    )
+
+    accepted: bool = _acceptance_matrix.get(key)
+    if accepted is None:
+        condition_1: bool = PROTEUS_ANY in child_accepted_parents or not set(
+            child_accepted_parents
+        ).isdisjoint(parent_classes)
+
+        condition_2: bool = PROTEUS_ANY in parent_accepted_children or not set(
+            parent_accepted_children
+        ).isdisjoint(child_classes)
+
+        accepted = condition_1 and condition_2
+        _acceptance_matrix[key] = accepted
+
+    return accepted
+
 
 # --------------------------------------------------------------------------
 # Class: Object
@@ -107,6 +209,21 @@ class Object(AbstractObject):
     file.
     """
 
+    # Objects are created for every file of a project, slots avoid storing
+    # a dictionary per instance
+    __slots__ = (
+        "project",
+        "parent",
+        "_classes",
+        "_acceptedChildren",
+        "_acceptedParents",
+        "selectedCategory",
+        "numbered",
+        "_children_ids",
+        "_children",
+        "_xml_cache",
+    )
+
     # ----------------------------------------------------------------------
     # Method: load (static)
     # Description: It loads a PROTEUS object from disk into memory
@@ -152,14 +269,63 @@ class Object(AbstractObject):
         ), f"PROTEUS object file {object_file_path} not found in {objects_repository}."
 
         # Create and return the project object
-        return Object(object_file_path, project=project)
+        if project.snapshot is None:
+            return Object(object_file_path, project=project)
+
+        # Restore the object from the project snapshot if its file did not
+        # change, otherwise parse it and update the snapshot
+        stat: os.stat_result = os.stat(object_file_path)
+        state: dict = project.snapshot.get(id, stat)
+        if state is not None:
+            return Object.from_snapshot(object_file_path, project, state)
+
+        object: Object = Object(object_file_path, project=project)
+        project.snapshot.put(id, stat, object.get_snapshot_state())
+        return object
+
+    # ----------------------------------------------------------------------
+    # Method: from_snapshot (static)
+    # Description: It creates a PROTEUS object from its snapshot state
+    # Date: 16/10/2026
+    # Version: 0.2
+    # Author: José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+
+    @staticmethod
+    def from_snapshot(object_file_path: str, project: Project, state: dict) -> Object:
+        """
+        Static factory method for creating a PROTEUS object from the state
+        stored in the project snapshot, without parsing its XML file.
+
+        :param object_file_path: path to the object XML file.
+        :param project: project the object belongs to.
+        :param state: object snapshot state (see get_snapshot_state).
+        :return: the restored object.
+        """
+        object: Object = Object.__new__(Object)
+        AbstractObject.__init__(object, object_file_path)
+
+        object.project = project
+        object.parent = None
+        for attribute in SNAPSHOT_ATTRIBUTES:
+            value = state[attribute]
+            # Mutable values are copied so changes are not stored in the
+            # snapshot until the object is saved
+            if isinstance(value, (list, dict, LazyProperties)):
+                value = value.copy()
+            setattr(object, attribute, value)
+
+        object._children = None
+        object._xml_cache = None
+
+        return object
 
     # ----------------------------------------------------------------------
     # Method     : __init__
     # Description: It initializes a PROTEUS object and builds it using an
     #              XML file.
     # Date       : 16/09/2022
-    # Version    : 0.2
+    # Version    : 0.3
     # Author     : Amador Durán Toro
     # ----------------------------------------------------------------------
 
@@ -171,14 +337,15 @@ class Object(AbstractObject):
         # TODO: pass some arguments?
         super().__init__(object_file_path)
 
-        if not os.path.isfile(object_file_path):
-            self.state = ProteusState.FRESH
-
         # Save project as an object's attribute
+        # NOTE: Project must be set before the state so it is notified
         self.project: Project = project
 
+        if not os.path.isfile(object_file_path):
+            self.state = ProteusState.FRESH
+
         # Parse and load XML into memory
-        root: ET._Element = ET.parse(object_file_path).getroot()
+        root: ET._Element = self.parse_xml()
 
         # Check root tag is <object>
         assert (
@@ -192,21 +359,22 @@ class Object(AbstractObject):
         self.parent: Union[Object, Project] = None
 
         # Get object classes and accepted children classes
-        self.classes: List[ProteusClassTag] = root.attrib[CLASSES_ATTRIBUTE].split()
-        self.acceptedChildren: List[ProteusClassTag] = root.attrib[
-            ACCEPTED_CHILDREN_ATTRIBUTE
-        ].split()
+        # NOTE: Classes are stored as shared tuples (see classes setter)
+        self.classes = root.attrib[CLASSES_ATTRIBUTE].split()
+        self.acceptedChildren = root.attrib[ACCEPTED_CHILDREN_ATTRIBUTE].split()
 
         # Get accepted parent classes
         # NOTE: Prevent second level archetypes to be accepted by any archetypes.
         # Default value is PROTEUS_ANY, which means any object can be parent.
-        self.acceptedParents: List[ProteusClassTag] = root.attrib.get(
+        self.acceptedParents = root.attrib.get(
             ACCEPTED_PARENTS_ATTRIBUTE, PROTEUS_ANY
         ).split()
 
         # Selected category provides information about which property category
         # is more relevant among the others to the user. It can be None
-        self.selectedCategory: str = root.attrib.get(SELECTED_CATEGORY_ATTRIBUTE, "")
+        self.selectedCategory: str = sys.intern(
+            root.attrib.get(SELECTED_CATEGORY_ATTRIBUTE, "")
+        )
 
         # Numbered attribute (in children tag)
         # Tells if the children must be numbered when displayed
@@ -216,12 +384,137 @@ class Object(AbstractObject):
             numbered_str = children_element.attrib.get(NUMBERED_ATTRIBUTE, "false")
         self.numbered = True if numbered_str.lower() == "true" else False
 
+        # Children ids read from the XML file, they allow to load the
+        # children without parsing the file again
+        self._children_ids: List[ProteusID] = []
+        if children_element is not None:
+            for child_element in children_element:
+                child_id: ProteusID = child_element.attrib.get(ID_ATTRIBUTE, None)
+                assert (
+                    child_id is not None
+                ), f"PROTEUS object file {object_file_path} includes a child without ID."
+                self._children_ids.append(ProteusID(child_id))
+
         # Load object's properties using superclass method
         super().load_properties(root)
 
         # Children list (will be loaded on demand)
         self._children: List[Object] = None
 
+        # Cached XML element and the object version it was generated from
+        self._xml_cache: Tuple[int, ET._Element] = None
+
+    # ----------------------------------------------------------------------
+    # Property   : classes
+    # Description: Property classes getter and setter.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @property
+    def classes(self) -> Tuple[ProteusClassTag, ...]:
+        """
+        It returns the classes of the object.
+
+        :return: tuple of class tags.
+        """
+        return self._classes
+
+    @classes.setter
+    def classes(self, class_tags: Iterable[ProteusClassTag]) -> None:
+        """
+        It sets the classes of the object. Class tags are stored as
+        a shared immutable tuple.
+
+        :param class_tags: new class tags.
+        """
+        self._classes = shared_class_tags(class_tags)
+
+    # ----------------------------------------------------------------------
+    # Property   : acceptedChildren
+    # Description: Property acceptedChildren getter and setter.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @property
+    def acceptedChildren(self) -> Tuple[ProteusClassTag, ...]:
+        """
+        It returns the accepted children classes of the object.
+
+        :return: tuple of class tags.
+        """
+        return self._acceptedChildren
+
+    @acceptedChildren.setter
+    def acceptedChildren(self, class_tags: Iterable[ProteusClassTag]) -> None:
+        """
+        It sets the accepted children classes of the object. Class tags are stored as
+        a shared immutable tuple.
+
+        :param class_tags: new class tags.
+        """
+        self._acceptedChildren = shared_class_tags(class_tags)
+
+    # ----------------------------------------------------------------------
+    # Property   : acceptedParents
+    # Description: Property acceptedParents getter and setter.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @property
+    def acceptedParents(self) -> Tuple[ProteusClassTag, ...]:
+        """
+        It returns the accepted parents classes of the object.
+
+        :return: tuple of class tags.
+        """
+        return self._acceptedParents
+
+    @acceptedParents.setter
+    def acceptedParents(self, class_tags: Iterable[ProteusClassTag]) -> None:
+        """
+        It sets the accepted parents classes of the object. Class tags are stored as
+        a shared immutable tuple.
+
+        :param class_tags: new class tags.
+        """
+        self._acceptedParents = shared_class_tags(class_tags)
+
+    # ----------------------------------------------------------------------
+    # Method     : get_snapshot_state
+    # Description: It returns the state of the object stored in the project
+    #              snapshot.
+    # Date       : 16/10/2026
+    # Version    : 0.3
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def get_snapshot_state(self) -> dict:
+        """
+        It returns the object attributes read from its XML file, so it can
+        be restored via from_snapshot method without parsing the file.
+        Mutable attributes are copied.
+
+        Children ids are read from the loaded children if any, since the
+        ids read from the XML file are not updated when children are added,
+        deleted or moved.
+
+        :return: object snapshot state.
+        """
+        state: dict = {
+            attribute: getattr(self, attribute) for attribute in SNAPSHOT_ATTRIBUTES
+        }
+        for attribute, value in state.items():
+            if isinstance(value, (list, dict, LazyProperties)):
+                state[attribute] = value.copy()
+
+        # Same children written by generate_xml
+        if self._children is not None:
+            state["_children_ids"] = [child.id for child in self._children]
+
+        return state
+
     # ----------------------------------------------------------------------
     # Property   : children
     # Description: Property children getter. Loads children from XML file
@@ -249,43 +542,23 @@ class Object(AbstractObject):
 
     # ----------------------------------------------------------------------
     # Method     : load_children
-    # Description: It loads the children of a PROTEUS object using an
-    #              XML root element <object>.
+    # Description: It loads the children of a PROTEUS object using the
+    #              children ids read from the XML file.
     # Date       : 13/04/2023
-    # Version    : 0.2
+    # Version    : 0.3
     # Author     : Amador Durán Toro
     #              José María Delgado Sánchez
     # ----------------------------------------------------------------------
 
     def load_children(self) -> None:
         """
-        It loads a PROTEUS object's children from an XML root element.
+        It loads a PROTEUS object's children. Children ids are read when the
+        object file is parsed in the constructor, so the file is not parsed
+        again.
         """
-
-        # Parse and load XML into memory
-        root: ET._Element = ET.parse(self.path).getroot()
-
-        # Check root is not None
-        assert root is not None, f"Root element is not valid in {self.path}."
-
-        # Load children
-        children: ET._Element = root.find(CHILDREN_TAG)
-
-        # If <children> element is not found, ignore children
-        if children is None:
-            self._children = []
-            return
-
         # Parse object's children
-        child: ET._Element
-        for child in children:
-            child_id: ProteusID = child.attrib[ID_ATTRIBUTE]
-
-            # Check whether the child has an ID
-            assert (
-                child_id is not None
-            ), f"PROTEUS object file {self.id} includes a child without ID."
-
+        child_id: ProteusID
+        for child_id in self._children_ids:
             # Add the child to the children dictionary and set the parent
             if self.project is not None:
                 # If the project is not None, load the child using the project
@@ -341,11 +614,21 @@ class Object(AbstractObject):
         It returns a list with all the descendants of an object including the object itself.
         :return: List with all the descendants of an object including the object itself.
         """
-        descendants = set()
-        descendants.add(self)
-        for child in self.children:
-            descendants.update(child.get_descendants_recursively())
-        return descendants
+        return set(self.walk_preorder())
+
+    # ----------------------------------------------------------------------
+    # Method     : get_project
+    # Description: It returns the project of a PROTEUS object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def get_project(self) -> Project:
+        """
+        It returns the project of the object, None for archetypes.
+        :return: project of the object.
+        """
+        return self.project
 
     # ----------------------------------------------------------------------
     # Method     : get_descendants
@@ -397,6 +680,7 @@ class Object(AbstractObject):
         # Add the child to the children list and set the parent
         self.children.insert(position, child)
         child.parent = self
+        self.increase_version()
 
         # Set dirty flag
         if self.state != ProteusState.FRESH:
@@ -426,60 +710,52 @@ class Object(AbstractObject):
             child, Object
         ), f"Child {child} is not a valid PROTEUS object."
 
-        # Check child is not the same object
-        if child.id is self.id:
+        # Check the classes signatures are compatible. This check is cached,
+        # so it is done before walking the object branch
+        if not accepts_class_signature(
+            self.classes, self.acceptedChildren, child.classes, child.acceptedParents
+        ):
             return False
 
-        # Check the object branch does not contain the child already
-        # as parent
-        def get_parents(obj: Object) -> List[ProteusID]:
-            parents = []
-            if obj.parent is not None and isinstance(obj.parent, Object):
-                parents.append(obj.parent.id)
-                parents.extend(get_parents(obj.parent))
-            return parents
-
-        if child.id in get_parents(self):
-            return False
-
-        # --------------------------------------------------------
-        # Condition 1 - child accepted parents must be PROTEUS_ANY
-        # or contain one of the object class
-
-        accepted_parent_common_classes = [
-            c for c in child.acceptedParents if c in self.classes
-        ]
+        # Check child is not the same object and the object branch does not
+        # contain the child already as parent
+        ancestor: Object = self
+        while isinstance(ancestor, Object):
+            if ancestor.id == child.id:
+                return False
+            ancestor = ancestor.parent
 
-        condition_1 = (
-            PROTEUS_ANY in child.acceptedParents
-            or len(accepted_parent_common_classes) > 0
-        )
-
-        # --------------------------------------------------------
-        # Condition 2 - self accepted children must be PROTEUS_ANY
-        # or contain one of the child class
+        return True
 
-        accepted_children_common_classes = [
-            c for c in self.acceptedChildren if c in child.classes
-        ]
+    # ----------------------------------------------------------------------
+    # Method     : generate_xml
+    # Description: It returns an XML element for the object.
+    # Date       : 16/10/2026
+    # Version    : 0.3
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
 
-        condition_2 = (
-            PROTEUS_ANY in self.acceptedChildren
-            or len(accepted_children_common_classes) > 0
-        )
+    def generate_xml(self) -> ET._Element:
+        """
+        It returns an XML element for the object. The element is cached
+        along with the object version, so it is only generated again when
+        the object is modified. A copy of the cached element is returned
+        so it can be modified by the caller.
+        """
+        if self._xml_cache is None or self._xml_cache[0] != self.version:
+            self._xml_cache = (self.version, self._generate_xml())
 
-        # BOTH conditions must be true
-        return condition_1 and condition_2
+        return copy.deepcopy(self._xml_cache[1])
 
     # ----------------------------------------------------------------------
-    # Method     : generate_xml
+    # Method     : _generate_xml
     # Description: It generates an XML element for the object.
     # Date       : 16/09/2022
     # Version    : 0.2
     # Author     : Amador Durán Toro
     # ----------------------------------------------------------------------
 
-    def generate_xml(self) -> ET._Element:
+    def _generate_xml(self) -> ET._Element:
         """
         It generates an XML element for the object.
         """
@@ -513,20 +789,17 @@ class Object(AbstractObject):
     # Method     : get_traces
     # Description: It returns a list with all the traces properties of an object.
     # Date       : 12/09/2024
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def get_traces(self) -> List[TraceProperty]:
         """
         It returns a list with all the traces properties of an object.
+        Other properties are not created if they were not accessed yet.
         :return: list with all the traces properties of an object.
         """
         # Return the list with all the traces properties of an object
-        return [
-            property
-            for property in self.properties.values()
-            if isinstance(property, TraceProperty)
-        ]
+        return self.properties.values_of_type(TraceProperty)
 
     # ----------------------------------------------------------------------
     # Method     : clone_object
@@ -536,7 +809,11 @@ class Object(AbstractObject):
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def clone_object(
-        self, parent: Union[Object, Project], project: Project, position: int = None
+        self,
+        parent: Union[Object, Project],
+        project: Project,
+        position: int = None,
+        codes_map: Dict[str, ProteusCode] = None,
     ) -> Object:
         """
         Function that clones an object in a new parent. This function doesn't
@@ -554,13 +831,17 @@ class Object(AbstractObject):
         :param parent: Parent of the new object.
         :param project: Project where the object will be saved.
         :param position: Position in the children list where the child will be added.
+        :param codes_map: Biggest code for each prefix in the project (e.g. the
+        ProjectService codes index). It is updated with the new codes. If None,
+        it is calculated traversing the project.
         :type parent: Union[Object,Project].
         """
         # Map with the ids of the objects that have been cloned and their new ids
         ids_map: Dict[ProteusID, ProteusID] = dict()
 
         # Codes map to calculate the biggest code for each prefix
-        codes_map: Dict[str, ProteusCode] = self._calculate_biggest_code(project)
+        if codes_map is None:
+            codes_map = self._calculate_biggest_code(project)
 
         # Clone the object
         cloned_object: Object = self._clone_object(
@@ -707,12 +988,16 @@ class Object(AbstractObject):
         # Object base clonation
         # -------------------------------------------------------
         # We use standart clone instead of deepcopy to avoid unnecessary copies of project and children
-        # This improves performance but It is necessary to manually deepcopy properties
+        # NOTE: Properties are immutable, so the cloned object shares them with
+        # the original object until they are replaced via set_property. Only
+        # the properties dictionary is copied.
         new_object = copy.copy(self)
-        new_object.properties = copy.deepcopy(self.properties)
+        new_object.properties = self.properties.copy()
 
-        # Reset children
+        # Reset children, cached XML and file content hash
         new_object._children = []
+        new_object._xml_cache = None
+        new_object.content_hash = None
 
         # Set new project and FRESH state
         new_object.project = project
@@ -730,23 +1015,31 @@ class Object(AbstractObject):
         # -------------------------------------------------------
         # Handle special properties (Date, Code, FileProperties)
         # -------------------------------------------------------
-        for property in new_object.properties.values():
-            # Handle FileProperty Assets cloning
-            if isinstance(property, FileProperty):
-                _handle_asset_clone(property)
-            # Set current date to :Proteus-date DateProperty
-            elif isinstance(property, DateProperty) and property.name == PROTEUS_DATE:
-                current_date = datetime.date.today()
-                new_date_property = property.clone(current_date)
-                new_object.set_property(new_date_property)
-            # Increment :Proteus-code CodeProperty if necessary
-            elif isinstance(property, CodeProperty) and property.name == PROTEUS_CODE:
-                new_code_property = _handle_code_clone(property)
-                new_object.set_property(new_code_property)
-            # For existing objects in the project, add the word Copy of in the name
-            elif property.name == PROTEUS_NAME and not is_archetype:
-                new_name_property = property.clone(f"{_(COPY_OF)} {property.value}")
-                new_object.set_property(new_name_property)
+        # NOTE: Only these properties are accessed, the rest are not created
+        # if they are still raw (see LazyProperties)
+
+        # Handle FileProperty Assets cloning
+        for property in new_object.properties.values_of_type(FileProperty):
+            _handle_asset_clone(property)
+
+        # Set current date to :Proteus-date DateProperty
+        property = new_object.get_property(PROTEUS_DATE)
+        if isinstance(property, DateProperty):
+            current_date = datetime.date.today()
+            new_date_property = property.clone(current_date)
+            new_object.set_property(new_date_property)
+
+        # Increment :Proteus-code CodeProperty if necessary
+        property = new_object.get_property(PROTEUS_CODE)
+        if isinstance(property, CodeProperty):
+            new_code_property = _handle_code_clone(property)
+            new_object.set_property(new_code_property)
+
+        # For existing objects in the project, add the word Copy of in the name
+        property = new_object.get_property(PROTEUS_NAME)
+        if property is not None and not is_archetype:
+            new_name_property = property.clone(f"{_(COPY_OF)} {property.value}")
+            new_object.set_property(new_name_property)
 
         # -------------------------------------------------------
         # Parent children update
@@ -786,77 +1079,61 @@ class Object(AbstractObject):
         """
         Recalculate traces of an object and given a map with the ids correlation.
         If a target is not found in the project, the trace will be discarded.
-        It works recursively, iterating over the object descendants.
+        It iterates over the object and its descendants.
 
         :param object: Object to recalculate traces.
         :param ids_map: Dictionary with the ids of the objects that have been cloned and their new ids.
         """
-        # Iterate over traces
-        for trace in self.get_traces():
-            # Variable to store possible new targets list
-            new_targets: List[ProteusID] = []
-
-            # Iterate over targets
-            for target in trace.value:
-                # If the target is in the conversion map, add the new id
-                if target in ids_map:
-                    new_targets.append(ids_map[target])
-                # If the target is in the project ids, add the target
-                elif target in project.ids:
-                    new_targets.append(target)
-                # If target not in conversion map or project ids, log error
-                else:
-                    log.error(
-                        f"Unexpected target '{target}' in trace '{trace.name}' during object '{object.id}' trace cloning. Target ProteusID was not found in the project and will be discarded."
-                    )
-
-            # If new_targets is different from the original targets, update the trace
-            if new_targets != trace.value:
-                new_trace: TraceProperty = trace.clone(new_targets)
-                object.set_property(new_trace)
+        # Iterate over the cloned object and its descendants
+        for cloned_object in object.walk_preorder():
+            # Iterate over traces
+            for trace in cloned_object.get_traces():
+                # Variable to store possible new targets list
+                new_targets: List[ProteusID] = []
+
+                # Iterate over targets
+                for target in trace.value:
+                    # If the target is in the conversion map, add the new id
+                    if target in ids_map:
+                        new_targets.append(ids_map[target])
+                    # If the target is in the project ids, add the target
+                    elif target in project.ids:
+                        new_targets.append(target)
+                    # If target not in conversion map or project ids, log error
+                    else:
+                        log.error(
+                            f"Unexpected target '{target}' in trace '{trace.name}' during object '{cloned_object.id}' trace cloning. Target ProteusID was not found in the project and will be discarded."
+                        )
 
-        # Iterate over children
-        for child in object.children:
-            # Recalculate traces
-            self._recalculate_traces(child, ids_map, project)
+                # If new_targets is different from the original targets, update the trace
+                if new_targets != trace.value:
+                    new_trace: TraceProperty = trace.clone(new_targets)
+                    cloned_object.set_property(new_trace)
 
     def _calculate_biggest_code(self, project: Project) -> Dict[str, ProteusCode]:
         """
         Calculates the biggest code for each prefix in the project universe.
         It stores the ProteusCode instances in a dictionary with the prefix as key.
-        It works recursively, iterating over the object or project descendants.
+        It iterates over the project descendants, DEAD objects are skipped.
 
         :return: Dictionary with the biggest ProteusCode instances for each prefix.
         :rtype: Dict[str, ProteusCode]
         """
-
-        def _calculate_biggest_code_private(
-            element: Union[Project, Object], code_map: Dict[str, ProteusCode]
-        ) -> Dict[str, ProteusCode]:
-            # Iterate over children
-            for child in element.get_descendants():
-                if child.state != ProteusState.DEAD:
-                    code_map = _calculate_biggest_code_private(child, code_map)
-
-            # Iterate over properties
-            for property in element.properties.values():
-                if isinstance(property, CodeProperty):
-                    # Get the prefix
-                    prefix = property.value.prefix
-
-                    # If the prefix is not in the code map, add it
-                    if prefix not in code_map:
+        code_map: Dict[str, ProteusCode] = dict()
+
+        for element in project.walk_postorder(skip_dead=True):
+            # Iterate over code properties
+            for property in element.properties.values_of_type(CodeProperty):
+                # Get the prefix
+                prefix = property.value.prefix
+
+                # If the prefix is not in the code map, add it
+                if prefix not in code_map:
+                    code_map[prefix] = property.value
+                # If the prefix is in the code map, check if the current code is bigger
+                else:
+                    if int(property.value.number) > int(code_map[prefix].number):
                         code_map[prefix] = property.value
-                    # If the prefix is in the code map, check if the current code is bigger
-                    else:
-                        if int(property.value.number) > int(code_map[prefix].number):
-                            code_map[prefix] = property.value
-
-            return code_map
-
-        # Call the private function
-        code_map = dict()
-        code_map = _calculate_biggest_code_private(project, code_map)
 
         return code_map
 
@@ -866,34 +1143,24 @@ class Object(AbstractObject):
     #              already persisted, it will be updated. If the object was
     #              marked as dead, it will be deleted.
     # Date       : 01/05/2023
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
 
     def save(self) -> None:
         """
-        It saves an Object in the system.
+        It saves an Object in the system. Children are not saved, the
+        project saves the objects with changes using its state registry.
         """
-        # Save every child
-        children = list(self.children)
-        for child in children:
-            child.save()
-
         # Persist the object if it is DIRTY or FRESH
         if self.state == ProteusState.DIRTY or self.state == ProteusState.FRESH:
-            root = self.generate_xml()
-
-            # Get the elementTree, save it in the project path and set state to clean
-            tree = ET.ElementTree(root)
-            tree.write(
-                self.path, pretty_print=True, xml_declaration=True, encoding="utf-8"
-            )
-            self.state = ProteusState.CLEAN
+            self.write_xml()
 
         # Delete the object if it is DEAD
         elif self.state == ProteusState.DEAD:
             # Delete itself from the parent children
             self.parent.get_descendants().remove(self)
+            self.parent.increase_version()
 
             # Check if the file exists
             # NOTE: file might not exist if the object was created but not saved
@@ -27,7 +27,7 @@ import pathlib
 import shutil
 import logging
 import datetime
-from typing import List, MutableSet
+from typing import List, MutableSet, Set
 
 # --------------------------------------------------------------------------
 # Third-party library imports
@@ -50,6 +50,7 @@ from proteus.model import (
     PROTEUS_DATE,
 )
 from proteus.model.abstract_object import AbstractObject, ProteusState
+from proteus.model.snapshot import ProjectSnapshot
 from proteus.model.properties import DateProperty, TraceProperty
 
 # if 'proteus.model.object' in sys.modules:
@@ -83,6 +84,16 @@ class Project(AbstractObject):
     directory.
     """
 
+    # See AbstractObject __slots__
+    __slots__ = (
+        "snapshot",
+        "unsaved_objects",
+        "dead_objects",
+        "_documents_ids",
+        "_ids",
+        "_documents",
+    )
+
     # ----------------------------------------------------------------------
     # Method: load (static)
     # Description: It loads a PROTEUS project from disk into memory
@@ -92,11 +103,15 @@ class Project(AbstractObject):
     # ----------------------------------------------------------------------
 
     @staticmethod
-    def load(path: str) -> Project:
+    def load(path: str, use_snapshot: bool = False) -> Project:
         """
         Static factory method for loading a PROTEUS project from a given path.
 
+        If use_snapshot is True, objects are restored from the project
+        snapshot when their files did not change (see ProjectSnapshot).
+
         :param path: path to the project file.
+        :param use_snapshot: use the project snapshot to load objects.
         :return: a PROTEUS project.
         """
         log.info(f"Loading a PROTEUS project from {path}.")
@@ -115,7 +130,12 @@ class Project(AbstractObject):
         ), f"PROTEUS project file {project_file_path} not found in {path}."
 
         # Create and return the project object
-        return Project(project_file_path)
+        project: Project = Project(project_file_path)
+
+        if use_snapshot:
+            project.snapshot = ProjectSnapshot.load(path)
+
+        return project
 
     # ----------------------------------------------------------------------
     # Method     : __init__
@@ -137,8 +157,17 @@ class Project(AbstractObject):
         # TODO: pass some arguments?
         super().__init__(project_file_path)
 
+        # Snapshot of the parsed objects, set by load method if used
+        self.snapshot: ProjectSnapshot = None
+
+        # Project and objects with unsaved changes (DIRTY or FRESH) and
+        # DEAD objects, kept up to date by the state setter via
+        # update_state_registry
+        self.unsaved_objects: Set[AbstractObject] = set()
+        self.dead_objects: Set[Object] = set()
+
         # Parse and load XML into memory
-        root: ET._Element = ET.parse(project_file_path).getroot()
+        root: ET._Element = self.parse_xml()
 
         # Check root tag is <project>
         assert (
@@ -151,6 +180,18 @@ class Project(AbstractObject):
         # Load project's properties using superclass method
         self.load_properties(root)
 
+        # Documents ids read from the XML file, they allow to load the
+        # documents without parsing the file again
+        self._documents_ids: List[ProteusID] = []
+        documents_element: ET._Element = root.find(DOCUMENTS_TAG)
+        if documents_element is not None:
+            for document_element in documents_element:
+                document_id: ProteusID = document_element.attrib.get(ID_ATTRIBUTE, None)
+                assert (
+                    document_id is not None
+                ), f"PROTEUS project file {project_file_path} includes a document without ID."
+                self._documents_ids.append(ProteusID(document_id))
+
         # Project's ids, this variable is set in get_ids method
         self._ids: MutableSet[ProteusID] = None
 
@@ -196,9 +237,8 @@ class Project(AbstractObject):
         Property ids getter. Loads all ids from the project on demand.
 
         This property is updated when add_descendant method is called
-        in project and add_descendant in object.
-
-        Ids must be recalculated when the project is saved.
+        in project and add_descendant in object. Ids of DEAD objects are
+        removed when they are deleted on save.
 
         :return: ids set.
         """
@@ -215,43 +255,23 @@ class Project(AbstractObject):
 
     # ----------------------------------------------------------------------
     # Method     : load_documents
-    # Description: It loads the documents of a PROTEUS project using an
-    #              XML root element <project>.
+    # Description: It loads the documents of a PROTEUS project using the
+    #              documents ids read from the XML file.
     # Date       : 22/08/2022
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : Amador Durán Toro
+    #              José María Delgado Sánchez
     # ----------------------------------------------------------------------
 
     def load_documents(self) -> None:
         """
-        It loads a PROTEUS project's documents from an XML root element.
-        :param root: XML root element.
+        It loads a PROTEUS project's documents. Documents ids are read when
+        the project file is parsed in the constructor, so the file is not
+        parsed again.
         """
-        # Parse and load XML into memory
-        root: ET._Element = ET.parse(self.path).getroot()
-
-        # Check root is not None
-        assert root is not None, f"Root element is not valid in {self.path}."
-
-        # Load documents
-        documents_element: ET._Element = root.find(DOCUMENTS_TAG)
-
-        # Check whether it has documents
-        if documents_element is None:
-            self._documents = []
-            return
-
-        # Parse project's documents
         # TODO: check document_element tag is <document>
-        document_element: ET._Element
-        for document_element in documents_element:
-            document_id: ProteusID = document_element.attrib.get(ID_ATTRIBUTE, None)
-
-            # Check whether the document has an ID
-            assert (
-                document_id is not None
-            ), f"PROTEUS project file {self.path} includes a document without ID."
-
+        document_id: ProteusID
+        for document_id in self._documents_ids:
             # Add the document to the documents dictionary and set the parent
             object = Object.load(document_id, self)
             object.parent = self
@@ -262,7 +282,7 @@ class Project(AbstractObject):
     # Description: It loads the properties of a PROTEUS project using an
     #              XML root element <project>.
     # Date       : 12/09/2024
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
 
@@ -277,12 +297,11 @@ class Project(AbstractObject):
         super().load_properties(root)
 
         # Ignore traceProperties if present
-        for property_name, property in self.properties.items():
-            if isinstance(property, TraceProperty):
-                log.warning(
-                    f"TraceProperty '{property_name}' found in Project file. Projects do not support traces properties. Ignoring it."
-                )
-                self.properties.pop(property_name)
+        for property_name in self.properties.names_of_type(TraceProperty):
+            log.warning(
+                f"TraceProperty '{property_name}' found in Project file. Projects do not support traces properties. Ignoring it."
+            )
+            self.properties.pop(property_name)
 
     # ----------------------------------------------------------------------
     # Method     : get_descendants
@@ -299,6 +318,46 @@ class Project(AbstractObject):
         # Return the list with all the descendants of an object
         return self.documents
 
+    # ----------------------------------------------------------------------
+    # Method     : get_project
+    # Description: It returns the project itself.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def get_project(self) -> Project:
+        """
+        It returns the project itself, it keeps track of its own state.
+        :return: the project.
+        """
+        return self
+
+    # ----------------------------------------------------------------------
+    # Method     : update_state_registry
+    # Description: It updates the registry of elements with unsaved changes.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def update_state_registry(self, element: AbstractObject) -> None:
+        """
+        It updates the registry of elements (project and objects) with
+        unsaved changes and DEAD objects with the current state of the given
+        element. It is called every time the state of an element of the
+        project changes.
+
+        :param element: project or object whose state changed.
+        """
+        if element.state == ProteusState.DIRTY or element.state == ProteusState.FRESH:
+            self.unsaved_objects.add(element)
+        else:
+            self.unsaved_objects.discard(element)
+
+        if element.state == ProteusState.DEAD:
+            self.dead_objects.add(element)
+        else:
+            self.dead_objects.discard(element)
+
     # ----------------------------------------------------------------------
     # Method     : add_descendants
     # Description: Adds a document to the project given a document and its
@@ -398,36 +457,56 @@ class Project(AbstractObject):
     # Method     : save_project
     # Description: It saves a project in the system.
     # Date       : 01/05/2023
-    # Version    : 0.2
+    # Version    : 0.3
     # Author     : Pablo Rivera Jiménez
     #              José María Delgado Sánchez
     # ----------------------------------------------------------------------
 
-    def save_project(self) -> None:
+    def save_project(self) -> int:
         """
-        It saves a project in the system.
+        It saves a project in the system. Only the elements in the state
+        registry are saved, so the cost depends on the number of changes
+        instead of the project size.
+
+        DEAD objects are deleted first. Their parents are marked as DIRTY
+        so they are written without the deleted children. Then every DIRTY
+        or FRESH element is written.
+
+        :return: number of files written.
         """
-        # Save all the documents
-        documents = list(self.documents)
-        for document in documents:
-            document.save()
-
-        # Persist the project only if it is DIRTY or FRESH
-        if self.state == ProteusState.DIRTY or self.state == ProteusState.FRESH:
-            root = self.generate_xml()
-
-            # Get the elementTree, save it in the project path and set state to clean
-            tree = ET.ElementTree(root)
-            tree.write(
-                self.path, pretty_print=True, xml_declaration=True, encoding="utf-8"
-            )
-            self.state = ProteusState.CLEAN
+        # Delete DEAD objects and mark their parents as affected
+        object: Object
+        for object in list(self.dead_objects):
+            parent = object.parent
+            object.save()
+            self.dead_objects.discard(object)
+
+            # Remove the deleted object id from the ids set
+            if self._ids is not None:
+                self._ids.discard(object.id)
+
+            if parent is not None and parent.state == ProteusState.CLEAN:
+                parent.state = ProteusState.DIRTY
+
+        # Write the elements with unsaved changes (project included),
+        # unchanged files are skipped
+        files_written: int = 0
+        for element in list(self.unsaved_objects):
+            if element.write_xml():
+                files_written += 1
+
+                # Update the snapshot with the written object
+                if self.snapshot is not None and element is not self:
+                    self.snapshot.put(
+                        element.id, os.stat(element.path), element.get_snapshot_state()
+                    )
+
+        if self.snapshot is not None:
+            self.snapshot.save()
 
-        # Set the ids set to None to recalculate them when they are needed
-        # This is done to delete the ids of the deleted documents
-        self._ids = None
+        log.info(f"Project saved successfully. {files_written} files written.")
 
-        log.info(f"Project saved successfully.")
+        return files_written
 
     # ----------------------------------------------------------------------
     # Method     : clone_project
@@ -506,13 +585,11 @@ def update_date_recursive(element: Object | Project) -> None:
     Update the date of the object and its descendants if a valid
     :Proteus-Date property is found.
     """
-    # Update the date of the object
-    date_property = element.get_property(PROTEUS_DATE)
-    if isinstance(date_property, DateProperty):
-        current_date = datetime.date.today()
-        new_date_property = date_property.clone(current_date)
-        element.set_property(new_date_property)
-
-    # Update the date of the descendants
-    for descendant in element.get_descendants():
-        update_date_recursive(descendant)
+    current_date = datetime.date.today()
+
+    # Update the date of the object and its descendants
+    for descendant in element.walk_preorder():
+        date_property = descendant.get_property(PROTEUS_DATE)
+        if isinstance(date_property, DateProperty):
+            new_date_property = date_property.clone(current_date)
+            descendant.set_property(new_date_property)
@@ -100,6 +100,7 @@ NO_TARGETS_LIMIT = -1
 
 from proteus.model.properties.property import Property
 from proteus.model.properties.property_factory import PropertyFactory
+from proteus.model.properties.lazy_properties import LazyProperties
 
 from proteus.model.properties.boolean_property import BooleanProperty
 from proteus.model.properties.string_property import StringProperty
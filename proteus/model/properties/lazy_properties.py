@@ -0,0 +1,391 @@
+# ==========================================================================
+# File: lazy_properties.py
+# Description: PROTEUS properties dictionary with lazy property creation
+# Date: 16/10/2026
+# Version: 0.3
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+from __future__ import annotations  # it has to be the first import
+
+import copy
+import logging
+import functools
+import threading
+from collections.abc import ItemsView, MutableMapping, ValuesView
+from typing import Dict, Iterator, List, Mapping, Tuple, Union
+
+# --------------------------------------------------------------------------
+# Third-party library imports
+# --------------------------------------------------------------------------
+
+import lxml.etree as ET
+
+# --------------------------------------------------------------------------
+# Project specific imports
+# --------------------------------------------------------------------------
+
+from proteus.model.properties.property import Property
+from proteus.model.properties.property_factory import PropertyFactory
+
+# logging configuration
+log = logging.getLogger(__name__)
+
+# Raw property type (property class, XML element or serialized XML element)
+RawProperty = Tuple[type[Property], Union[ET._Element, bytes]]
+
+# Lock that makes the replacement of raw properties atomic. Properties are
+# created on first access, which can happen in the render thread while the
+# GUI thread sets them.
+_ITEMS_LOCK = threading.Lock()
+
+
+# --------------------------------------------------------------------------
+# Function: _is_subclass
+# Description: Cached issubclass for property classes.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def _is_subclass(property_class: type, base_class: type) -> bool:
+    """
+    Cached issubclass check. Properties are abstract base classes, so
+    issubclass goes through ABCMeta on every call.
+    """
+    return issubclass(property_class, base_class)
+
+
+# --------------------------------------------------------------------------
+# Class: LazyProperties
+# Description: Properties dictionary with lazy property creation
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+class LazyProperties(MutableMapping):
+    """
+    Dictionary of PROTEUS properties indexed by property name. Properties
+    read from XML files are stored as raw XML elements and they are created
+    with PropertyFactory the first time they are accessed, so properties
+    that are never read in a session are never created.
+
+    Properties keep the order of insertion as a regular dictionary. Raw
+    properties are serialized when the dictionary is pickled (project
+    snapshot) or deep copied, since lxml elements cannot be pickled.
+    """
+
+    # ----------------------------------------------------------------------
+    # Method     : __init__
+    # Description: Class constructor.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def __init__(self, properties: Mapping[str, Property] = None) -> None:
+        """
+        Class constructor.
+
+        :param properties: initial properties indexed by name.
+        """
+        self._items: Dict[str, Property | RawProperty] = {}
+        if properties is not None:
+            self.update(properties)
+
+    # ----------------------------------------------------------------------
+    # Method     : set_raw
+    # Description: It stores a property XML element to be created on demand.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def set_raw(self, name: str, element: ET._Element) -> bool:
+        """
+        It stores the XML element of a property, the property is created
+        when it is accessed for the first time. Elements whose tag is not
+        a valid property type are ignored.
+
+        :param name: name of the property.
+        :param element: XML element of the property.
+        :return: True if the element was stored, False otherwise.
+        """
+        property_class: type[Property] = PropertyFactory.propertyFactory.get(
+            element.tag
+        )
+        if property_class is None:
+            log.warning(
+                f"<{element.tag}> is not a valid PROTEUS property type -> ignoring invalid property"
+            )
+            return False
+
+        self._items[name] = (property_class, element)
+        return True
+
+    # ----------------------------------------------------------------------
+    # Method     : is_loaded
+    # Description: It checks if a property has already been created.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def is_loaded(self, name: str) -> bool:
+        """
+        It checks if the property with the given name has already been
+        created from its XML element.
+
+        :param name: name of the property.
+        :return: True if the property has been created, False otherwise.
+        """
+        return isinstance(self._items[name], Property)
+
+    # ----------------------------------------------------------------------
+    # Method     : names_of_type
+    # Description: It returns the names of the properties of a given type.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def names_of_type(self, property_class: type[Property]) -> List[str]:
+        """
+        It returns the names of the properties that are instances of the
+        given property class without creating the raw ones.
+
+        :param property_class: property class (e.g. TraceProperty).
+        :return: list of property names.
+        """
+        return [
+            name
+            for name, value in self._items.items()
+            if _is_subclass(
+                value[0] if isinstance(value, tuple) else type(value), property_class
+            )
+        ]
+
+    # ----------------------------------------------------------------------
+    # Method     : values_of_type
+    # Description: It returns the properties of a given type.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def values_of_type(self, property_class: type[Property]) -> List[Property]:
+        """
+        It returns the properties that are instances of the given property
+        class. Only those properties are created, the rest are kept raw.
+
+        :param property_class: property class (e.g. TraceProperty).
+        :return: list of properties.
+        """
+        return [self[name] for name in self.names_of_type(property_class)]
+
+    # ----------------------------------------------------------------------
+    # Method     : copy
+    # Description: It returns a shallow copy of the dictionary.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def copy(self) -> LazyProperties:
+        """
+        It returns a shallow copy of the dictionary. Raw properties are
+        shared, they are never modified.
+
+        :return: copy of the dictionary.
+        """
+        properties_copy: LazyProperties = LazyProperties()
+        properties_copy._items = self._items.copy()
+        return properties_copy
+
+    # ----------------------------------------------------------------------
+    # Method     : _create
+    # Description: It creates a raw property.
+    # Date       : 16/10/2026
+    # Version    : 0.3
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _create(self, name: str, raw: RawProperty) -> Property | None:
+        """
+        It creates the property from its raw XML element and replaces the
+        raw value with the shared instance of the property. Replacing an
+        existing key does not change the dictionary size, so properties can
+        be created while iterating.
+
+        Properties that could not be created are ignored, their raw value
+        is removed from the dictionary.
+
+        Properties can be created in the render thread. The raw value is
+        only replaced if it is still in the dictionary, so a property set
+        meanwhile in the GUI thread is never overwritten.
+
+        :return: the property, None if it could not be created.
+        """
+        element: ET._Element | bytes = raw[1]
+        if isinstance(element, bytes):
+            element = ET.fromstring(element)
+
+        property: Property = PropertyFactory.create(element)
+        if property is not None:
+            # Identical properties of different objects share the same instance
+            property = PropertyFactory.shared(property)
+
+        with _ITEMS_LOCK:
+            current: Property | RawProperty | None = self._items.get(name)
+            if current is raw:
+                if property is None:
+                    del self._items[name]
+                else:
+                    self._items[name] = property
+
+        # The property was set or deleted while it was being created
+        if current is not raw:
+            if isinstance(current, tuple):
+                return self._create(name, current)
+            return current
+
+        if property is None:
+            log.error(f"Property {name} could not be created -> ignoring it")
+
+        return property
+
+    # ----------------------------------------------------------------------
+    # Method     : values
+    # Description: It returns a view of the properties.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def values(self) -> ValuesView:
+        """
+        It returns a view of the properties. Properties that could not be
+        created are skipped.
+        """
+        return _LazyValuesView(self)
+
+    # ----------------------------------------------------------------------
+    # Method     : items
+    # Description: It returns a view of the (name, property) pairs.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def items(self) -> ItemsView:
+        """
+        It returns a view of the (name, property) pairs. Properties that
+        could not be created are skipped.
+        """
+        return _LazyItemsView(self)
+
+    # ----------------------------------------------------------------------
+    # Mapping methods
+    # ----------------------------------------------------------------------
+    def __getitem__(self, name: str) -> Property:
+        value: Property | RawProperty = self._items[name]
+        if isinstance(value, tuple):
+            value = self._create(name, value)
+            if value is None:
+                raise KeyError(name)
+        return value
+
+    def __setitem__(self, name: str, property: Property) -> None:
+        with _ITEMS_LOCK:
+            self._items[name] = property
+
+    def __delitem__(self, name: str) -> None:
+        with _ITEMS_LOCK:
+            del self._items[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        # NOTE: Keys are copied, properties that could not be created are
+        # removed when they are accessed while iterating
+        return iter(list(self._items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._items)})"
+
+    # ----------------------------------------------------------------------
+    # Pickle methods
+    # ----------------------------------------------------------------------
+    def __getstate__(self) -> dict:
+        """
+        It returns the state used by pickle and copy. Raw XML elements are
+        serialized since lxml elements cannot be pickled.
+        """
+        items: Dict[str, Property | RawProperty] = {}
+        for name, value in self._items.items():
+            if isinstance(value, tuple) and isinstance(value[1], ET._Element):
+                value = (value[0], LazyProperties._serialize(value[1]))
+            items[name] = value
+
+        return {"_items": items}
+
+    # ----------------------------------------------------------------------
+    # Method     : _serialize (static)
+    # Description: It serializes a raw property XML element.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _serialize(element: ET._Element) -> bytes:
+        """
+        It serializes a property XML element. Empty texts (e.g. an empty
+        CDATA section) are serialized as empty CDATA sections, otherwise
+        they would be parsed as None instead of an empty string.
+        """
+        if any(sub_element.text == "" for sub_element in element.iter()):
+            element = copy.deepcopy(element)
+            for sub_element in element.iter():
+                if sub_element.text == "":
+                    sub_element.text = ET.CDATA("")
+
+        return ET.tostring(element, with_tail=False)
+
+
+# --------------------------------------------------------------------------
+# Class: _LazyValuesView
+# Description: Values view that skips the properties not created.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+class _LazyValuesView(ValuesView):
+    """
+    Values view of a LazyProperties dictionary. Properties that could not
+    be created are skipped instead of raising KeyError.
+    """
+
+    def __iter__(self) -> Iterator[Property]:
+        for name in self._mapping:
+            property: Property | None = self._mapping.get(name)
+            if property is not None:
+                yield property
+
+
+# --------------------------------------------------------------------------
+# Class: _LazyItemsView
+# Description: Items view that skips the properties not created.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+class _LazyItemsView(ItemsView):
+    """
+    Items view of a LazyProperties dictionary. Properties that could not
+    be created are skipped instead of raising KeyError.
+    """
+
+    def __iter__(self) -> Iterator[Tuple[str, Property]]:
+        for name in self._mapping:
+            property: Property | None = self._mapping.get(name)
+            if property is not None:
+                yield (name, property)
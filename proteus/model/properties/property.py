@@ -12,6 +12,7 @@
 # Standard library imports
 # --------------------------------------------------------------------------
 
+import copy
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, replace
 from typing import Any
@@ -101,6 +102,16 @@ class Property(ABC):
             # self.tooltip = str() cannot be used when frozen=True
             object.__setattr__(self, "tooltip", str())
 
+    def __getstate__(self) -> dict:
+        """
+        It returns the state of the property used by pickle and copy. The
+        cached XML element is not included since lxml elements cannot be
+        pickled, it is generated again on demand.
+        """
+        state: dict = self.__dict__.copy()
+        state.pop("_xml_element", None)
+        return state
+
     def clone(self, new_value=None) -> "Property":
         """
         It clones the property with a new value if it is not None.
@@ -114,6 +125,23 @@ class Property(ABC):
         return replace(self, value=new_value)
 
     def generate_xml(self) -> ET._Element:
+        """
+        It returns the XML element for the property. Properties are
+        immutable, so the element is generated only once and a copy of
+        it is returned on every call.
+        """
+        # Cached element is stored outside the dataclass fields, so it is
+        # not taken into account in comparisons and it is not copied by
+        # dataclasses.replace (used by clone)
+        cached_element: ET._Element = self.__dict__.get("_xml_element")
+        if cached_element is None:
+            cached_element = self._generate_xml()
+            # self._xml_element = ... cannot be used when frozen=True
+            object.__setattr__(self, "_xml_element", cached_element)
+
+        return copy.deepcopy(cached_element)
+
+    def _generate_xml(self) -> ET._Element:
         """
         This template method generates the XML element for the property.
         """
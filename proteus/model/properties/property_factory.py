@@ -12,8 +12,11 @@
 # Standard library imports
 # --------------------------------------------------------------------------
 
+import sys
+import weakref
 import logging
-from typing import List
+import dataclasses
+from typing import List, Dict, Tuple
 
 # --------------------------------------------------------------------------
 # Third-party library imports
@@ -102,6 +105,41 @@ class PropertyFactory:
         TraceProperty.element_tagname: TraceProperty,
     }
 
+    # Flyweight pool of shared properties indexed by their class and field
+    # values. Entries are removed when no object uses the property anymore.
+    _shared_properties: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    # Field names of each property class, used to build the pool keys
+    _field_names: Dict[type[Property], Tuple[str, ...]] = {}
+
+    @classmethod
+    def shared(cls, property: Property) -> Property:
+        """
+        Flyweight class method for PROTEUS properties. It returns the shared
+        instance of the given property if an identical property was already
+        shared, otherwise the given property becomes the shared instance.
+
+        Properties are immutable, so identical properties of different
+        objects (e.g. empty comments, same enum values) can be the same
+        instance. Properties with unhashable values (e.g. traces and class
+        lists) are not shared.
+
+        :param property: property to be shared.
+        :return: shared property identical to the given one.
+        """
+        property_class: type[Property] = property.__class__
+        field_names = cls._field_names.get(property_class)
+        if field_names is None:
+            field_names = tuple(field.name for field in dataclasses.fields(property))
+            cls._field_names[property_class] = field_names
+
+        key = (property_class, *(getattr(property, name) for name in field_names))
+        try:
+            return cls._shared_properties.setdefault(key, property)
+        except TypeError:
+            # Unhashable value
+            return property
+
     @classmethod
     def create(cls, element: ET._Element) -> Property | None:
         """
@@ -118,11 +156,15 @@ class PropertyFactory:
             )
             return None
 
+        # NOTE: Names, categories, tooltips and trace types are repeated in
+        # every object of the same class, they are interned so properties
+        # share the same strings
+
         # Get name (checked in property constructors)
-        name = element.attrib.get(NAME_ATTRIBUTE)
+        name = _intern(element.attrib.get(NAME_ATTRIBUTE))
 
         # Get category (checked in property constructors)
-        category = element.attrib.get(CATEGORY_ATTRIBUTE)
+        category = _intern(element.attrib.get(CATEGORY_ATTRIBUTE))
 
         # Get required (checked in property constructors)
         required_str = element.attrib.get(REQUIRED_ATTRIBUTE, "false")
@@ -133,7 +175,7 @@ class PropertyFactory:
         inmutable: bool = True if inmutable_str.lower() == "true" else False
 
         # Get tooltip (checked in property constructors)
-        tooltip = element.attrib.get(TOOLTIP_ATTRIBUTE, str())
+        tooltip = sys.intern(element.attrib.get(TOOLTIP_ATTRIBUTE, str()))
 
         # Get value (checked in property constructors)
         if property_class is ClassListProperty:
@@ -181,7 +223,9 @@ class PropertyFactory:
         # Special case: traceProperty
         if property_class is TraceProperty:
             # We need to collect its trace type, max targets number and accepted targets
-            trace_type = element.attrib.get(TRACE_TYPE_ATTRIBUTE, DEFAULT_TRACE_TYPE)
+            trace_type = sys.intern(
+                element.attrib.get(TRACE_TYPE_ATTRIBUTE, DEFAULT_TRACE_TYPE)
+            )
 
             accepted_targets: List = element.attrib.get(
                 ACCEPTED_TARGETS_ATTRIBUTE, PROTEUS_ANY
@@ -216,3 +260,17 @@ class PropertyFactory:
 
         # Ordinary case: rest of property classes
         return property_class(name, category, value, tooltip, required, inmutable)
+
+
+# --------------------------------------------------------------------------
+# Function: _intern
+# Description: It interns a string attribute value if it is not None.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def _intern(value: str | None) -> str | None:
+    """
+    It interns the given attribute value, None values are returned as is.
+    """
+    return None if value is None else sys.intern(value)
@@ -158,17 +158,17 @@ class TraceProperty(Property):
             object.__setattr__(self, "value", self.value[: self.max_targets_number])
 
     # --------------------------------------------------------------------------
-    # Method: generate_xml
+    # Method: _generate_xml
     # Description: This template method generates the XML element for the trace.
     # Date: 23/10/2023
-    # Version: 0.1
+    # Version: 0.2
     # Author: José María Delgado Sánchez
     # --------------------------------------------------------------------------
-    def generate_xml(self) -> ET._Element:
+    def _generate_xml(self) -> ET._Element:
         """
         This template method generates the XML element for the trace.
         """
-        trace_property_element: ET._Element = super().generate_xml()
+        trace_property_element: ET._Element = super()._generate_xml()
 
         trace_property_element.set(
             ACCEPTED_TARGETS_ATTRIBUTE, " ".join(self.acceptedTargets)
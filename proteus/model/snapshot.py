@@ -0,0 +1,249 @@
+# ==========================================================================
+# File: snapshot.py
+# Description: On-disk snapshot cache of the parsed objects of a project
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+from __future__ import annotations  # it has to be the first import
+
+import gc
+import os
+import pickle
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Tuple
+
+# --------------------------------------------------------------------------
+# Project specific imports (starting from root)
+# --------------------------------------------------------------------------
+
+from proteus import PROTEUS_SNAPSHOTS_DIR, PROTEUS_MAX_SNAPSHOTS
+from proteus.model import ProteusID
+
+# logging configuration
+log = logging.getLogger(__name__)
+
+# Snapshot format version. It must be increased every time the snapshot
+# content changes (e.g. new object attributes) to discard old snapshots.
+SNAPSHOT_VERSION: int = 1
+
+# Snapshot entry type (file mtime in ns, file size, object snapshot state)
+SnapshotEntry = Tuple[int, int, dict]
+
+
+# --------------------------------------------------------------------------
+# Class: ProjectSnapshot
+# Description: Snapshot cache of the parsed objects of a project
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+class ProjectSnapshot:
+    """
+    Snapshot cache of the parsed objects of a project. It stores, for each
+    object file, the data obtained from the XML file (ids, classes, children
+    ids and decoded properties) so objects can be created again without
+    parsing their files.
+
+    Entries are validated by the file mtime and size. Stale entries are
+    ignored, the object is parsed and the entry is replaced.
+
+    Snapshots are stored in the PROTEUS temporal directory, one file per
+    project path. If a snapshot cannot be read it is discarded and every
+    object is parsed from its XML file.
+    """
+
+    # ----------------------------------------------------------------------
+    # Method     : __init__
+    # Description: Class constructor.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def __init__(
+        self, snapshot_path: Path, entries: Dict[ProteusID, SnapshotEntry] = None
+    ) -> None:
+        """
+        Class constructor.
+
+        :param snapshot_path: Path to the snapshot file.
+        :param entries: Entries read from the snapshot file.
+        """
+        self.path: Path = snapshot_path
+
+        # Entries read from the snapshot file
+        self._entries: Dict[ProteusID, SnapshotEntry] = entries or {}
+
+        # Valid entries of the current session, only these are saved so
+        # entries of deleted objects are dropped
+        self._used_entries: Dict[ProteusID, SnapshotEntry] = {}
+
+        self.modified: bool = False
+
+    # ----------------------------------------------------------------------
+    # Method     : load (static)
+    # Description: Loads the snapshot of a project.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def load(project_path: str) -> ProjectSnapshot:
+        """
+        Loads the snapshot of the project located in the given path. If the
+        snapshot does not exist, it is corrupt or it was created by another
+        snapshot version, an empty snapshot is returned.
+
+        :param project_path: Path to the project directory.
+        :return: Project snapshot.
+        """
+        snapshot_path: Path = ProjectSnapshot.snapshot_path(project_path)
+        entries: Dict[ProteusID, SnapshotEntry] = {}
+
+        if snapshot_path.exists():
+            # NOTE: Unpickling creates a large number of objects that trigger
+            # the garbage collector repeatedly, it is disabled while loading
+            gc_enabled: bool = gc.isenabled()
+            gc.disable()
+            try:
+                with open(snapshot_path, "rb") as file:
+                    data: dict = pickle.load(file)
+
+                assert (
+                    data["version"] == SNAPSHOT_VERSION
+                ), f"snapshot version {data['version']} is not {SNAPSHOT_VERSION}"
+
+                entries = data["objects"]
+                log.info(
+                    f"Loaded project snapshot '{snapshot_path}' with {len(entries)} objects."
+                )
+            except Exception as e:
+                log.warning(
+                    f"Discarding project snapshot '{snapshot_path}', it could not be read: {e}"
+                )
+                entries = {}
+                snapshot_path.unlink(missing_ok=True)
+            finally:
+                if gc_enabled:
+                    gc.enable()
+
+        return ProjectSnapshot(snapshot_path, entries)
+
+    # ----------------------------------------------------------------------
+    # Method     : snapshot_path (static)
+    # Description: Returns the snapshot file path of a project.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def snapshot_path(project_path: str) -> Path:
+        """
+        Returns the snapshot file path of the project located in the given
+        path. The file name is the hash of the project absolute path.
+
+        :param project_path: Path to the project directory.
+        :return: Snapshot file path.
+        """
+        resolved_path: str = Path(project_path).resolve().as_posix()
+        name: str = hashlib.blake2b(resolved_path.encode(), digest_size=16).hexdigest()
+        return PROTEUS_SNAPSHOTS_DIR / f"{name}.pickle"
+
+    # ----------------------------------------------------------------------
+    # Method     : get
+    # Description: Returns the snapshot state of an object if it is valid.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def get(self, object_id: ProteusID, stat: os.stat_result) -> dict | None:
+        """
+        Returns the snapshot state of the given object if the file mtime
+        and size match the stored ones, None otherwise.
+
+        :param object_id: Id of the object.
+        :param stat: Stat result of the object file.
+        :return: Object snapshot state or None.
+        """
+        entry: SnapshotEntry = self._entries.get(object_id)
+        if (
+            entry is None
+            or entry[0] != stat.st_mtime_ns
+            or entry[1] != stat.st_size
+        ):
+            return None
+
+        self._used_entries[object_id] = entry
+        return entry[2]
+
+    # ----------------------------------------------------------------------
+    # Method     : put
+    # Description: Stores the snapshot state of an object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def put(self, object_id: ProteusID, stat: os.stat_result, state: dict) -> None:
+        """
+        Stores the snapshot state of the given object along with its file
+        mtime and size.
+
+        :param object_id: Id of the object.
+        :param stat: Stat result of the object file.
+        :param state: Object snapshot state.
+        """
+        self._used_entries[object_id] = (stat.st_mtime_ns, stat.st_size, state)
+        self.modified = True
+
+    # ----------------------------------------------------------------------
+    # Method     : save
+    # Description: Saves the snapshot to disk.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def save(self) -> None:
+        """
+        Saves the entries used in the current session to the snapshot file
+        if they changed. The file is written to a temporal file first and
+        then replaced, so a failed write never leaves a corrupt snapshot.
+
+        Old snapshots are removed keeping PROTEUS_MAX_SNAPSHOTS files.
+        """
+        if not self.modified and self._used_entries.keys() == self._entries.keys():
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            temporal_path: Path = self.path.with_suffix(".tmp")
+            with open(temporal_path, "wb") as file:
+                pickle.dump(
+                    {"version": SNAPSHOT_VERSION, "objects": self._used_entries},
+                    file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temporal_path, self.path)
+        except Exception as e:
+            log.error(f"Project snapshot '{self.path}' could not be saved: {e}")
+            return
+
+        self._entries = dict(self._used_entries)
+        self.modified = False
+        log.info(
+            f"Saved project snapshot '{self.path}' with {len(self._entries)} objects."
+        )
+
+        # Remove old snapshots
+        snapshots = sorted(
+            self.path.parent.glob("*.pickle"), key=os.path.getmtime, reverse=True
+        )
+        for old_snapshot in snapshots[PROTEUS_MAX_SNAPSHOTS:]:
+            old_snapshot.unlink(missing_ok=True)
@@ -41,6 +41,10 @@ XSLT_ENTRY_POINTS_TAG        = "entryPoints"
 XSLT_ENTRY_POINT_TAG         = "entryPoint"
 XSLT_DEPENCENCIES_TAG        = "dependencies"
 XSLT_PLUGIN_DEPENDENCY_TAG   = "pluginDependency"
+XSLT_FRAGMENT_UPDATES_TAG    = "fragmentUpdates"
+XSLT_FULL_RELOAD_CLASS_TAG   = "fullReloadClass"
+XSLT_FULL_RELOAD_DOC_CLASS_TAG = "fullReloadDocumentClass"
+XSLT_FULL_RELOAD_CHILDREN_CLASS_TAG = "fullReloadChildrenClass"
 
 XSLT_NAME_ATTRIBUTE      = "name"
 XSLT_LANGUAGE_ATTRIBUTE  = "language"
@@ -64,6 +68,10 @@ class Template:
     default_entrypoint: Path = None
     entrypoints: Dict[str, Path] = None
     plugin_dependencies: List[str] = None
+    fragment_updates: bool = False
+    full_reload_classes: List[str] = None
+    full_reload_document_classes: List[str] = None
+    full_reload_children_classes: List[str] = None
 
     # ----------------------------------------------------------------------
     # Method     : load
@@ -103,6 +111,7 @@ class Template:
 
         template._load_entrypoints()
         template._load_dependencies()
+        template._load_fragment_updates()
 
         log.info(f"Template '{template_name}' loaded from {template_path}")
 
@@ -203,3 +212,56 @@ class Template:
             # Add the template dependency to the list
             self.plugin_dependencies.append(dependency_name)
 
+    # ----------------------------------------------------------------------
+    # Method     : _load_fragment_updates
+    # Description: Loads template fragment updates configuration from the
+    #              template configuration file.
+    # Date       : 16/10/2026
+    # Version    : 0.2
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _load_fragment_updates(self) -> None:
+        """
+        Loads template fragment updates configuration from the template
+        configuration file. The fragmentUpdates tag is optional, if it is
+        not found the views rendered with the template are always fully
+        reloaded when an object is modified.
+
+        fullReloadClass tags list the classes of the objects whose
+        modification affects other parts of the document (table of contents,
+        glossary, etc.). fullReloadDocumentClass tags list the classes of the
+        objects that depend on the rest of the document (traceability
+        matrices, etc.), a document that contains any of them is always
+        fully reloaded. fullReloadChildrenClass tags list the classes of the
+        objects whose templates render their descendants (tables of
+        children, etc.), so their descendants are rendered differently
+        inside the document and on their own.
+        """
+        self.fragment_updates: bool = False
+        self.full_reload_classes: List[str] = []
+        self.full_reload_document_classes: List[str] = []
+        self.full_reload_children_classes: List[str] = []
+
+        root: ET._Element = ET.parse(self.path / TEMPLATE_CONFIG_FILE).getroot()
+
+        # Get the fragment updates tag
+        fragment_updates: ET._Element = root.find(XSLT_FRAGMENT_UPDATES_TAG)
+        if fragment_updates is None:
+            return
+
+        self.fragment_updates = True
+
+        for tag, classes in [
+            (XSLT_FULL_RELOAD_CLASS_TAG, self.full_reload_classes),
+            (XSLT_FULL_RELOAD_DOC_CLASS_TAG, self.full_reload_document_classes),
+            (XSLT_FULL_RELOAD_CHILDREN_CLASS_TAG, self.full_reload_children_classes),
+        ]:
+            for class_element in fragment_updates.findall(tag):
+                class_name = class_element.get(XSLT_NAME_ATTRIBUTE)
+
+                # Check xml is well formed
+                assert (
+                    class_name is not None and class_name != ""
+                ), f"Name attribute not found in {tag} tag for template {self.path}"
+
+                classes.append(class_name)
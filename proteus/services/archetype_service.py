@@ -34,6 +34,7 @@ from proteus.model import (
 from proteus.model.project import Project
 from proteus.model.object import Object
 from proteus.model.archetype_repository import ArchetypeRepository
+from proteus.model.properties.code_property import ProteusCode
 
 # logging configuration
 log = logging.getLogger(__name__)
@@ -291,10 +292,9 @@ class ArchetypeService:
             # archetype class must be explicitly in acceptedChildren
             # NOTE: This is done to avoid showing all the accepted archetypes,
             # sections accept :Proteus-any so the list would be huge
-            accepted_children_common_classes = [
-                c for c in object.acceptedChildren if c in archetype.classes
-            ]
-            condition_2: bool = len(accepted_children_common_classes) > 0
+            condition_2: bool = not set(object.acceptedChildren).isdisjoint(
+                archetype.classes
+            )
 
             # If BOTH conditions are met, add the archetype to its corresponding list
             if condition_1 and condition_2:
@@ -396,11 +396,19 @@ class ArchetypeService:
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def create_object(
-        self, archetype_id: ProteusID, parent: Object, project: Project
+        self,
+        archetype_id: ProteusID,
+        parent: Object,
+        project: Project,
+        codes_map: Dict[str, ProteusCode] = None,
     ) -> Object:
         """
         Creates a new object/document from an archetype given the new parent,
         project and an archetype id.
+
+        If the biggest code for each prefix in the project is given, it is
+        used to calculate the codes of the new objects instead of traversing
+        the project.
         """
         # Get the object archetype
         object_archetype = self._get_archetype_by_id(archetype_id)
@@ -411,7 +419,7 @@ class ArchetypeService:
         ), f"Archetype with id {archetype_id} is not an object archetype"
 
         # Create the object from the archetype
-        return object_archetype.clone_object(parent, project)
+        return object_archetype.clone_object(parent, project, codes_map=codes_map)
 
     # ======================================================================
     # Methods for storing objects as archetypes
@@ -461,6 +469,7 @@ class ArchetypeService:
         # Normal copy is fine since we just modify id and reference list
         archetype = copy.copy(object)
         archetype.id = proteus_id
+        archetype.increase_version()
 
         if not include_children:
             archetype._children = []
@@ -521,6 +530,7 @@ class ArchetypeService:
         # Normal copy is fine since we just modify id and reference list
         archetype = copy.copy(document)
         archetype.id = proteus_id
+        archetype.increase_version()
 
         # Add the archetype to the document archetypes
         ArchetypeRepository.store_document_archetype(
@@ -11,7 +11,9 @@
 # --------------------------------------------------------------------------
 
 import logging
-from typing import Union, List, Dict, Set
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, List, Dict, Set, Tuple, Iterable
 
 # --------------------------------------------------------------------------
 # Third-party library imports
@@ -25,20 +27,30 @@ import lxml.etree as ET
 
 from proteus.model import (
     ProteusID,
-    ID_ATTRIBUTE,
-    CHILD_TAG,
+    CHILDREN_TAG,
     DOCUMENT_TAG,
+    DOCUMENTS_TAG,
+    REFERENCES_TAG,
+    OBJECT_TAG,
+    PROPERTIES_TAG,
+    ID_ATTRIBUTE,
+    CLASSES_ATTRIBUTE,
     ProteusClassTag,
     PROTEUS_ANY,
     PROTEUS_NONE,
     PROTEUS_DOCUMENT,
     PROTEUS_NAME,
     PROTEUS_CODE,
+    PROTEUS_LINK,
 )
 from proteus.model.project import Project
 from proteus.model.object import Object
 from proteus.model.abstract_object import ProteusState
-from proteus.model.properties import Property, TraceProperty
+from proteus.model.properties import Property, TraceProperty, CodeProperty
+from proteus.model.properties.code_property import ProteusCode
+from proteus.services.trace_graph_service import TraceGraphService
+from proteus.application.metrics import Metrics
+from proteus.application.configuration.config import Config
 
 # logging configuration
 log = logging.getLogger(__name__)
@@ -78,12 +90,57 @@ class ProjectService:
 
         - traces_index: Dictionary with the traces with the following
         structure: {key: target, value: set of sources}. It is initialized
-        when the project is loaded via _load_traces_index method.
+        when the project is loaded via _load_traces_index method. Updated
+        incrementally via _update_traces_index method.
+
+        - traces_targets: Dictionary with the targets of each source that
+        are stored in the traces index {key: source, value: set of targets}.
+        It is used to update the traces index incrementally.
+
+        - trace_graph: Typed graph of the project traces. It is updated
+        along with the traces index.
+
+        - classes_index: Inverted index with the ids of the non DEAD objects
+        of each class {key: class, value: set of ids}. It is initialized
+        when the project is loaded via _load_classes_index method. Updated
+        incrementally via _update_classes_index method.
+
+        - indexed_classes: Classes stored in the classes index for each
+        object {key: id, value: tuple of classes}. It is used to update the
+        classes index incrementally.
+
+        - main_classes: Counter of the main class (last class) of the non
+        DEAD objects. Used to get the project available classes.
+
+        - codes_index: Codes of the non DEAD elements by prefix {key: prefix,
+        value: counter of (number, suffix)}. It is initialized when the
+        project is loaded via _load_codes_index method. Updated
+        incrementally via _update_codes_index method.
+
+        - indexed_codes: Codes stored in the codes index for each element
+        {key: id, value: tuple of codes}. It is used to update the codes
+        index incrementally.
+
+        - biggest_codes: Biggest code of each prefix in the codes index
+        {key: prefix, value: code}. Used to calculate the next codes when
+        cloning objects.
         """
         # Instance variables
         self.project: Project = None
         self.project_index: Dict[ProteusID, Union[Object, Project]] = {}
         self.traces_index: Dict[ProteusID, Set[ProteusID]] = {}
+        self.traces_targets: Dict[ProteusID, Set[ProteusID]] = {}
+        self.trace_graph: TraceGraphService = TraceGraphService()
+        self.classes_index: Dict[ProteusClassTag, Set[ProteusID]] = {}
+        self.indexed_classes: Dict[ProteusID, Tuple[ProteusClassTag, ...]] = {}
+        self.main_classes: Counter = Counter()
+        self.codes_index: Dict[str, Counter] = {}
+        self.indexed_codes: Dict[ProteusID, Tuple[ProteusCode, ...]] = {}
+        self.biggest_codes: Dict[str, ProteusCode] = {}
+
+        # Position of each object in the project index, used to return
+        # the objects of the classes index in project order
+        self._index_positions: Dict[ProteusID, int] = {}
 
         log.info("ProjectService initialized.")
 
@@ -92,19 +149,43 @@ class ProjectService:
     # Description: Initializes the project service with the given project
     #              path.
     # Date       : 06/05/2023
-    # Version    : 0.1
+    # Version    : 0.3
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
-    def load_project(self, project_path: str):
+    def load_project(
+        self, project_path: str, loading_threads: int = None, use_snapshot: bool = None
+    ):
         """
         Initializes the project service with the given project path. Force
         the load of every object in the project to store it in a dictionary
         for easy access.
 
+        If more than one loading thread is used, object files are parsed
+        concurrently via _load_objects_parallel method before populating
+        the index.
+
+        If the snapshot cache is used, unchanged objects are restored from
+        the project snapshot instead of parsing their files. The snapshot is
+        updated once every object is loaded.
+
         :param project_path: Path to the project directory.
+        :param loading_threads: Number of threads used to parse object files.
+        If None, the loading_threads app setting is used.
+        :param use_snapshot: Use the project snapshot cache. If None, the
+        snapshot_cache app setting is used.
         """
+        if loading_threads is None:
+            loading_threads = Config().app_settings.loading_threads
+
+        if use_snapshot is None:
+            use_snapshot = Config().app_settings.snapshot_cache
+
         # Load project
-        self.project = Project.load(project_path)
+        self.project = Project.load(project_path, use_snapshot)
+
+        # Load every object file concurrently
+        if loading_threads > 1:
+            self._load_objects_parallel(loading_threads)
 
         # Initialize project index
         self.project_index = {}
@@ -115,8 +196,69 @@ class ProjectService:
         # Load traces index
         self._load_traces_index()
 
+        # Load classes index
+        self._load_classes_index()
+
+        # Load codes index
+        self._load_codes_index()
+
+        # Store the parsed objects in the snapshot
+        if self.project.snapshot is not None:
+            self.project.snapshot.save()
+
         log.info(f"Project '{self.project.get_property(PROTEUS_NAME).value}' loaded.")
 
+    # ----------------------------------------------------------------------
+    # Method     : _load_objects_parallel
+    # Description: Helper method that loads every object of the project
+    #              using a thread pool.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _load_objects_parallel(self, loading_threads: int) -> None:
+        """
+        Loads every object of the project breadth first. The objects of each
+        level of the tree are parsed concurrently in a bounded thread pool
+        (lxml releases the GIL while parsing) and the children ids captured
+        in the first parse are used to discover the next level.
+
+        Children lists are built in the same order as the on demand loading,
+        so the project index populated afterwards is the same.
+
+        :param loading_threads: Maximum number of threads of the pool.
+        """
+        # Pairs of (parent, child id) of the current tree level
+        self.project._documents = []
+        level: List[tuple] = [
+            (self.project, document_id) for document_id in self.project._documents_ids
+        ]
+
+        with ThreadPoolExecutor(max_workers=loading_threads) as executor:
+            while level:
+                objects: List[Object] = list(
+                    executor.map(
+                        lambda pair: Object.load(pair[1], self.project), level
+                    )
+                )
+
+                next_level: List[tuple] = []
+                for (parent, _), object in zip(level, objects):
+                    object.parent = parent
+                    parent.get_descendants().append(object)
+
+                    # Children are loaded in the next level
+                    object._children = []
+                    next_level.extend(
+                        (object, child_id) for child_id in object._children_ids
+                    )
+
+                level = next_level
+
+        log.info(
+            f"Project objects loaded using {loading_threads} threads."
+        )
+
     # ----------------------------------------------------------------------
     # Method     : _get_element
     # Description: Helper method that returns the project or object with
@@ -129,13 +271,25 @@ class ProjectService:
         """
         Returns the project or object with the given id.
 
-        Raises an exception if the element is not found.
+        Raises an exception if the element is not found. The project ids
+        set is checked before populating the index, so ids that do not
+        exist in the project fail without traversing the project.
+
+        New objects are expected to be added via add_to_index method, the
+        index is only populated if an object of the project was not added.
 
         :param element_id: Id of the project or object.
         :return: Project or object with the given id.
         """
-        # Populate index to check for new objects
-        if element_id not in self.project_index:
+        # Populate index to check for new objects not added to the index
+        if (
+            element_id not in self.project_index
+            and self.project is not None
+            and element_id in self.project.ids
+        ):
+            log.warning(
+                f"Element with id {element_id} was not added to the project index, populating the whole index."
+            )
             self._populate_index()
 
         # Check if the element is in the index
@@ -161,87 +315,365 @@ class ProjectService:
         If an object was already in the index, it will be ignored.
         """
 
-        def _populate_index_private(object: Object) -> None:
-            """
-            Private helper method that populates the project index with
-            the all the objects in the project recursively.
-
-            :param object: Object to add to the index.
-            """
-            # If the object is not in the index, add it
-            if object.id not in self.project_index:
-                self.project_index[object.id] = object
-
-            # Add children to the index
-            for child in object.get_descendants():
-                _populate_index_private(child)
-
         # Load project index, this forces load for
         # every object in the project
         for document in self.project.get_descendants():
-            _populate_index_private(document)
+            for object in document.walk_preorder():
+                # If the object is not in the index, add it
+                if object.id not in self.project_index:
+                    self.project_index[object.id] = object
 
         # Include project in the index if it is not there
         if self.project.id not in self.project_index:
             self.project_index[self.project.id] = self.project
 
+    # ----------------------------------------------------------------------
+    # Method     : add_to_index
+    # Description: Adds an object and its descendants to the project index.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def add_to_index(self, object: Object) -> None:
+        """
+        Adds the given object and its descendants to the project index. It
+        must be called when new objects are added to the project (clone
+        operations) before refreshing the indexes, so the project index is
+        not populated from scratch.
+
+        :param object: New object of the project.
+        """
+        for descendant in object.walk_preorder():
+            self.project_index.setdefault(descendant.id, descendant)
+
     # ----------------------------------------------------------------------
     # Method     : _load_traces_index
     # Description: Helper method that loads the traces index with the
     #              traces of all the objects in the project.
     # Date       : 27/10/2023
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def _load_traces_index(self) -> None:
         """
         Loads the traces index with the traces of all the objects in the
         project. This method loads the traces index from scratch, so it
-        could impact performance.
+        could impact performance. Once loaded, the traces index is updated
+        incrementally via _update_traces_index method.
 
         The traces index has the following structure: {key: target, value: set of sources}.
         This structure is the opposite of the one used in Traces, where the source
         contains a list of targets. This way is easier to check on delete operations.
 
-        If a target is DEAD, it will be ignored in the traces index. This allows to
-        the sources to be deleted. This is a consistency problem in the project.
+        DEAD sources are not included in the traces index. DEAD or
+        nonexistent targets are ignored in the traces index so they can be
+        deleted. Traces targeting them are logged since they are a
+        consistency problem in the project.
         """
         # Initialize traces index
         self.traces_index = {}
+        self.traces_targets = {}
+        self.trace_graph.clear()
 
         # Iterate over all objects in the project using the project index
-        for object in self.project_index.values():
-            # Store all non DEAD targeted objects by the current object
-            targets: Set[ProteusID] = set()
+        for object_id in self.project_index.keys():
+            self._update_traces_index(object_id)
+
+        # Check for traces targeting DEAD or nonexistent objects
+        dead_targets: Dict[ProteusID, Set[ProteusID]] = {}
+        for source_id, targets in self.traces_targets.items():
+            for target in targets:
+                if not self._is_alive(target):
+                    dead_targets.setdefault(target, set()).add(source_id)
+
+        for target, sources in dead_targets.items():
+            log.error(
+                f"Found a Trace in objects '{sources}' targeting a DEAD or nonexistent object '{target}'. "
+                f"Target '{target}' will be ignored in the traces index so it can be deleted. "
+                "Check for project inconsistencies, this might affect the project integrity. "
+            )
+
+    # ----------------------------------------------------------------------
+    # Method     : _update_traces_index
+    # Description: Helper method that updates the traces index entries of
+    #              the given source object.
+    # Date       : 16/10/2026
+    # Version    : 0.2
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _update_traces_index(self, source_id: ProteusID) -> None:
+        """
+        Updates the traces index entries of the given source object. The
+        current targets of the source traces are compared with the targets
+        stored in the index, so only the differences are added or removed.
+
+        DEAD objects, the project and objects that are not in the project
+        index do not have targets, so they are removed from the traces index.
+        DEAD or nonexistent targets are not added to the traces index, they
+        are kept in traces_targets and the trace graph so they are added if
+        they are revived (see refresh_indexes).
+
+        The trace graph is updated with the targets by trace type.
+
+        :param source_id: Id of the source object.
+        """
+        source: Object = self.project_index.get(source_id)
+
+        # Calculate current targets of the source
+        new_targets: Set[ProteusID] = set()
+        targets_by_type: Dict[str, Set[ProteusID]] = {}
+        if isinstance(source, Object) and source.state != ProteusState.DEAD:
+            for trace in source.get_traces():
+                new_targets.update(trace.value)
+                targets_by_type.setdefault(trace.type, set()).update(trace.value)
 
-            # Skip project
-            if object.id == self.project.id or object.state == ProteusState.DEAD:
+        self.trace_graph.update_source(source_id, targets_by_type)
+
+        old_targets: Set[ProteusID] = self.traces_targets.pop(source_id, set())
+
+        # Remove source from the targets it no longer points to
+        for target in old_targets - new_targets:
+            sources: Set[ProteusID] = self.traces_index.get(target)
+            if sources is not None:
+                sources.discard(source_id)
+                if not sources:
+                    self.traces_index.pop(target)
+
+        # Add source to its new non DEAD targets
+        for target in new_targets - old_targets:
+            if self._is_alive(target):
+                self.traces_index.setdefault(target, set()).add(source_id)
+
+        if new_targets:
+            self.traces_targets[source_id] = new_targets
+
+    # ----------------------------------------------------------------------
+    # Method     : refresh_indexes
+    # Description: Refreshes the indexes entries of the given objects.
+    # Date       : 16/10/2026
+    # Version    : 0.2
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def refresh_indexes(self, object_ids: Iterable[ProteusID]) -> None:
+        """
+        Refreshes the indexes entries of the given objects. It must be
+        called after objects are added to the project (see add_to_index
+        method) or after their state
+        changes from or to DEAD (delete, clone and their undo operations),
+        so DEAD objects are not taken into account in the indexes.
+
+        Objects meta model updates (classes or traces changes) must also
+        refresh the indexes of the object. Properties updates are handled
+        by update_properties method.
+
+        :param object_ids: Ids of the objects to refresh.
+        """
+        object_ids = list(object_ids)
+
+        # Make sure new objects are in the project index
+        for object_id in object_ids:
+            self._get_element_by_id(object_id)
+
+        for object_id in object_ids:
+            self._update_traces_index(object_id)
+            self._update_classes_index(object_id)
+            self._update_codes_index(object_id)
+
+        # Update the objects as targets, DEAD targets are removed from the
+        # traces index and non DEAD ones get the sources pointing to them
+        # (the trace graph also stores the sources of DEAD targets)
+        for object_id in object_ids:
+            if not self._is_alive(object_id):
+                self.traces_index.pop(object_id, None)
                 continue
-            # Iterate over object's traces
-            for trace in object.get_traces():
-                targets.update(trace.value)
 
-            # Include object in source set of all its targets
-            for target in targets:
-                # Check if the target is exists or is DEAD
-                try:
-                    target_object: Object = self._get_element_by_id(target)
-                    assert (
-                        target_object.state != ProteusState.DEAD
-                    ), f"Target object '{target}' is DEAD."
-                except:
-                    log.error(
-                        f"Found a Trace in object '{object.id}' targeting a DEAD object '{target}'. "
-                        f"Target '{target}' will be ignored in load_traces_index method so it can be deleted. "
-                        "Check for project inconsistencies, this might affect the project integrity. "
-                    )
-                    if target in self.traces_index:
-                        self.traces_index.pop(target)
+            sources: Set[ProteusID] = self.trace_graph.sources_of(object_id)
+            if sources:
+                self.traces_index.setdefault(object_id, set()).update(sources)
+
+    # ----------------------------------------------------------------------
+    # Method     : _load_classes_index
+    # Description: Helper method that loads the classes index with the
+    #              classes of all the objects in the project.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _load_classes_index(self) -> None:
+        """
+        Loads the classes index from scratch with the classes of all the
+        objects in the project index. Once loaded, the classes index is
+        updated incrementally via _update_classes_index method.
+        """
+        self.classes_index = {}
+        self.indexed_classes = {}
+        self.main_classes = Counter()
+        self._index_positions = {}
+
+        for object_id in self.project_index.keys():
+            self._update_classes_index(object_id)
+
+    # ----------------------------------------------------------------------
+    # Method     : _update_classes_index
+    # Description: Helper method that updates the classes index entries of
+    #              the given object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _update_classes_index(self, object_id: ProteusID) -> None:
+        """
+        Updates the classes index entries of the given object. The current
+        classes of the object are compared with the classes stored in the
+        index, so only the differences are added or removed.
+
+        DEAD objects, the project and objects that are not in the project
+        index are removed from the classes index.
+
+        :param object_id: Id of the object.
+        """
+        object: Object = self.project_index.get(object_id)
 
-                # Add object to the target's source set
-                if target not in self.traces_index:
-                    self.traces_index[target] = set()
-                self.traces_index[target].add(object.id)
+        new_classes: Tuple[ProteusClassTag, ...] = ()
+        if isinstance(object, Object) and object.state != ProteusState.DEAD:
+            new_classes = tuple(object.classes)
+            self._index_positions.setdefault(object_id, len(self._index_positions))
+
+        old_classes: Tuple[ProteusClassTag, ...] = self.indexed_classes.pop(
+            object_id, ()
+        )
+
+        if new_classes:
+            self.indexed_classes[object_id] = new_classes
+
+        if old_classes == new_classes:
+            return
+
+        # Remove object from the classes it no longer has
+        for object_class in set(old_classes) - set(new_classes):
+            ids: Set[ProteusID] = self.classes_index[object_class]
+            ids.discard(object_id)
+            if not ids:
+                self.classes_index.pop(object_class)
+
+        # Add object to its new classes
+        for object_class in set(new_classes) - set(old_classes):
+            self.classes_index.setdefault(object_class, set()).add(object_id)
+
+        # Update main classes counter
+        if old_classes:
+            self.main_classes[old_classes[-1]] -= 1
+            if self.main_classes[old_classes[-1]] <= 0:
+                del self.main_classes[old_classes[-1]]
+        if new_classes:
+            self.main_classes[new_classes[-1]] += 1
+
+    # ----------------------------------------------------------------------
+    # Method     : _load_codes_index
+    # Description: Helper method that loads the codes index with the codes
+    #              of all the elements in the project.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _load_codes_index(self) -> None:
+        """
+        Loads the codes index from scratch with the code properties of all
+        the elements in the project index. Once loaded, the codes index is
+        updated incrementally via _update_codes_index method.
+        """
+        self.codes_index = {}
+        self.indexed_codes = {}
+        self.biggest_codes = {}
+
+        for element_id in self.project_index.keys():
+            self._update_codes_index(element_id)
+
+    # ----------------------------------------------------------------------
+    # Method     : _update_codes_index
+    # Description: Helper method that updates the codes index entries of
+    #              the given element.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _update_codes_index(self, element_id: ProteusID) -> None:
+        """
+        Updates the codes index entries of the given project or object. The
+        current codes of the element are compared with the codes stored in
+        the index, so only the differences are added or removed.
+
+        The biggest code of a prefix is only recalculated when its last
+        occurrence is removed from the index.
+
+        DEAD objects and objects that are not in the project index are
+        removed from the codes index.
+
+        :param element_id: Id of the project or object.
+        """
+        element: Union[Project, Object] = self.project_index.get(element_id)
+
+        new_codes: Tuple[ProteusCode, ...] = ()
+        if element is not None and element.state != ProteusState.DEAD:
+            new_codes = tuple(
+                property.value
+                for property in element.properties.values_of_type(CodeProperty)
+            )
+
+        old_codes: Tuple[ProteusCode, ...] = self.indexed_codes.pop(element_id, ())
+
+        if new_codes:
+            self.indexed_codes[element_id] = new_codes
+
+        if old_codes == new_codes:
+            return
+
+        # Add the new codes before removing the old ones, so the biggest
+        # code is not recalculated when a code is replaced by a bigger one
+        for code in new_codes:
+            key: Tuple[int, str] = (int(code.number), code.suffix)
+            self.codes_index.setdefault(code.prefix, Counter())[key] += 1
+
+            biggest_code: ProteusCode = self.biggest_codes.get(code.prefix)
+            if biggest_code is None or key > (
+                int(biggest_code.number),
+                biggest_code.suffix,
+            ):
+                self.biggest_codes[code.prefix] = code
+
+        for code in old_codes:
+            key: Tuple[int, str] = (int(code.number), code.suffix)
+            codes: Counter = self.codes_index[code.prefix]
+            codes[key] -= 1
+            if codes[key] > 0:
+                continue
+
+            del codes[key]
+            if not codes:
+                self.codes_index.pop(code.prefix)
+                self.biggest_codes.pop(code.prefix)
+            elif self.biggest_codes[code.prefix] == code:
+                number, suffix = max(codes)
+                self.biggest_codes[code.prefix] = ProteusCode(
+                    code.prefix, number, suffix
+                )
+
+    # ----------------------------------------------------------------------
+    # Method     : get_biggest_codes
+    # Description: Returns the biggest code of each prefix in the project.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def get_biggest_codes(self) -> Dict[str, ProteusCode]:
+        """
+        Returns the biggest code of each prefix of the non DEAD elements of
+        the project. A copy of the codes index is returned, so it can be
+        updated while cloning objects.
+
+        :return: Dictionary with the biggest code for each prefix.
+        """
+        return self.biggest_codes.copy()
 
     # ----------------------------------------------------------------------
     # Method     : get_traces_dependencies
@@ -264,19 +696,11 @@ class ProjectService:
         # Dictionary to store the sources by object id
         sources: Dict[ProteusID, Set] = {}
 
-        # Skip if the object is DEAD
-        if object.state == ProteusState.DEAD:
-            return sources
-
-        # Check if the object has traces pointing to it
+        # Check if the object and its non DEAD descendants have traces pointing to them
         # IMPORTANT: Copy set to avoid modifying the original set of self.traces_index
-        if object_id in self.traces_index:
-            sources[object_id] = self.traces_index[object_id].copy()
-
-        # Check if the object has children, for each child check
-        # if it has traces pointing to it calling recursively
-        for child in object.get_descendants():
-            sources.update(self.get_traces_dependencies(child.id))
+        for descendant in object.walk_preorder(skip_dead=True):
+            if descendant.id in self.traces_index:
+                sources[descendant.id] = self.traces_index[descendant.id].copy()
 
         return sources
 
@@ -342,7 +766,7 @@ class ProjectService:
     # Method     : update_properties
     # Description: Updates the project or object properties.
     # Date       : 06/05/2023
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def update_properties(
@@ -354,22 +778,99 @@ class ProjectService:
         :param element_id: Id of the project or object.
         :param properties: List of properties to update.
         """
-        # Check properties is a list
-        assert isinstance(properties, list), "Properties must be a list."
+        self.update_properties_bulk({element_id: properties})
 
-        # Check properties are Property objects
-        assert all(
-            isinstance(property, Property) for property in properties
-        ), "Properties must be Property objects."
+    # ----------------------------------------------------------------------
+    # Method     : update_properties_bulk
+    # Description: Updates the properties of several projects or objects.
+    # Date       : 16/10/2026
+    # Version    : 0.2
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def update_properties_bulk(
+        self, properties_by_id: Dict[ProteusID, List[Property]]
+    ) -> None:
+        """
+        Updates the properties of several projects or objects. Every element
+        and property is checked before updating any element (the property
+        must exist in the element with the same type), so no element is
+        modified if any of them is not valid. The
+        indexes are updated once all the properties are set, only for the
+        elements whose traces or codes were updated.
+
+        :param properties_by_id: Properties to update of each element
+        {key: element id, value: list of properties}.
+        """
+        # Check every element and its properties before updating
+        elements: Dict[ProteusID, Union[Object, Project]] = {}
+        for element_id, properties in properties_by_id.items():
+            # Check properties is a list
+            assert isinstance(properties, list), "Properties must be a list."
 
-        # Get element by id
-        element = self._get_element_by_id(element_id)
+            # Check properties are Property objects
+            assert all(
+                isinstance(property, Property) for property in properties
+            ), "Properties must be Property objects."
 
-        # Check element is an object or project
-        assert isinstance(
-            element, (Object, Project)
-        ), f"Element with id {element_id} is not an object or project."
+            # Get element by id
+            element = self._get_element_by_id(element_id)
+
+            # Check element is an object or project
+            assert isinstance(
+                element, (Object, Project)
+            ), f"Element with id {element_id} is not an object or project."
+
+            # Check the properties can be set
+            for property in properties:
+                element.check_property(property)
+
+            elements[element_id] = element
+
+        # Elements whose indexes must be updated
+        traces_updated: List[ProteusID] = []
+        codes_updated: List[ProteusID] = []
+
+        for element_id, properties in properties_by_id.items():
+            self._discard_invalid_traces(element_id, properties)
+
+            element = elements[element_id]
+            for property in properties:
+                element.set_property(property)
+
+            if any(isinstance(p, TraceProperty) for p in properties):
+                traces_updated.append(element_id)
+
+            if any(isinstance(p, CodeProperty) for p in properties):
+                codes_updated.append(element_id)
 
+        # If TraceProperties were modified, update traces index
+        for element_id in traces_updated:
+            self._update_traces_index(element_id)
+
+        # If CodeProperties were modified, update codes index
+        for element_id in codes_updated:
+            self._update_codes_index(element_id)
+
+    # ----------------------------------------------------------------------
+    # Method     : _discard_invalid_traces
+    # Description: Helper method that discards the invalid targets of the
+    #              traces properties to update.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _discard_invalid_traces(
+        self, element_id: ProteusID, properties: List[Property]
+    ) -> None:
+        """
+        Discards the targets of the TraceProperties to update that are DEAD
+        objects, documents or the element itself. The given properties list
+        is updated, traces without valid targets are removed and traces with
+        some invalid targets are replaced.
+
+        :param element_id: Id of the project or object.
+        :param properties: List of properties to update.
+        """
         # Discard TraceProperties that are not valid
         discarded_traces = []
         new_traces = []
@@ -420,40 +921,36 @@ class ProjectService:
 
         properties.extend(new_traces)
 
-        for property in properties:
-            element.set_property(property)
-
-        # If TraceProperties were modified, update traces index
-        if len([p for p in properties if isinstance(p, TraceProperty)]) > 0:
-            self._load_traces_index()
-
     # ----------------------------------------------------------------------
     # Method     : save_project
     # Description: Saves the project to disk.
     # Date       : 06/05/2023
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
-    def save_project(self) -> None:
+    @Metrics.save_time_decorator
+    def save_project(self) -> int:
         """
         Saves the project to disk.
+
+        :return: Number of files written.
         """
-        self.project.save_project()
+        return self.project.save_project()
 
     # ----------------------------------------------------------------------
     # Method     : has_unsaved_changes
     # Description: Checks if the project has unsaved changes.
     # Date       : 25/01/2024
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def has_unsaved_changes(self) -> bool:
         """
         Checks if the project has unsaved changes.
 
-        Iterates over the project index and checks if any object is not in
-        CLEAN state. Returns True in the first object found with unsaved
-        changes.
+        Uses the project registry of objects in DIRTY or FRESH state, which
+        is updated on every state change, so the check does not depend on
+        the project size.
 
         NOTE: DEAD objects are not considered as unsaved changes. They are kept
         in the project index even if they are deleted. This will allow to restore
@@ -462,14 +959,10 @@ class ProjectService:
 
         :return: True if the project has unsaved changes, False otherwise.
         """
-        for object in self.project_index.values():
-            if object.state != ProteusState.CLEAN and object.state != ProteusState.DEAD:
-                log.debug(
-                    f"Found object '{object.id}' with unsaved changes. Object state: {object.state}"
-                )
-                return True
+        if self.project is None:
+            return False
 
-        return False
+        return len(self.project.unsaved_objects) > 0
 
     # ----------------------------------------------------------------------
     # Method     : get_object_structure
@@ -545,7 +1038,7 @@ class ProjectService:
     # Method     : get_project_available_classes
     # Description: Returns the available classes in the project.
     # Date       : 06/02/2024
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def get_project_available_classes(
@@ -555,22 +1048,15 @@ class ProjectService:
         Get all the available classes currently in the project. If include_subclasses
         is True, also include all the subclasses of the available.
 
+        Classes are taken from the classes index, so the cost depends on the
+        number of classes instead of the number of objects.
+
         :param include_subclasses: Include subclasses of the available classes.
         """
-        # Initialize an empty set for the classes
-        classes: Set[ProteusClassTag] = set()
-
-        # Iterate over all objects in the project
-        for object in self.project_index.values():
-            # Skip project and dead objects
-            if object.state == ProteusState.DEAD or object.id == self.project.id:
-                continue
-
-            # Add object classes or main class to the set
-            if include_subclasses:
-                classes.update(object.classes)
-            else:
-                classes.add(object.classes[-1])
+        # Classes of the non DEAD objects or their main classes
+        classes: Set[ProteusClassTag] = set(
+            self.classes_index.keys() if include_subclasses else self.main_classes.keys()
+        )
 
         # Remove special Proteus classes from the set if any
         classes.discard(PROTEUS_ANY)
@@ -583,7 +1069,7 @@ class ProjectService:
     # Method     : get_objects
     # Description: Returns objects in the project.
     # Date       : 25/10/2023
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def get_objects(self, classes: List[ProteusClassTag] = []) -> List[Object]:
@@ -599,39 +1085,25 @@ class ProjectService:
         :rtype: List[Object]
         """
 
-        # Variable initialization
-        objects: List[Object] = []
+        # Documents are stored in the classes index but they are not returned
+        documents: Set[ProteusID] = self.classes_index.get(PROTEUS_DOCUMENT, set())
 
         # if classes is empty, is None or contains :Proteus-any, return all objects
         if not classes or PROTEUS_ANY in classes:
-            # Iterate over project index and drop project and dead objects
-            for element in self.project_index.values():
-                if (
-                    isinstance(element, Object)
-                    and element.state != ProteusState.DEAD
-                    and PROTEUS_DOCUMENT not in element.classes
-                ):
-                    objects.append(element)
-
-        # else, filter objects by classes droping project and dead objects
+            ids: Set[ProteusID] = self.indexed_classes.keys() - documents
+
+        # else, join the ids of the desired classes using the classes index
         else:
-            object: Object
-            # Iterate over all objects in the project
-            for object in self.project_index.values():
-                if (
-                    object.state == ProteusState.DEAD
-                    or not isinstance(object, Object)
-                    or PROTEUS_DOCUMENT in object.classes
-                ):
-                    continue
-
-                # Get object classes
-                object_classes: List[ProteusClassTag] = object.classes
-
-                # Check for common classes between object classes and desired classes
-                common_classes = [c for c in classes if c in object_classes]
-                if common_classes:
-                    objects.append(object)
+            ids: Set[ProteusID] = set()
+            for object_class in classes:
+                ids.update(self.classes_index.get(object_class, ()))
+            ids -= documents
+
+        # Return objects in project index order
+        objects: List[Object] = [
+            self.project_index[id]
+            for id in sorted(ids, key=self._index_positions.__getitem__)
+        ]
 
         return objects
 
@@ -670,11 +1142,20 @@ class ProjectService:
         else:
             cloned_position: int = len(siblings)
 
-        # Clone object
-        return object.clone_object(
-            parent=new_parent, project=self.project, position=cloned_position
+        # Clone object using the codes index to calculate the next codes
+        cloned_object: Object = object.clone_object(
+            parent=new_parent,
+            project=self.project,
+            position=cloned_position,
+            codes_map=self.get_biggest_codes(),
         )
 
+        # Update indexes with the cloned objects
+        self.add_to_index(cloned_object)
+        self.refresh_indexes(cloned_object.get_ids())
+
+        return cloned_object
+
     # ----------------------------------------------------------------------
     # Method     : change_object_position
     # Description: Changes the position of the object with the given id.
@@ -770,6 +1251,9 @@ class ProjectService:
             if old_parent.state == ProteusState.CLEAN:
                 old_parent.state = ProteusState.DIRTY
 
+        # Old parent children list was modified
+        old_parent.increase_version()
+
     # ----------------------------------------------------------------------
     # Method     : check_position_change
     # Description: Check if an object can be moved to the given position.
@@ -896,54 +1380,265 @@ class ProjectService:
     # Method     : generate_project_xml
     # Description: Generates the xml file for the given document.
     # Date       : 04/06/2023
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def generate_project_xml(self) -> ET._Element:
         """
-        Generates the xml file for the actual project. Iterates until no
-        child tags are found. Replaces child tags with the xml of the child
-        object or document.
+        Generates the xml file for the actual project. The project tree is
+        traversed once, each non DEAD document and object element is
+        generated exactly once and placed where its document or child tag
+        was. DEAD objects and their descendants are skipped.
 
         :return: Root element of the xml file.
         :rtype: ET._Element
         """
-        # Generate project xml file
+        # Generate project xml file without document tags
         root: ET._Element = self.project.generate_xml()
-        # Iterate over document tag and replace the asked document
-        for document_element in root.findall(f".//{DOCUMENT_TAG}"):
-            parent_element: ET._Element = document_element.getparent()
-            document_id: ProteusID = document_element.attrib[ID_ATTRIBUTE]
-            document: Object = self._get_element_by_id(document_id)
-            document_xml: ET._Element = document.generate_xml()
-            parent_element.replace(document_element, document_xml)
-
-        # Iterate until no chil tags are found
-        while root.findall(f".//{CHILD_TAG}"):
-            # Load children
-            children = root.findall(f".//{CHILD_TAG}")
-
-            # Parse object's children
-            child_element: ET._Element
-            for child_element in children:
-                child_id: ProteusID = child_element.attrib[ID_ATTRIBUTE]
-
-                # Get child object
-                child: Object = self._get_element_by_id(child_id)
-
-                # Remove dead objects
+        documents_element: ET._Element = root.find(DOCUMENTS_TAG)
+        for document_element in documents_element.findall(DOCUMENT_TAG):
+            documents_element.remove(document_element)
+
+        # Generate every non DEAD document subtree
+        for document in self.project.get_descendants():
+            if document.state != ProteusState.DEAD:
+                documents_element.append(self._generate_object_tree_xml(document))
+
+        return root
+
+    # ----------------------------------------------------------------------
+    # Method     : generate_document_xml
+    # Description: Generates the xml file for the given document and the
+    #              objects referenced by its traces.
+    # Date       : 16/10/2026
+    # Version    : 0.2
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def generate_document_xml(self, document_id: ProteusID) -> ET._Element:
+        """
+        Generates the xml file for the given document. Unlike
+        generate_project_xml, only the given document subtree is generated,
+        the rest of the documents are not included in the <documents> tag.
+
+        Objects outside the document that are targeted by traces are
+        included in a <references> tag after the <documents> tag, so traces
+        can be resolved by the XSLT templates:
+            - Targets of link traces (symbolic links) are rendered in place,
+              they are included with their non DEAD descendants unless one
+              of their ancestors is already included. Their traces are
+              resolved too.
+            - The rest of the targets are included as stubs with their id,
+              classes, name, code and traces properties, without children
+              (see _generate_object_stub_xml). The targets of the stubs
+              traces are included as stubs too, so every trace found in
+              the xml can be resolved.
+
+        :param document_id: Id of the document to generate.
+        :return: Root element of the xml file.
+        :rtype: ET._Element
+        """
+        # Get document using helper method
+        document: Object = self._get_element_by_id(document_id)
+
+        # Check that the element is a document
+        assert isinstance(document, Object) and PROTEUS_DOCUMENT in document.classes, (
+            f"Element with id {document_id} is not a document."
+        )
+
+        # Generate project xml file without documents
+        root: ET._Element = self.project.generate_xml()
+        documents_element: ET._Element = root.find(DOCUMENTS_TAG)
+        for document_element in documents_element.findall(DOCUMENT_TAG):
+            documents_element.remove(document_element)
+
+        # Generate the document subtree
+        generated_ids: Set[ProteusID] = set()
+        targets: Set[ProteusID] = set()
+        link_targets: Set[ProteusID] = set()
+        documents_element.append(
+            self._generate_object_tree_xml(
+                document, generated_ids, targets, link_targets
+            )
+        )
+
+        references_element: ET._Element = ET.SubElement(root, REFERENCES_TAG)
+
+        # Generate the link targets subtrees until no new link target is
+        # found in the generated subtrees
+        while True:
+            pending_links: Set[ProteusID] = {
+                target_id
+                for target_id in link_targets - generated_ids
+                if self._is_alive(target_id)
+            }
+            if not pending_links:
+                break
+
+            for target_id in sorted(pending_links):
+                target: Object = self.project_index[target_id]
+
+                # Skip targets included in the subtree of a pending ancestor
+                ancestor = target.parent
+                while isinstance(ancestor, Object) and ancestor.id not in pending_links:
+                    ancestor = ancestor.parent
+
+                if not isinstance(ancestor, Object):
+                    references_element.append(
+                        self._generate_object_tree_xml(
+                            target, generated_ids, targets, link_targets
+                        )
+                    )
+
+        # Generate the stubs of the rest of the targets
+        stub_ids: List[ProteusID] = sorted(targets - generated_ids, reverse=True)
+        while stub_ids:
+            target_id: ProteusID = stub_ids.pop()
+            if target_id in generated_ids:
+                continue
+
+            generated_ids.add(target_id)
+            if not self._is_alive(target_id):
+                continue
+
+            stub_targets: Set[ProteusID] = set()
+            references_element.append(
+                self._generate_object_stub_xml(
+                    self.project_index[target_id], stub_targets
+                )
+            )
+            stub_ids.extend(sorted(stub_targets - generated_ids, reverse=True))
+
+        return root
+
+    # ----------------------------------------------------------------------
+    # Method     : _is_alive
+    # Description: Checks if the given id belongs to a non DEAD object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _is_alive(self, object_id: ProteusID) -> bool:
+        """
+        Checks if the given id belongs to a non DEAD object of the project.
+
+        :param object_id: Id of the object.
+        :return: True if the object exists and it is not DEAD.
+        """
+        object: Object = self.project_index.get(object_id)
+        return isinstance(object, Object) and object.state != ProteusState.DEAD
+
+    # ----------------------------------------------------------------------
+    # Method     : _generate_object_stub_xml
+    # Description: Generates the xml stub of a trace target.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _generate_object_stub_xml(
+        self, object: Object, targets: Set[ProteusID] = None
+    ) -> ET._Element:
+        """
+        Generates the xml stub of the given object. The stub includes the
+        id, classes, name, code and traces properties of the object and an
+        empty <children> tag, enough to resolve the traces that point to the
+        object. If given, the stub traces targets are collected in the
+        targets set.
+
+        :param object: Object to generate.
+        :param targets: Set to collect the stub traces targets.
+        :return: Object stub element.
+        :rtype: ET._Element
+        """
+        object_element: ET._Element = ET.Element(OBJECT_TAG)
+        object_element.set(ID_ATTRIBUTE, object.id)
+        object_element.set(CLASSES_ATTRIBUTE, " ".join(object.classes))
+
+        properties_element: ET._Element = ET.SubElement(
+            object_element, PROPERTIES_TAG
+        )
+        for property_name in (PROTEUS_NAME, PROTEUS_CODE):
+            if property_name in object.properties:
+                properties_element.append(
+                    object.get_property(property_name).generate_xml()
+                )
+
+        for trace in object.get_traces():
+            properties_element.append(trace.generate_xml())
+            if targets is not None:
+                targets.update(trace.value)
+
+        ET.SubElement(object_element, CHILDREN_TAG)
+
+        return object_element
+
+    # ----------------------------------------------------------------------
+    # Method     : _generate_object_tree_xml
+    # Description: Generates the xml of an object and its non DEAD
+    #              descendants.
+    # Date       : 16/10/2026
+    # Version    : 0.2
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _generate_object_tree_xml(
+        self,
+        object: Object,
+        ids: Set[ProteusID] = None,
+        targets: Set[ProteusID] = None,
+        link_targets: Set[ProteusID] = None,
+    ) -> ET._Element:
+        """
+        Generates the xml of the given object replacing its child tags with
+        the xml of its non DEAD descendants, without recursion. If given,
+        the ids of the generated objects, their traces targets and their
+        link traces targets are collected in the ids, targets and
+        link_targets sets.
+
+        :param object: Object to generate.
+        :param ids: Set to collect the generated objects ids.
+        :param targets: Set to collect the generated objects traces targets.
+        :param link_targets: Set to collect the link traces targets.
+        :return: Object element.
+        :rtype: ET._Element
+        """
+        root_element: ET._Element = None
+
+        # Objects to generate and the child tag they replace in the parent
+        # children element (None for the given object). An explicit stack
+        # is used so deep documents do not reach the recursion limit.
+        stack: List[Tuple[Object, ET._Element, ET._Element]] = [(object, None, None)]
+        while stack:
+            current, child_tag, parent_children_element = stack.pop()
+
+            object_element: ET._Element = current.generate_xml()
+            if parent_children_element is None:
+                root_element = object_element
+            else:
+                parent_children_element.replace(child_tag, object_element)
+
+            if ids is not None:
+                ids.add(current.id)
+            if targets is not None or link_targets is not None:
+                for trace in current.get_traces():
+                    if targets is not None:
+                        targets.update(trace.value)
+                    if link_targets is not None and trace.type == PROTEUS_LINK:
+                        link_targets.update(trace.value)
+
+            # Child tags are generated in the same order as the descendants
+            children_element: ET._Element = object_element.find(CHILDREN_TAG)
+            pending: List[Tuple[Object, ET._Element, ET._Element]] = []
+            for child_element, child in zip(
+                list(children_element), current.get_descendants()
+            ):
                 if child.state == ProteusState.DEAD:
-                    parent_element: ET._Element = child_element.getparent()
-                    parent_element.remove(child_element)
+                    children_element.remove(child_element)
                 else:
-                    # Generate xml file
-                    child_xml: ET._Element = child.generate_xml()
+                    pending.append((child, child_element, children_element))
 
-                    # Replace child element with xml
-                    parent_element: ET._Element = child_element.getparent()
-                    parent_element.replace(child_element, child_xml)
+            # Reversed so children are generated in document order
+            stack.extend(reversed(pending))
 
-        return root
+        return root_element
 
     # ----------------------------------------------------------------------
     # Method     : sort_children_by_name
@@ -10,8 +10,11 @@
 # Standard library imports
 # --------------------------------------------------------------------------
 
+import sys
 import logging
-from typing import List, Dict
+from threading import Lock
+from collections import OrderedDict
+from typing import List, Dict, Tuple
 from pathlib import Path
 
 # --------------------------------------------------------------------------
@@ -24,6 +27,7 @@ import lxml.etree as ET
 # Project specific imports (starting from root)
 # --------------------------------------------------------------------------
 
+from proteus.model import ProteusID, DOCUMENTS_TAG, OBJECT_TAG, ID_ATTRIBUTE
 from proteus.model.template import Template
 from proteus.application.resources.plugins import Plugins
 from proteus.application.configuration.config import Config
@@ -34,6 +38,21 @@ log = logging.getLogger(__name__)
 FUNCTION_NAMESPACE = "http://proteus.us.es/utils"
 NAMESPACE_PREFIX = "proteus-utils"
 
+# Render cache key: document id, template name, language and model version
+RenderCacheKey = Tuple[ProteusID, str, str, int]
+
+# Fragment stylesheet, imports the template entrypoint and applies the
+# templates only to the object with the given id inside the documents
+FRAGMENT_ID_PARAM = "proteus_fragment_id"
+FRAGMENT_STYLESHEET = f"""<xsl:stylesheet version="1.0"
+    xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
+    <xsl:import href="{{entrypoint}}"/>
+    <xsl:param name="{FRAGMENT_ID_PARAM}"/>
+    <xsl:template match="/">
+        <xsl:apply-templates select="/*/{DOCUMENTS_TAG}//{OBJECT_TAG}[@{ID_ATTRIBUTE}=${FRAGMENT_ID_PARAM}]"/>
+    </xsl:template>
+</xsl:stylesheet>"""
+
 # --------------------------------------------------------------------------
 # Class: RenderService
 # Description: Class for render service
@@ -61,10 +80,19 @@ class RenderService:
         """
         # Store the XSLT transformation objects
         self._transformations: Dict[str, ET.XSLT] = {}
+        self._fragment_transformations: Dict[str, ET.XSLT] = {}
 
         # Templates
         self._templates: Dict[str, Template] = {}
 
+        # Lock to avoid concurrent renders (render thread and GUI thread)
+        self._render_lock: Lock = Lock()
+
+        # Rendered HTML cache (LRU) and its size in bytes
+        self._html_cache: OrderedDict[RenderCacheKey, str] = OrderedDict()
+        self._html_cache_size: int = 0
+        self._html_cache_lock: Lock = Lock()
+
         # Namespace configuration for the XSLT functions
         self._namespace_configuration()
 
@@ -155,13 +183,7 @@ class RenderService:
                 template_name in self._templates
             ), f"Template {template_name} not found in the XSLT directory!"
 
-            # Use the default entrypoint if the language is not found
-            template = self._templates[template_name]
-            entrypoint: Path
-            if Config().app_settings.language in template.entrypoints:
-                entrypoint = template.entrypoints[Config().app_settings.language]
-            else:
-                entrypoint = template.default_entrypoint
+            entrypoint: Path = self._get_entrypoint(template_name)
 
             # Create the transformer from the xsl file
             transform = ET.XSLT(ET.parse(entrypoint.as_posix()))
@@ -172,6 +194,63 @@ class RenderService:
 
         return transform
 
+    # ----------------------------------------------------------------------
+    # Method     : _get_entrypoint
+    # Description: Get the entrypoint of the given template for the current
+    #              language.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _get_entrypoint(self, template_name: str) -> Path:
+        """
+        Get the entrypoint of the given template for the current language.
+        Use the default entrypoint if the language is not found.
+        """
+        assert (
+            template_name in self._templates
+        ), f"Template {template_name} not found in the XSLT directory!"
+
+        template = self._templates[template_name]
+        if Config().app_settings.language in template.entrypoints:
+            return template.entrypoints[Config().app_settings.language]
+
+        return template.default_entrypoint
+
+    # ----------------------------------------------------------------------
+    # Method     : _get_fragment_xslt
+    # Description: Get the XSLT transformation object that renders a single
+    #              object for the given template_name.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _get_fragment_xslt(self, template_name: str) -> ET.XSLT:
+        """
+        Get the XSLT transformation object that renders a single object for
+        the given template_name. If the object is not found, create it from
+        a stylesheet that imports the template entrypoint, so the object is
+        rendered by the same archetype template used in the whole document.
+        """
+        transform: ET.XSLT = None
+
+        if template_name in self._fragment_transformations:
+            transform = self._fragment_transformations[template_name]
+        else:
+            entrypoint: Path = self._get_entrypoint(template_name)
+
+            # Create the transformer from the fragment stylesheet
+            stylesheet: str = FRAGMENT_STYLESHEET.format(
+                entrypoint=entrypoint.resolve().as_uri()
+            )
+            transform = ET.XSLT(ET.fromstring(stylesheet))
+
+            # Store the transformation object for future use
+            if Config().app_settings.xslt_debug_mode is False:
+                self._fragment_transformations[template_name] = transform
+
+        return transform
+
     # ----------------------------------------------------------------------
     # Method     : render
     # Description: Render the given xml using the xslt template.
@@ -182,27 +261,188 @@ class RenderService:
     def render(self, xml: ET.Element, template_name: str) -> str:
         """
         Render the given xml using the template_name template.
+
+        Renders are serialized using a lock, so an XSLT transformation object
+        and the extension functions it calls are never run concurrently. It
+        may be called from the render thread or the GUI thread.
         """
-        transform = self._get_xslt(template_name)
-        try:
-            result_tree = transform(xml)
-        except:
-            # Print the errors found while rendering and create an error tree to return
-            result_tree = ET.Element("errors")
-            for error in transform.error_log:
-                error_string = f"Line {error.line}, column {error.column}: {error.message} \n Domain: {error.domain} \n Type: {error.type} \n Level: {error.level} \n Filename: {error.filename} \n"
-                log.critical(
-                    f"Error found while rendering xml using template {template_name}: \n {error_string}"
-                )
+        with self._render_lock:
+            transform = self._get_xslt(template_name)
+            try:
+                result_tree = transform(xml)
+            except:
+                # Print the errors found while rendering and create an error tree to return
+                result_tree = ET.Element("errors")
+                for error in transform.error_log:
+                    error_string = f"Line {error.line}, column {error.column}: {error.message} \n Domain: {error.domain} \n Type: {error.type} \n Level: {error.level} \n Filename: {error.filename} \n"
+                    log.critical(
+                        f"Error found while rendering xml using template {template_name}: \n {error_string}"
+                    )
 
-                error_element = ET.SubElement(result_tree, "error")
-                error_element.text = error.message
+                    error_element = ET.SubElement(result_tree, "error")
+                    error_element.text = error.message
 
         html_string = ET.tostring(
             result_tree, encoding="unicode", pretty_print=True, method="html"
         )
         return html_string
 
+    # ----------------------------------------------------------------------
+    # Method     : render_fragment
+    # Description: Render a single object of the given xml using the xslt
+    #              template.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def render_fragment(
+        self, xml: ET.Element, template_name: str, object_id: ProteusID
+    ) -> str | None:
+        """
+        Render the object with the given id using the template_name template.
+        The object is searched inside the documents of the given xml, so the
+        templates can still navigate the whole document (numbering, traces,
+        etc.).
+
+        Return None if the object is not found, the render fails or the
+        result is not a single element, so the caller can fall back to a
+        full render.
+
+        :param xml: Document or project xml.
+        :param template_name: Name of the template to use.
+        :param object_id: Id of the object to render.
+        """
+        with self._render_lock:
+            transform = self._get_fragment_xslt(template_name)
+            try:
+                result_tree = transform(
+                    xml, **{FRAGMENT_ID_PARAM: ET.XSLT.strparam(object_id)}
+                )
+            except Exception as e:
+                log.error(
+                    f"Error found while rendering object {object_id} using template {template_name}: {e}"
+                )
+                return None
+
+        root: ET._Element = result_tree.getroot()
+        if root is None or root.getnext() is not None:
+            return None
+
+        return ET.tostring(root, encoding="unicode", method="html")
+
+    # ----------------------------------------------------------------------
+    # Method     : get_cached_render
+    # Description: Get a cached rendered HTML string.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def get_cached_render(
+        self, document_id: ProteusID, template_name: str, model_version: int
+    ) -> str | None:
+        """
+        Get the HTML string rendered for the given document, template and
+        model version in the current language. Return None if it is not
+        cached.
+
+        :param document_id: Id of the rendered document, None for the
+                            whole project.
+        :param template_name: Name of the template used.
+        :param model_version: Version of the model when rendered.
+        """
+        key = self._render_cache_key(document_id, template_name, model_version)
+        with self._html_cache_lock:
+            html_string = self._html_cache.get(key)
+            if html_string is not None:
+                self._html_cache.move_to_end(key)
+
+        return html_string
+
+    # ----------------------------------------------------------------------
+    # Method     : cache_render
+    # Description: Store a rendered HTML string in the cache.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def cache_render(
+        self,
+        document_id: ProteusID,
+        template_name: str,
+        model_version: int,
+        html_string: str,
+    ) -> None:
+        """
+        Store the HTML string rendered for the given document, template and
+        model version in the current language. Least recently used entries
+        are evicted when the cache exceeds the render_cache_size app setting
+        (MB). Nothing is cached if the setting is 0 or the XSLT debug mode
+        is enabled.
+
+        :param document_id: Id of the rendered document, None for the
+                            whole project.
+        :param template_name: Name of the template used.
+        :param model_version: Version of the model when rendered.
+        :param html_string: Rendered HTML string.
+        """
+        if Config().app_settings.xslt_debug_mode:
+            return
+
+        budget: int = Config().app_settings.render_cache_size * 1024 * 1024
+        html_size: int = sys.getsizeof(html_string)
+        if html_size > budget:
+            return
+
+        key = self._render_cache_key(document_id, template_name, model_version)
+        with self._html_cache_lock:
+            if key in self._html_cache:
+                self._html_cache_size -= sys.getsizeof(self._html_cache.pop(key))
+
+            self._html_cache[key] = html_string
+            self._html_cache_size += html_size
+
+            # Evict the least recently used entries
+            while self._html_cache_size > budget:
+                _, evicted = self._html_cache.popitem(last=False)
+                self._html_cache_size -= sys.getsizeof(evicted)
+
+    # ----------------------------------------------------------------------
+    # Method     : clear_cache
+    # Description: Remove every rendered HTML string from the cache.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def clear_cache(self) -> None:
+        """
+        Remove every rendered HTML string from the cache. Must be called
+        when the model is modified.
+        """
+        with self._html_cache_lock:
+            self._html_cache.clear()
+            self._html_cache_size = 0
+
+    # ----------------------------------------------------------------------
+    # Method     : _render_cache_key
+    # Description: Build the render cache key.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _render_cache_key(
+        self, document_id: ProteusID, template_name: str, model_version: int
+    ) -> RenderCacheKey:
+        """
+        Build the render cache key using the current language, since it
+        selects the template entrypoint.
+        """
+        return (
+            document_id,
+            template_name,
+            Config().app_settings.language,
+            model_version,
+        )
+
     # ----------------------------------------------------------------------
     # Method     : get_templates
     # Description: Get the available xslt templates in the xslt folder.
@@ -231,6 +471,12 @@ class RenderService:
         FUNCTION_NAMESPACE constant and the function name.
 
         Example: <xsl:value-of select="proteus-utils:function_name()"/>
+
+        Functions are called from the render thread, outside the GUI thread.
+        They must only read the model (through the controller getters) and
+        must not access widgets, notify events or modify the model. Any
+        state they share with the GUI thread must be replaced atomically
+        (assigning a new object) instead of modified in place.
         """
         ns = ET.FunctionNamespace(FUNCTION_NAMESPACE)
 
@@ -0,0 +1,305 @@
+# ==========================================================================
+# File: trace_graph_service.py
+# Description: Trace graph service for traces queries and impact analysis
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+import logging
+from collections import deque
+from typing import Dict, Set, Iterable, Tuple, FrozenSet
+
+# --------------------------------------------------------------------------
+# Project specific imports (starting from root)
+# --------------------------------------------------------------------------
+
+from proteus.model import ProteusID
+
+# logging configuration
+log = logging.getLogger(__name__)
+
+# Type alias for the adjacency structure {node: {trace type: set of nodes}}
+Adjacency = Dict[ProteusID, Dict[str, Set[ProteusID]]]
+
+
+# --------------------------------------------------------------------------
+# Class: TraceGraphService
+# Description: Class for trace graph queries
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+class TraceGraphService:
+    """
+    Stores the traces of the project as a directed graph where edges go
+    from the source object to the target object and are typed by the
+    trace type (e.g. :Proteus-dependency).
+
+    Forward (source -> targets) and reverse (target -> sources) adjacency
+    are kept, so both directions can be queried without walking the object
+    tree. Transitive closures are cached until the graph changes.
+
+    The graph is kept up to date by ProjectService, which calls
+    update_source every time the traces of an object change.
+    """
+
+    # ----------------------------------------------------------------------
+    # Method     : __init__
+    # Description: Class constructor.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def __init__(self) -> None:
+        """
+        Class constructor. Initializes an empty graph.
+        """
+        self._forward: Adjacency = {}
+        self._reverse: Adjacency = {}
+
+        # Transitive closures cache, cleared when the graph changes
+        self._closures: Dict[
+            Tuple[bool, ProteusID, FrozenSet[str], int], Dict[ProteusID, int]
+        ] = {}
+
+    # ----------------------------------------------------------------------
+    # Method     : clear
+    # Description: Removes every edge of the graph.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def clear(self) -> None:
+        """
+        Removes every edge of the graph.
+        """
+        self._forward = {}
+        self._reverse = {}
+        self._closures = {}
+
+    # ----------------------------------------------------------------------
+    # Method     : update_source
+    # Description: Sets the outgoing edges of a source object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def update_source(
+        self, source_id: ProteusID, targets: Dict[str, Set[ProteusID]]
+    ) -> None:
+        """
+        Sets the outgoing edges of the given source object, replacing the
+        previous ones. Only the differences are applied to the reverse
+        adjacency. An empty dictionary removes the source from the graph.
+
+        :param source_id: Id of the source object.
+        :param targets: Targets of the source by trace type.
+        """
+        old_targets: Dict[str, Set[ProteusID]] = self._forward.pop(source_id, {})
+        new_targets: Dict[str, Set[ProteusID]] = {
+            trace_type: set(type_targets)
+            for trace_type, type_targets in targets.items()
+            if type_targets
+        }
+
+        if old_targets == new_targets:
+            if new_targets:
+                self._forward[source_id] = new_targets
+            return
+
+        for trace_type in old_targets.keys() | new_targets.keys():
+            old_type_targets = old_targets.get(trace_type, set())
+            new_type_targets = new_targets.get(trace_type, set())
+
+            for target in old_type_targets - new_type_targets:
+                sources_by_type = self._reverse[target]
+                sources_by_type[trace_type].discard(source_id)
+                if not sources_by_type[trace_type]:
+                    sources_by_type.pop(trace_type)
+                if not sources_by_type:
+                    self._reverse.pop(target)
+
+            for target in new_type_targets - old_type_targets:
+                self._reverse.setdefault(target, {}).setdefault(
+                    trace_type, set()
+                ).add(source_id)
+
+        if new_targets:
+            self._forward[source_id] = new_targets
+
+        # Graph changed, cached closures are no longer valid
+        self._closures = {}
+
+    # ----------------------------------------------------------------------
+    # Method     : targets_of
+    # Description: Returns the direct targets of an object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def targets_of(
+        self, source_id: ProteusID, trace_types: Iterable[str] = None
+    ) -> Set[ProteusID]:
+        """
+        Returns the objects directly targeted by the traces of the given
+        object. If trace_types is given, only traces of those types are
+        considered.
+
+        :param source_id: Id of the source object.
+        :param trace_types: Trace types to consider, all of them if None.
+        :return: Set of target ids.
+        """
+        return self._neighbours(self._forward, source_id, trace_types)
+
+    # ----------------------------------------------------------------------
+    # Method     : sources_of
+    # Description: Returns the direct sources of an object.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def sources_of(
+        self, target_id: ProteusID, trace_types: Iterable[str] = None
+    ) -> Set[ProteusID]:
+        """
+        Returns the objects whose traces directly target the given object.
+        If trace_types is given, only traces of those types are considered.
+
+        :param target_id: Id of the target object.
+        :param trace_types: Trace types to consider, all of them if None.
+        :return: Set of source ids.
+        """
+        return self._neighbours(self._reverse, target_id, trace_types)
+
+    # ----------------------------------------------------------------------
+    # Method     : downstream_closure
+    # Description: Returns the objects reachable following traces.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def downstream_closure(
+        self,
+        object_id: ProteusID,
+        trace_types: Iterable[str] = None,
+        max_depth: int = None,
+    ) -> Dict[ProteusID, int]:
+        """
+        Returns the objects reachable from the given object following its
+        traces (source -> target) transitively, i.e. the objects the given
+        object depends on. The given object is not included.
+
+        :param object_id: Id of the object.
+        :param trace_types: Trace types to consider, all of them if None.
+        :param max_depth: Maximum number of traces to follow, no limit if None.
+        :return: Dictionary with the reachable ids and their distance.
+        """
+        return self._closure(True, object_id, trace_types, max_depth)
+
+    # ----------------------------------------------------------------------
+    # Method     : upstream_closure
+    # Description: Returns the objects that reach an object through traces.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def upstream_closure(
+        self,
+        object_id: ProteusID,
+        trace_types: Iterable[str] = None,
+        max_depth: int = None,
+    ) -> Dict[ProteusID, int]:
+        """
+        Returns the objects whose traces reach the given object transitively
+        (target -> source), i.e. the objects impacted by a change in the
+        given object. The given object is not included.
+
+        :param object_id: Id of the object.
+        :param trace_types: Trace types to consider, all of them if None.
+        :param max_depth: Maximum number of traces to follow, no limit if None.
+        :return: Dictionary with the reaching ids and their distance.
+        """
+        return self._closure(False, object_id, trace_types, max_depth)
+
+    # ----------------------------------------------------------------------
+    # Method     : _neighbours
+    # Description: Returns the adjacent nodes of a node.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _neighbours(
+        self,
+        adjacency: Adjacency,
+        object_id: ProteusID,
+        trace_types: Iterable[str] = None,
+    ) -> Set[ProteusID]:
+        """
+        Returns the adjacent nodes of the given node in the given adjacency
+        structure filtered by trace types.
+        """
+        by_type: Dict[str, Set[ProteusID]] = adjacency.get(object_id, {})
+
+        neighbours: Set[ProteusID] = set()
+        if trace_types is None:
+            for type_neighbours in by_type.values():
+                neighbours.update(type_neighbours)
+        else:
+            for trace_type in trace_types:
+                neighbours.update(by_type.get(trace_type, ()))
+
+        return neighbours
+
+    # ----------------------------------------------------------------------
+    # Method     : _closure
+    # Description: Breadth first transitive closure with cache.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _closure(
+        self,
+        forward: bool,
+        object_id: ProteusID,
+        trace_types: Iterable[str] = None,
+        max_depth: int = None,
+    ) -> Dict[ProteusID, int]:
+        """
+        Breadth first search from the given node in the given direction.
+        Results are cached until the graph changes. A copy of the cached
+        result is returned.
+        """
+        assert max_depth is None or max_depth >= 0, (
+            f"Max depth must be None or a non negative integer, not {max_depth}."
+        )
+
+        types_key: FrozenSet[str] = (
+            None if trace_types is None else frozenset(trace_types)
+        )
+        key = (forward, object_id, types_key, max_depth)
+
+        if key not in self._closures:
+            adjacency: Adjacency = self._forward if forward else self._reverse
+
+            distances: Dict[ProteusID, int] = {object_id: 0}
+            queue = deque([object_id])
+            while queue:
+                current: ProteusID = queue.popleft()
+                depth: int = distances[current]
+                if max_depth is not None and depth >= max_depth:
+                    continue
+
+                for neighbour in self._neighbours(adjacency, current, types_key):
+                    if neighbour not in distances:
+                        distances[neighbour] = depth + 1
+                        queue.append(neighbour)
+
+            distances.pop(object_id)
+            self._closures[key] = distances
+
+        return dict(self._closures[key])
@@ -0,0 +1,28 @@
+# ==========================================================================
+# File: conftest.py
+# Description: pytest fixtures shared by every PROTEUS test
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Third-party library imports
+# --------------------------------------------------------------------------
+
+import pytest
+
+# --------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def snapshots_dir(tmp_path_factory, monkeypatch):
+    """
+    Redirects the project snapshots directory to the pytest temporal
+    directory, so the tests do not write snapshots in the source tree.
+    """
+    snapshots_dir = tmp_path_factory.getbasetemp() / "snapshots"
+    monkeypatch.setattr("proteus.model.snapshot.PROTEUS_SNAPSHOTS_DIR", snapshots_dir)
+    return snapshots_dir
@@ -0,0 +1,241 @@
+# ==========================================================================
+# File: test_render_worker.py
+# Description: pytest file for the PROTEUS render worker
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+from typing import List
+
+# --------------------------------------------------------------------------
+# Third party imports
+# --------------------------------------------------------------------------
+
+import pytest
+
+# --------------------------------------------------------------------------
+# Project specific imports
+# --------------------------------------------------------------------------
+
+from proteus.controller.render_worker import RenderWorker
+from proteus.controller.command_stack import Controller
+
+# --------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------
+
+GENERATION = 3
+HTML_STRING = "<html></html>"
+
+
+def create_worker(render, is_current) -> RenderWorker:
+    return RenderWorker(
+        generation=GENERATION,
+        xslt_name="default",
+        document_id="document_id",
+        model_version=0,
+        render=render,
+        is_current=is_current,
+    )
+
+
+@pytest.fixture
+def render_controller(mocker) -> Controller:
+    """
+    Controller with mocked services whose render workers are collected
+    instead of started, so the tests run them when needed.
+    """
+    controller = Controller(
+        archetype_service=mocker.MagicMock(), render_service=mocker.MagicMock()
+    )
+    controller.started_workers = []
+    mocker.patch.object(
+        controller._render_pool, "start", new=controller.started_workers.append
+    )
+    mocker.patch.object(controller, "_render_html_view", return_value=HTML_STRING)
+    return controller
+
+
+@pytest.fixture
+def deferred_calls(mocker) -> List:
+    """
+    Collect the functions deferred with QTimer.singleShot by the controller,
+    so the tests call them as the event loop would.
+    """
+    calls: List = []
+    mocker.patch(
+        "proteus.controller.command_stack.QTimer.singleShot",
+        new=lambda msec, function: calls.append(function),
+    )
+    return calls
+
+
+# --------------------------------------------------------------------------
+# Tests
+# --------------------------------------------------------------------------
+
+
+def test_render_worker_finished():
+    """
+    Test the worker emits the finished signal with its generation and the
+    render result if it is not superseded.
+    """
+    # Arrange --------------------
+    finished: List[tuple] = []
+    worker = create_worker(
+        render=lambda xslt_name, document_id, model_version: HTML_STRING,
+        is_current=lambda generation: True,
+    )
+    worker.signals.finished.connect(lambda *args: finished.append(args))
+
+    # Act ------------------------
+    worker.run()
+
+    # Assert ---------------------
+    assert len(finished) == 1, f"Finished signal emitted {len(finished)} times"
+    assert finished[0][0] == GENERATION, "Finished signal generation mismatch"
+    assert finished[0][1] == HTML_STRING, "Finished signal result mismatch"
+
+
+@pytest.mark.parametrize("raise_error", [False, True])
+def test_render_worker_superseded(raise_error: bool):
+    """
+    Test the worker does not emit any signal if it is superseded by a newer
+    render request while rendering, even if the render raises an error.
+    """
+    # Arrange --------------------
+    current_generation = [GENERATION]
+    emitted: List[tuple] = []
+
+    def render(xslt_name, document_id, model_version):
+        # A newer request is made while rendering
+        current_generation[0] += 1
+        if raise_error:
+            raise RuntimeError("dictionary changed size during iteration")
+        return "<html></html>"
+
+    worker = create_worker(
+        render=render,
+        is_current=lambda generation: generation == current_generation[0],
+    )
+    worker.signals.finished.connect(lambda *args: emitted.append(args))
+    worker.signals.failed.connect(lambda *args: emitted.append(args))
+
+    # Act ------------------------
+    worker.run()
+
+    # Assert ---------------------
+    assert len(emitted) == 0, f"Superseded worker emitted signals: {emitted}"
+
+
+def test_render_worker_failed():
+    """
+    Test the worker emits the failed signal if the current render raises
+    an error.
+    """
+    # Arrange --------------------
+    failed: List[tuple] = []
+
+    def render(xslt_name, document_id, model_version):
+        raise RuntimeError("render error")
+
+    worker = create_worker(render=render, is_current=lambda generation: True)
+    worker.signals.failed.connect(lambda *args: failed.append(args))
+
+    # Act ------------------------
+    worker.run()
+
+    # Assert ---------------------
+    assert failed == [(GENERATION, "render error")], f"Unexpected failed: {failed}"
+
+
+def test_model_changed_repeats_render(
+    render_controller: Controller, deferred_calls: List
+):
+    """
+    Test a render in progress when the model changes is discarded and
+    the request is repeated once the modification is done.
+    """
+    # Arrange --------------------
+    finished: List[str] = []
+    render_controller.request_html_view("default", finished.append)
+    stale_worker: RenderWorker = render_controller.started_workers[0]
+
+    # Act ------------------------
+    render_controller._model_changed()
+    stale_worker.run()
+    for function in deferred_calls:
+        function()
+    render_controller.started_workers[1].run()
+
+    # Assert ---------------------
+    assert finished == [HTML_STRING], f"Unexpected finished renders: {finished}"
+    assert (
+        render_controller._last_render_request is None
+    ), "The finished request must not be repeated again"
+
+
+def test_model_changed_superseded_render(
+    render_controller: Controller, deferred_calls: List
+):
+    """
+    Test the render discarded when the model changes is not repeated if
+    a newer request is made meanwhile.
+    """
+    # Arrange --------------------
+    stale_finished: List[str] = []
+    render_controller.request_html_view("default", stale_finished.append)
+
+    # Act ------------------------
+    render_controller._model_changed()
+    render_controller.request_html_view("default", lambda html: None)
+    for function in deferred_calls:
+        function()
+
+    # Assert ---------------------
+    assert (
+        len(render_controller.started_workers) == 2
+    ), f"Expected 2 renders, got {len(render_controller.started_workers)}"
+    render_controller.started_workers[0].run()
+    assert stale_finished == [], "The discarded render must not be displayed"
+
+
+def test_save_project_keeps_rendered_views(
+    mocker, render_controller: Controller, deferred_calls: List
+):
+    """
+    Test saving the project keeps the model version and the rendered
+    views cache, but still repeats the render in progress once saved.
+    """
+    # Arrange --------------------
+    # The action decorator sets the application cursor
+    mocker.patch("proteus.application.utils.decorators.QApplication")
+    mocker.patch("proteus.application.utils.decorators.QCursor")
+
+    render_controller._project_service = mocker.MagicMock()
+    render_controller._project_service.has_unsaved_changes.return_value = False
+    model_version: int = render_controller._model_version
+
+    finished: List[str] = []
+    render_controller.request_html_view("default", finished.append)
+    stale_worker: RenderWorker = render_controller.started_workers[0]
+
+    # Act ------------------------
+    render_controller.save_project()
+    stale_worker.run()
+    for function in deferred_calls:
+        function()
+    render_controller.started_workers[1].run()
+
+    # Assert ---------------------
+    assert (
+        render_controller._model_version == model_version
+    ), f"Model version changed from {model_version} to {render_controller._model_version}"
+    render_controller._render_service.clear_cache.assert_not_called()
+    render_controller._project_service.save_project.assert_called_once()
+    assert finished == [HTML_STRING], f"Unexpected finished renders: {finished}"
@@ -0,0 +1,177 @@
+# ==========================================================================
+# File: test_update_properties_bulk.py
+# Description: pytest file for the PROTEUS update properties bulk command
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+from typing import Dict, List
+
+# --------------------------------------------------------------------------
+# Third party imports
+# --------------------------------------------------------------------------
+
+import pytest
+
+# --------------------------------------------------------------------------
+# Project specific imports
+# --------------------------------------------------------------------------
+
+from proteus.model import ProteusID, PROTEUS_NAME
+from proteus.model.abstract_object import ProteusState
+from proteus.model.properties import Property, StringProperty, MarkdownProperty
+from proteus.services.project_service import ProjectService
+from proteus.controller.commands.update_properties_bulk import (
+    UpdatePropertiesBulkCommand,
+)
+from proteus.application.events import ModifyObjectsEvent
+from proteus.tests import PROTEUS_SAMPLE_PROJECTS_PATH
+from proteus.tests.fixtures import SampleData
+
+# --------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------
+
+SAMPLE_PROJECT_PATH = PROTEUS_SAMPLE_PROJECTS_PATH / "example_project"
+
+OBJECT_NAMES = ["simple_paragraph", "simple_section", "section_dl_1"]
+
+
+@pytest.fixture
+def sample_project_service():
+    sample_project_service = ProjectService()
+    sample_project_service.load_project(SAMPLE_PROJECT_PATH.as_posix())
+    return sample_project_service
+
+
+# --------------------------------------------------------------------------
+# Integration tests
+# --------------------------------------------------------------------------
+
+
+def test_update_properties_bulk_command_redo_undo(
+    mocker, sample_project_service: ProjectService
+):
+    """
+    Test the redo and undo methods of the update properties bulk command.
+    Every object name is updated in a single project service call and a
+    single MODIFY OBJECTS event is notified. Undo restores the old names
+    and states.
+    """
+    # Arrange --------------------
+    mocker.patch.object(ModifyObjectsEvent, "notify")
+    mocker.spy(sample_project_service, "update_properties_bulk")
+
+    object_ids: List[ProteusID] = [SampleData.get(name) for name in OBJECT_NAMES]
+    old_names: Dict[ProteusID, Property] = {}
+    old_states: Dict[ProteusID, ProteusState] = {}
+    new_properties: Dict[ProteusID, List[Property]] = {}
+    for object_id in object_ids:
+        object = sample_project_service._get_element_by_id(object_id)
+        old_names[object_id] = object.get_property(PROTEUS_NAME)
+        old_states[object_id] = object.state
+        new_properties[object_id] = [old_names[object_id].clone("Bulk name")]
+
+    command = UpdatePropertiesBulkCommand(new_properties, sample_project_service)
+
+    # Act | Assert (redo) ---------
+    command.redo()
+
+    for object_id in object_ids:
+        object = sample_project_service._get_element_by_id(object_id)
+        assert (
+            object.get_property(PROTEUS_NAME).value == "Bulk name"
+        ), f"Name of object '{object_id}' was not updated"
+        assert (
+            object.state == ProteusState.DIRTY
+        ), f"Object '{object_id}' state should be DIRTY but it is {object.state}"
+
+    assert sample_project_service.update_properties_bulk.call_count == 1, (
+        "update_properties_bulk should be called once"
+    )
+    ModifyObjectsEvent().notify.assert_called_once_with(object_ids)
+
+    # Act | Assert (undo) ---------
+    command.undo()
+
+    for object_id in object_ids:
+        object = sample_project_service._get_element_by_id(object_id)
+        assert (
+            object.get_property(PROTEUS_NAME) == old_names[object_id]
+        ), f"Name of object '{object_id}' was not restored"
+        assert (
+            object.state == old_states[object_id]
+        ), f"Object '{object_id}' state should be {old_states[object_id]} but it is {object.state}"
+
+    assert ModifyObjectsEvent().notify.call_count == 2, (
+        "MODIFY OBJECTS event should be notified once per redo and undo"
+    )
+
+
+def test_update_properties_bulk_invalid_element(
+    sample_project_service: ProjectService,
+):
+    """
+    Test the project service does not update any element if one of the
+    elements does not exist.
+    """
+    # Arrange --------------------
+    object_id: ProteusID = SampleData.get("simple_paragraph")
+    object = sample_project_service._get_element_by_id(object_id)
+    old_name: Property = object.get_property(PROTEUS_NAME)
+
+    new_properties: Dict[ProteusID, List[Property]] = {
+        object_id: [old_name.clone("Bulk name")],
+        ProteusID("nonexistent_id"): [old_name.clone("Bulk name")],
+    }
+
+    # Act | Assert ---------------
+    with pytest.raises(AssertionError):
+        sample_project_service.update_properties_bulk(new_properties)
+
+    assert (
+        object.get_property(PROTEUS_NAME) == old_name
+    ), f"Name of object '{object_id}' should not be updated"
+
+
+@pytest.mark.parametrize(
+    "invalid_property",
+    [
+        StringProperty("nonexistent_property", "general", "value"),
+        MarkdownProperty(PROTEUS_NAME, "general", "Bulk name"),
+    ],
+)
+def test_update_properties_bulk_invalid_property(
+    sample_project_service: ProjectService, invalid_property: Property
+):
+    """
+    Test the project service does not update any element if one of the
+    properties does not exist in its element or has a different type.
+    """
+    # Arrange --------------------
+    object_id: ProteusID = SampleData.get("simple_paragraph")
+    invalid_object_id: ProteusID = SampleData.get("simple_section")
+    object = sample_project_service._get_element_by_id(object_id)
+    old_name: Property = object.get_property(PROTEUS_NAME)
+    old_state: ProteusState = object.state
+
+    new_properties: Dict[ProteusID, List[Property]] = {
+        object_id: [old_name.clone("Bulk name")],
+        invalid_object_id: [invalid_property],
+    }
+
+    # Act | Assert ---------------
+    with pytest.raises(AssertionError):
+        sample_project_service.update_properties_bulk(new_properties)
+
+    assert (
+        object.get_property(PROTEUS_NAME) == old_name
+    ), f"Name of object '{object_id}' should not be updated"
+    assert (
+        object.state == old_state
+    ), f"State of object '{object_id}' should not change"
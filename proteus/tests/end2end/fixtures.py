@@ -187,6 +187,13 @@ def mock_views_container(mocker):
         lambda *args, **kwargs: None,
     )
 
+    # NOTE: Modification events patch the view with the rendered fragments
+    # of the modified objects, the mocked views have no page to patch
+    mocker.patch(
+        "proteus.views.components.views_container.ViewsContainer.patch_view",
+        lambda *args, **kwargs: None,
+    )
+
     mocker.patch(
         "proteus.views.components.views_container.ViewsContainer.delete_component",
         lambda *args, **kwargs: None,
@@ -0,0 +1,131 @@
+# ==========================================================================
+# File: test_view_refresh.py
+# Description: pytest file for the PROTEUS pyqt view refresh coalescing
+# Date: 16/10/2026
+# Version: 0.2
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# NOTE: https://github.com/pytest-dev/pytest-qt/issues/37
+# QApplication instace cannot be deleted. This might cause tests failures.
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------
+# Third party imports
+# --------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------
+# Project specific imports
+# --------------------------------------------------------------------------
+
+from proteus.model import PROTEUS_NAME
+from proteus.model.object import Object
+from proteus.application.configuration.config import Config
+from proteus.views.components.main_window import MainWindow
+from proteus.views.components.documents_container import DocumentsContainer
+from proteus.views.components.views_container import (
+    ViewsContainer,
+    VIEW_REFRESH_DELAY,
+)
+from proteus.tests.fixtures import SampleData
+from proteus.tests.end2end.fixtures import app, load_project
+
+# --------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------
+
+SCROLL_OBJECTS = [
+    SampleData.get("simple_section"),
+    SampleData.get("simple_paragraph"),
+    SampleData.get("section_dl_1"),
+]
+
+# --------------------------------------------------------------------------
+# End to end "view refresh" tests
+# --------------------------------------------------------------------------
+
+
+def test_view_refresh_coalesced(app, qtbot, mocker):
+    """
+    Test the view refresh requests made within the refresh window are
+    coalesced in a single display of the view, scrolling to the last
+    object to scroll requested.
+    """
+    # Arrange --------------------
+    main_window: MainWindow = app
+    load_project(main_window=main_window)
+
+    views_container: ViewsContainer = main_window.project_container.views_container
+
+    # Let the refresh requested when loading the project finish
+    qtbot.wait(VIEW_REFRESH_DELAY * 3)
+    display_view = mocker.patch.object(views_container, "display_view")
+
+    # Act ------------------------
+    for object_id in SCROLL_OBJECTS:
+        views_container.request_view_refresh(object_to_scroll=object_id)
+
+    qtbot.wait(VIEW_REFRESH_DELAY * 3)
+
+    # Assert ---------------------
+    assert (
+        display_view.call_count == 1
+    ), f"View displayed {display_view.call_count} times, expected 1"
+    display_view.assert_called_once_with(SCROLL_OBJECTS[-1])
+
+
+def test_view_refresh_patched(app, qtbot, mocker):
+    """
+    Test the view is patched with the rendered fragment of a modified
+    object instead of reloaded, going through the coalesced refresh and
+    the fragments render of the controller.
+    """
+    # Arrange --------------------
+    main_window: MainWindow = app
+    load_project(main_window=main_window)
+
+    object_id = SampleData.get("simple_paragraph")
+    document_id = SampleData.get("document_1")
+    view_name: str = Config().app_settings.default_view
+
+    documents_container: DocumentsContainer = (
+        main_window.project_container.documents_container
+    )
+    views_container: ViewsContainer = main_window.project_container.views_container
+
+    # Select the document and the view
+    tab = documents_container.tabs.get(document_id)
+    documents_container.currentChanged.emit(documents_container.indexOf(tab))
+    main_window._state_manager.set_current_view(view_name)
+
+    # Let the refresh requested when loading the project finish
+    qtbot.wait(VIEW_REFRESH_DELAY * 3)
+    display_view = mocker.patch.object(views_container, "display_view")
+    patch_view = mocker.patch.object(views_container, "patch_view")
+
+    object: Object = main_window._controller.get_element(object_id)
+    name_property = object.get_property(PROTEUS_NAME).clone("patched name")
+
+    # Act ------------------------
+    main_window._controller.update_properties(object_id, [name_property])
+
+    qtbot.waitUntil(lambda: patch_view.called, timeout=5000)
+
+    # Assert ---------------------
+    assert (
+        display_view.call_count == 0
+    ), f"View displayed {display_view.call_count} times, expected to be patched"
+
+    fragments, patched_view = patch_view.call_args.args
+    assert (
+        patched_view == view_name
+    ), f"Patched view must be '{view_name}' but it is '{patched_view}'"
+    assert list(fragments.keys()) == [
+        object_id
+    ], f"Fragments must be rendered for '{object_id}' but they are for {list(fragments.keys())}"
+    assert (
+        "patched name" in fragments[object_id]
+    ), f"Fragment of '{object_id}' must contain the new name: {fragments[object_id]}"
@@ -0,0 +1,238 @@
+# ==========================================================================
+# File: test_lazy_properties.py
+# Description: pytest file for PROTEUS lazy properties dictionary
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+import copy
+import pickle
+
+import pytest
+import lxml.etree as ET
+
+# --------------------------------------------------------------------------
+# Project specific imports
+# --------------------------------------------------------------------------
+
+from proteus.model.properties import (
+    LazyProperties,
+    MarkdownProperty,
+    StringProperty,
+    TraceProperty,
+)
+from proteus.model.properties.property_factory import PropertyFactory
+
+# --------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------
+
+PROPERTIES_XML = """
+<properties>
+    <stringProperty name="name" category="general">name value</stringProperty>
+    <markdownProperty name="description" category="general"><![CDATA[]]></markdownProperty>
+    <traceProperty name="trace" category="traces">
+        <trace target="target1"/>
+    </traceProperty>
+    <invalidProperty name="invalid" category="general">value</invalidProperty>
+</properties>
+"""
+
+
+@pytest.fixture
+def lazy_properties() -> LazyProperties:
+    """
+    Lazy properties dictionary with raw string, markdown and trace properties.
+    """
+    properties = LazyProperties()
+    for element in ET.fromstring(PROPERTIES_XML):
+        properties.set_raw(element.attrib["name"], element)
+    return properties
+
+
+# --------------------------------------------------------------------------
+# Tests
+# --------------------------------------------------------------------------
+
+
+def test_properties_created_on_access(lazy_properties: LazyProperties, mocker):
+    """
+    Test properties are created only when they are accessed and only once.
+    Invalid property types are ignored.
+    """
+    # Arrange -------------------------
+    create_spy = mocker.spy(PropertyFactory, "create")
+
+    # Assert --------------------------
+    assert list(lazy_properties) == ["name", "description", "trace"], (
+        f"Invalid properties should be ignored and order kept, "
+        f"properties: {list(lazy_properties)}"
+    )
+    assert "name" in lazy_properties and create_spy.call_count == 0, (
+        "Membership check should not create the property"
+    )
+
+    # Act -----------------------------
+    name_property = lazy_properties["name"]
+    lazy_properties.get("name")
+
+    # Assert --------------------------
+    assert isinstance(name_property, StringProperty), (
+        f"Property should be a StringProperty, not {type(name_property)}"
+    )
+    assert name_property.value == "name value", (
+        f"Property value should be 'name value', not '{name_property.value}'"
+    )
+    assert create_spy.call_count == 1, (
+        f"Property should be created once, created {create_spy.call_count} times"
+    )
+    assert not lazy_properties.is_loaded("description"), (
+        "Properties not accessed should not be created"
+    )
+
+
+def test_values_of_type(lazy_properties: LazyProperties):
+    """
+    Test properties of a given type are returned without creating the rest.
+    """
+    # Act -----------------------------
+    traces = lazy_properties.values_of_type(TraceProperty)
+
+    # Assert --------------------------
+    assert [trace.name for trace in traces] == ["trace"], (
+        f"Only the trace property should be returned, returned: {traces}"
+    )
+    assert traces[0].value == ["target1"], (
+        f"Trace targets should be ['target1'], not {traces[0].value}"
+    )
+    assert not lazy_properties.is_loaded("name") and not lazy_properties.is_loaded(
+        "description"
+    ), "Properties of other types should not be created"
+
+
+def test_set_and_delete(lazy_properties: LazyProperties):
+    """
+    Test raw properties can be replaced and deleted as in a dictionary.
+    """
+    # Act -----------------------------
+    new_property = StringProperty("name", "general", "new value")
+    lazy_properties["name"] = new_property
+    del lazy_properties["trace"]
+
+    # Assert --------------------------
+    assert lazy_properties["name"] is new_property, (
+        "Property should be replaced by the new one"
+    )
+    assert list(lazy_properties) == ["name", "description"], (
+        f"Deleted property should not be in the dictionary: {list(lazy_properties)}"
+    )
+
+
+def test_property_not_created_ignored(lazy_properties: LazyProperties, mocker):
+    """
+    Test a raw property that could not be created is ignored and removed
+    from the dictionary when it is accessed, also while iterating.
+    """
+    # Arrange -------------------------
+    create = PropertyFactory.create
+    mocker.patch.object(
+        PropertyFactory,
+        "create",
+        side_effect=lambda element: (
+            None if element.attrib["name"] == "description" else create(element)
+        ),
+    )
+
+    # Act -----------------------------
+    names = [property.name for property in lazy_properties.values()]
+
+    # Assert --------------------------
+    assert names == ["name", "trace"], (
+        f"Property not created should be skipped, properties: {names}"
+    )
+    assert "description" not in lazy_properties, (
+        "Property not created should be removed from the dictionary"
+    )
+    assert lazy_properties.get("description") is None, (
+        "Property not created should not be returned"
+    )
+
+
+def test_property_set_while_created(lazy_properties: LazyProperties, mocker):
+    """
+    Test a property set while its raw value is being created (e.g. set in
+    the GUI thread while the render thread creates it) is not overwritten
+    by the created property.
+    """
+    # Arrange -------------------------
+    create = PropertyFactory.create
+    new_property = StringProperty("name", "general", "new value")
+
+    def create_and_set(element):
+        property = create(element)
+        lazy_properties["name"] = new_property
+        return property
+
+    mocker.patch.object(PropertyFactory, "create", side_effect=create_and_set)
+
+    # Act -----------------------------
+    created_property = lazy_properties["name"]
+
+    # Assert --------------------------
+    assert created_property is new_property, (
+        f"The property set meanwhile should be returned, not {created_property}"
+    )
+    assert lazy_properties["name"] is new_property, (
+        "The property set meanwhile should not be overwritten"
+    )
+
+
+@pytest.mark.parametrize(
+    "copy_function",
+    [
+        lambda properties: pickle.loads(pickle.dumps(properties)),
+        copy.deepcopy,
+        lambda properties: properties.copy(),
+    ],
+)
+def test_pickle_and_copy(lazy_properties: LazyProperties, copy_function):
+    """
+    Test raw properties are kept raw when the dictionary is pickled or
+    copied and they are created with the same values. Empty CDATA values
+    must be kept as empty strings.
+    """
+    # Act -----------------------------
+    properties_copy: LazyProperties = copy_function(lazy_properties)
+
+    # Assert --------------------------
+    assert not properties_copy.is_loaded("description"), (
+        "Raw properties should be kept raw in the copy"
+    )
+    assert properties_copy == lazy_properties, (
+        "Copied properties should be equal to the original ones"
+    )
+    assert properties_copy["description"] == MarkdownProperty(
+        "description", "general", ""
+    ), f"Empty markdown value should be '', not {properties_copy['description']}"
+
+
+def test_identical_properties_shared(lazy_properties: LazyProperties):
+    """
+    Test identical properties created from different dictionaries are the
+    same instance, except properties with unhashable values (traces).
+    """
+    # Arrange -------------------------
+    other_properties = copy.deepcopy(lazy_properties)
+
+    # Assert --------------------------
+    for name in ["name", "description"]:
+        assert other_properties[name] is lazy_properties[name], (
+            f"Identical property '{name}' should be shared"
+        )
+    assert other_properties["trace"] == lazy_properties["trace"], (
+        "Trace properties should be equal"
+    )
+    assert other_properties["trace"] is not lazy_properties["trace"], (
+        "Trace properties have unhashable values and should not be shared"
+    )
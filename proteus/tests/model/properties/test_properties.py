@@ -89,3 +89,28 @@ def test_property_name_and_category(name, name_expected, category, category_expe
         ET.tostring(property.generate_xml()).decode() ==
         f'<{property_element.tag} name="{name_expected}" category="{category_expected}"><![CDATA[{property.value}]]></{property_element.tag}>'
     )
+
+
+def test_property_generate_xml_cache():
+    """
+    It tests that generate_xml returns a copy of the cached XML element
+    and that cloned properties do not share the cached element.
+    """
+    property_element = ET.Element(STRING_PROPERTY_TAG)
+    property_element.set(NAME_ATTRIBUTE, 'test_name')
+    property_element.text = 'test text'
+
+    property = PropertyFactory.create(property_element)
+
+    # Modifying the returned element must not modify the cached one
+    first_element = property.generate_xml()
+    first_element.set(NAME_ATTRIBUTE, 'modified')
+    assert(property.generate_xml().attrib[NAME_ATTRIBUTE] == 'test_name')
+
+    # Cloned property with a new value generates its own element
+    cloned_property = property.clone('new text')
+    assert(cloned_property.generate_xml().text == 'new text')
+    assert(property.generate_xml().text == 'test text')
+
+    # Cached element is not taken into account in comparisons
+    assert(property == PropertyFactory.create(property_element))
@@ -34,9 +34,11 @@ from proteus.model import (
     ACCEPTED_CHILDREN_ATTRIBUTE,
     PROTEUS_NAME,
     PROTEUS_ANY,
+    PROTEUS_CODE,
+    PROTEUS_DATE,
     ProteusID,
 )
-from proteus.model.properties import STRING_PROPERTY_TAG
+from proteus.model.properties import STRING_PROPERTY_TAG, TraceProperty
 from proteus.model.abstract_object import ProteusState
 from proteus.model.object import Object
 from proteus.model.project import Project
@@ -143,10 +145,10 @@ def test_init():
         root.attrib[ID_ATTRIBUTE] == test_object.id
     ), f"Object id is not the same as the root element id."
     assert (
-        root.attrib[ACCEPTED_CHILDREN_ATTRIBUTE].split() == test_object.acceptedChildren
+        tuple(root.attrib[ACCEPTED_CHILDREN_ATTRIBUTE].split()) == test_object.acceptedChildren
     ), f"Object acceptedChildren is not the same as the root element acceptedChildren."
     assert (
-        root.attrib[CLASSES_ATTRIBUTE].split() == test_object.classes
+        tuple(root.attrib[CLASSES_ATTRIBUTE].split()) == test_object.classes
     ), f"Object classes is not the same as the root element classes."
 
 
@@ -170,13 +172,40 @@ def test_load(sample_project: Project):
         root.attrib[ID_ATTRIBUTE] == test_object.id
     ), f"Object id is not the same as the root element id."
     assert (
-        root.attrib[ACCEPTED_CHILDREN_ATTRIBUTE].split() == test_object.acceptedChildren
+        tuple(root.attrib[ACCEPTED_CHILDREN_ATTRIBUTE].split()) == test_object.acceptedChildren
     ), f"Object acceptedChildren is not the same as the root element acceptedChildren."
     assert (
-        root.attrib[CLASSES_ATTRIBUTE].split() == test_object.classes
+        tuple(root.attrib[CLASSES_ATTRIBUTE].split()) == test_object.classes
     ), f"Object classes is not the same as the root element classes."
 
 
+def test_compact_layout(sample_project: Project):
+    """
+    Test objects do not have an instance dictionary and objects with the
+    same classes share the same class tags tuple and property names.
+    """
+    # Arrange -------------------------
+    objects = set()
+    for document in sample_project.documents:
+        objects.update(document.get_descendants_recursively())
+
+    # Assert --------------------------
+    shared_objects = {}
+    for object in objects:
+        assert not hasattr(object, "__dict__"), (
+            f"Object {object.id} should use __slots__ instead of a dictionary"
+        )
+
+        shared = shared_objects.setdefault(object.classes, object)
+        assert object.classes is shared.classes, (
+            f"Objects with classes {object.classes} should share the same tuple"
+        )
+        for name, shared_name in zip(object.properties, shared.properties):
+            assert name != shared_name or name is shared_name, (
+                f"Property name '{name}' should be interned"
+            )
+
+
 @pytest.mark.parametrize(
     "test_object",
     [
@@ -266,6 +295,41 @@ def test_generate_xml(sample_object: Object):
     assert expected_xml == actual_xml
 
 
+def test_generate_xml_cache(sample_object: Object):
+    """
+    Test Object generate_xml method reuses the cached element until the
+    object is modified.
+    """
+    # Generate xml twice and modify the first one
+    first_xml: ET.Element = sample_object.generate_xml()
+    first_xml.set(ID_ATTRIBUTE, "modified")
+    second_xml: ET.Element = sample_object.generate_xml()
+
+    # Check that a copy of the cached element is returned
+    assert (
+        second_xml.attrib[ID_ATTRIBUTE] == sample_object.id
+    ), f"Cached element was modified by the caller: {second_xml.attrib[ID_ATTRIBUTE]}"
+
+    # Modify the object
+    version: int = sample_object.version
+    (new_property, name, _) = fixtures.create_property(
+        STRING_PROPERTY_TAG, PROTEUS_NAME, "general", "Cache test value"
+    )
+    sample_object.set_property(new_property)
+
+    # Check that the version changed and the element is generated again
+    assert (
+        sample_object.version != version
+    ), f"Object version was not updated after set_property: {version}"
+
+    name_element = sample_object.generate_xml().find(
+        f"properties/{STRING_PROPERTY_TAG}[@name='{name}']"
+    )
+    assert (
+        name_element.text == "Cache test value"
+    ), f"Generated xml was not updated, found name '{name_element.text}'"
+
+
 # TODO: Test clone object      -> object
 #                  arch_object -> object
 @pytest.mark.parametrize(
@@ -328,6 +392,16 @@ def test_clone_object(
     ), f"Traces were not cloned. Expected: {test_object_to_clone.get_traces()} \
         Actual: {new_object.get_traces()}"
 
+    # Check properties that are not updated are shared with the original
+    # object instead of being copied
+    updated_properties = {PROTEUS_NAME, PROTEUS_CODE, PROTEUS_DATE}
+    for name, property in test_object_to_clone.properties.items():
+        if name in updated_properties or isinstance(property, TraceProperty):
+            continue
+        assert new_object.properties[name] is property, (
+            f"Property '{name}' should be shared with the original object"
+        )
+
     # Check the children are in the new object
     # NOTE: This will not work if we clone an object into itself
     # however, this is not a valid use case at the moment
@@ -432,6 +506,41 @@ def test_accept_descendant(
         but it does not."
 
 
+def test_accept_descendant_ancestors(mocker, sample_object: Object):
+    """
+    Test Object accept_descendant method does not accept the object itself or
+    any of its ancestors even if their classes are compatible.
+    """
+    # Arrange -------------------
+    def create_mock_object(id: str, parent: Object) -> Object:
+        mock_object = mocker.MagicMock(spec=Object)
+        mock_object.id = id
+        mock_object.parent = parent
+        mock_object.classes = ("a",)
+        mock_object.acceptedParents = (PROTEUS_ANY,)
+        return mock_object
+
+    grandparent = create_mock_object("grandparent", None)
+    parent = create_mock_object("parent", grandparent)
+    unrelated = create_mock_object("unrelated", None)
+
+    sample_object.parent = parent
+    sample_object.classes = ("a",)
+    sample_object.acceptedChildren = (PROTEUS_ANY,)
+    sample_object.acceptedParents = (PROTEUS_ANY,)
+
+    # Act -----------------------
+    accepts_itself: bool = sample_object.accept_descendant(sample_object)
+    accepts_parent: bool = sample_object.accept_descendant(parent)
+    accepts_grandparent: bool = sample_object.accept_descendant(grandparent)
+    accepts_unrelated: bool = sample_object.accept_descendant(unrelated)
+
+    # Assert --------------------
+    assert not accepts_itself, "Object should not accept itself as child"
+    assert not accepts_parent, "Object should not accept its parent as child"
+    assert not accepts_grandparent, "Object should not accept its ancestors as child"
+    assert accepts_unrelated, "Object should accept a compatible unrelated object"
+
 def test_get_document(sample_project: Project):
     """
     Test get_document method returns the document where the object is located.
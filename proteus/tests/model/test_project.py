@@ -16,6 +16,8 @@
 # --------------------------------------------------------------------------
 
 import os
+import sys
+import copy
 import pathlib
 import shutil
 from typing import List, Generator
@@ -222,6 +224,32 @@ def test_load_documents(test_project: Project):
         Documents in Project: {test_project.documents.keys()}"
 
 
+def test_load_parses_each_file_once(mocker):
+    """
+    Test every project and object file is parsed only once when the whole
+    project tree is loaded. Documents and children are loaded from the ids
+    read in the constructors.
+    """
+    # Arrange -------------------------
+    parse_spy = mocker.spy(ET, "parse")
+    init_spy = mocker.spy(Object, "__init__")
+
+    # Act -----------------------------
+    project: Project = Project.load(SAMPLE_PROJECT_PATH)
+    ids = project.get_ids()
+
+    # Assert --------------------------
+    assert parse_spy.call_count == 0, (
+        f"Project and object files should not be parsed again to load "
+        f"documents and children, but ET.parse was called "
+        f"{parse_spy.call_count} times"
+    )
+    assert init_spy.call_count == len(ids) - 1, (
+        f"Every object file should be parsed once ({len(ids) - 1} objects), "
+        f"but {init_spy.call_count} objects were created"
+    )
+
+
 def test_generate_xml(sample_project: Project):
     """
     Test Project generate_xml method
@@ -331,6 +359,76 @@ def test_get_ids(sample_project: Project):
     ), f"Ids are not equal. Expected: {expected_len}, Actual: {len(ids)} | {ids}"
 
 
+def test_walk_preorder_and_postorder(sample_project: Project):
+    """
+    Test Project walk_preorder and walk_postorder methods return the same
+    elements as a recursive traversal, in preorder and postorder. DEAD
+    elements and their descendants are skipped if requested.
+    """
+    # Arrange -------------------
+    def preorder(element) -> List:
+        elements = [element]
+        for descendant in element.get_descendants():
+            elements.extend(preorder(descendant))
+        return elements
+
+    def postorder(element) -> List:
+        elements = []
+        for descendant in element.get_descendants():
+            elements.extend(postorder(descendant))
+        elements.append(element)
+        return elements
+
+    dead_document: Object = sample_project.documents[0]
+    dead_document.state = ProteusState.DEAD
+
+    # Act -----------------------
+    walked_preorder: List = list(sample_project.walk_preorder())
+    walked_postorder: List = list(sample_project.walk_postorder())
+    alive_preorder: List = list(sample_project.walk_preorder(skip_dead=True))
+    alive_postorder: List = list(sample_project.walk_postorder(skip_dead=True))
+
+    # Assert --------------------
+    assert walked_preorder == preorder(sample_project), (
+        "walk_preorder order is different from the recursive preorder"
+    )
+    assert walked_postorder == postorder(sample_project), (
+        "walk_postorder order is different from the recursive postorder"
+    )
+
+    dead_elements: List = preorder(dead_document)
+    assert alive_preorder == [e for e in walked_preorder if e not in dead_elements], (
+        "walk_preorder should skip the DEAD document and its descendants"
+    )
+    assert alive_postorder == [e for e in walked_postorder if e not in dead_elements], (
+        "walk_postorder should skip the DEAD document and its descendants"
+    )
+
+
+def test_walk_deep_tree(sample_project: Project):
+    """
+    Test Project walk_preorder method and get_ids do not reach the recursion
+    limit on deep trees.
+    """
+    # Arrange -------------------
+    parent: Object = sample_project.documents[0]
+    depth: int = sys.getrecursionlimit() + 100
+    for _ in range(depth):
+        child: Object = copy.copy(parent)
+        child.id = f"{parent.id}-child"
+        child._children = []
+        parent._children = [child]
+        parent = child
+
+    # Act -----------------------
+    ids = sample_project.get_ids()
+    walked: List = list(sample_project.walk_postorder())
+
+    # Assert --------------------
+    assert parent.id in ids, "Deepest object id should be in the project ids"
+    assert walked[0] is parent, "Deepest object should be the first in postorder"
+
+
 def test_save_project(cloned_project: Project):
     """
     Test Project save_project method checking that the project xml file
@@ -432,4 +530,72 @@ def test_save_project_document_delete(cloned_project: Project):
         Actual: {num_documents_after_delete}"
 
 
+    # Check that the project file was written without the deleted document
+    root: ET.Element = fixtures.get_root(cloned_project.path)
+    assert document.id not in [
+        document_element.attrib["id"] for document_element in root.iter("document")
+    ], f"Deleted document {document.id} is still referenced in the project file."
+
+
+def test_save_project_only_changed_files(cloned_project: Project):
+    """
+    Test Project save_project method only writes the files of the elements
+    with unsaved changes.
+    """
+    # Force the load of every object
+    cloned_project.get_ids()
+    assert not cloned_project.unsaved_objects, "Loaded project has unsaved objects."
+
+    # Edit a single document
+    document: Object = cloned_project.documents[0]
+    (new_property, _, _) = fixtures.create_property(
+        STRING_PROPERTY_TAG, PROTEUS_NAME, "general", "Test value"
+    )
+    document.set_property(new_property)
+
+    # Save project
+    files_written: int = cloned_project.save_project()
+
+    # Check only the document was written and the registry is empty
+    assert files_written == 1, f"Expected 1 file written, but {files_written} were."
+    assert document.state == ProteusState.CLEAN, (
+        f"Document state should be CLEAN but it is {document.state}"
+    )
+    assert not cloned_project.unsaved_objects, (
+        f"Unsaved objects registry should be empty after save: "
+        f"{cloned_project.unsaved_objects}"
+    )
+
+
+
+def test_save_project_skip_unchanged_files(cloned_project: Project):
+    """
+    Test Project save_project method does not rewrite files whose
+    serialized content is unchanged.
+    """
+    # Edit a document and save it so the file has the serialized format
+    document: Object = cloned_project.documents[0]
+    (new_property, _, _) = fixtures.create_property(
+        STRING_PROPERTY_TAG, PROTEUS_NAME, "general", "Test value"
+    )
+    document.set_property(new_property)
+    cloned_project.save_project()
+    mtime_before: int = os.stat(document.path).st_mtime_ns
+
+    # Mark the document as DIRTY without changes
+    document.state = ProteusState.DIRTY
+
+    # Save project
+    files_written: int = cloned_project.save_project()
+
+    # Check the file was not written
+    assert files_written == 0, f"Expected 0 files written, but {files_written} were."
+    assert os.stat(document.path).st_mtime_ns == mtime_before, (
+        f"Unchanged file {document.path} was rewritten."
+    )
+    assert document.state == ProteusState.CLEAN, (
+        f"Document state should be CLEAN but it is {document.state}"
+    )
+
+
     # TODO: Test add_descendant and accept descendant (not prioritary for project)
@@ -0,0 +1,192 @@
+# ==========================================================================
+# File: test_snapshot.py
+# Description: pytest file for PROTEUS project snapshot cache
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+import os
+import shutil
+from pathlib import Path
+
+# --------------------------------------------------------------------------
+# Third-party library imports
+# --------------------------------------------------------------------------
+
+import pytest
+
+# --------------------------------------------------------------------------
+# Project specific imports
+# --------------------------------------------------------------------------
+
+from proteus.model import OBJECTS_REPOSITORY
+from proteus.model.abstract_object import ProteusState
+from proteus.model.object import Object, SNAPSHOT_ATTRIBUTES
+from proteus.model.snapshot import ProjectSnapshot
+from proteus.services.project_service import ProjectService
+from proteus.tests import PROTEUS_SAMPLE_PROJECTS_PATH
+from proteus.tests.fixtures import SampleData
+
+# --------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------
+
+SAMPLE_PROJECT_PATH = PROTEUS_SAMPLE_PROJECTS_PATH / "example_project"
+
+
+@pytest.fixture
+def project_path(tmp_path: Path, mocker) -> Path:
+    """
+    Copies the sample project to a temporal directory and redirects the
+    snapshots directory to it.
+    """
+    mocker.patch("proteus.model.snapshot.PROTEUS_SNAPSHOTS_DIR", tmp_path / "snapshots")
+
+    path = tmp_path / "project"
+    shutil.copytree(SAMPLE_PROJECT_PATH, path)
+    return path
+
+
+def load_project(project_path: Path) -> ProjectService:
+    """
+    Loads the project in the given path using the snapshot cache.
+    """
+    project_service = ProjectService()
+    project_service.load_project(
+        project_path.as_posix(), loading_threads=1, use_snapshot=True
+    )
+    return project_service
+
+
+# --------------------------------------------------------------------------
+# Tests
+# --------------------------------------------------------------------------
+
+
+def test_snapshot_warm_load(project_path: Path, mocker):
+    """
+    Test objects are restored from the snapshot in the second load and
+    they are equal to the parsed ones.
+    """
+    # Arrange -------------------------
+    cold_service: ProjectService = load_project(project_path)
+    assert ProjectSnapshot.snapshot_path(project_path).exists(), (
+        "Snapshot file should be created after loading the project"
+    )
+
+    # Act -----------------------------
+    from_snapshot_spy = mocker.spy(Object, "from_snapshot")
+    warm_service: ProjectService = load_project(project_path)
+
+    # Assert --------------------------
+    objects_number = len(warm_service.project_index) - 1
+    assert from_snapshot_spy.call_count == objects_number, (
+        f"Every object ({objects_number}) should be restored from the snapshot, "
+        f"but {from_snapshot_spy.call_count} were"
+    )
+    assert list(warm_service.project_index) == list(cold_service.project_index), (
+        "Project index loaded from the snapshot is different"
+    )
+
+    for id, element in warm_service.project_index.items():
+        if not isinstance(element, Object):
+            continue
+        parsed: Object = cold_service.project_index[id]
+        for attribute in SNAPSHOT_ATTRIBUTES:
+            assert getattr(element, attribute) == getattr(parsed, attribute), (
+                f"Attribute '{attribute}' of '{id}' restored from the snapshot is "
+                f"different from the parsed one"
+            )
+        assert element.parent.id == parsed.parent.id, (
+            f"Parent of '{id}' restored from the snapshot is different"
+        )
+
+
+def test_snapshot_stale_object(project_path: Path, mocker):
+    """
+    Test only objects whose file changed are parsed again.
+    """
+    # Arrange -------------------------
+    load_project(project_path)
+
+    object_id = SampleData.get("simple_paragraph")
+    object_path = project_path / OBJECTS_REPOSITORY / f"{object_id}.xml"
+    with open(object_path, "ab") as file:
+        file.write(b"\n")
+
+    # Act -----------------------------
+    init_spy = mocker.spy(Object, "__init__")
+    project_service: ProjectService = load_project(project_path)
+
+    # Assert --------------------------
+    parsed_paths = [Path(call.args[1]) for call in init_spy.call_args_list]
+    assert parsed_paths == [object_path], (
+        f"Only the modified object should be parsed, parsed: {parsed_paths}"
+    )
+    assert object_id in project_service.project_index, (
+        f"Modified object '{object_id}' should be in the project index"
+    )
+
+
+def test_snapshot_corrupt(project_path: Path):
+    """
+    Test a corrupt snapshot is discarded and the project is loaded parsing
+    every object.
+    """
+    # Arrange -------------------------
+    expected_service: ProjectService = load_project(project_path)
+    snapshot_path: Path = ProjectSnapshot.snapshot_path(project_path)
+    with open(snapshot_path, "wb") as file:
+        file.write(b"corrupt snapshot")
+
+    # Act -----------------------------
+    project_service: ProjectService = load_project(project_path)
+
+    # Assert --------------------------
+    assert list(project_service.project_index) == list(
+        expected_service.project_index
+    ), "Project index should be loaded from the object files"
+    assert os.path.getsize(snapshot_path) > len(b"corrupt snapshot"), (
+        "Corrupt snapshot should be replaced by a valid one"
+    )
+
+
+def test_snapshot_after_clone_and_delete(project_path: Path):
+    """
+    Test the snapshot stores the children of the objects written when the
+    project is saved. Cloned objects are loaded and deleted objects are
+    not loaded when the project is opened again using the snapshot.
+    """
+    # Arrange -------------------------
+    project_service: ProjectService = load_project(project_path)
+
+    cloned_id = SampleData.get("simple_paragraph")
+    parent_id = project_service._get_element_by_id(cloned_id).parent.id
+    cloned_object: Object = project_service.clone_object(cloned_id, parent_id)
+
+    deleted_object: Object = project_service._get_element_by_id(
+        SampleData.get("simple_section")
+    )
+    deleted_ids = deleted_object.get_ids()
+    for id in deleted_ids:
+        project_service._get_element_by_id(id).state = ProteusState.DEAD
+    deleted_object.parent.state = ProteusState.DIRTY
+
+    # Act -----------------------------
+    project_service.save_project()
+    reopened_service: ProjectService = load_project(project_path)
+
+    # Assert --------------------------
+    parent: Object = reopened_service._get_element_by_id(parent_id)
+    assert cloned_object.id in [child.id for child in parent.children], (
+        f"Cloned object '{cloned_object.id}' should be loaded from the snapshot"
+    )
+    for id in deleted_ids:
+        assert id not in reopened_service.project_index, (
+            f"Deleted object '{id}' should not be loaded from the snapshot"
+        )
@@ -562,7 +562,7 @@ def test_create_object(
     # Assert that _get_archetype_by_id and mock_project.clone_project are called
     # once with the correct parameters
     archetype_service._get_archetype_by_id.assert_called_once_with(archetype_id)
-    mock_object.clone_object.assert_called_once_with(parent, project)
+    mock_object.clone_object.assert_called_once_with(parent, project, codes_map=None)
 
 
 @pytest.mark.parametrize(
@@ -10,7 +10,10 @@
 # Standard library imports
 # --------------------------------------------------------------------------
 
+import sys
+import copy
 from typing import List, Dict
+from dataclasses import replace
 
 # --------------------------------------------------------------------------
 # Third party imports
@@ -23,11 +26,19 @@ from lxml import etree as ET
 # Project specific imports
 # --------------------------------------------------------------------------
 
-from proteus.model import ProteusID, PROTEUS_ANY, PROTEUS_DOCUMENT
+from proteus.model import (
+    ProteusID,
+    ProteusClassTag,
+    PROTEUS_ANY,
+    PROTEUS_DOCUMENT,
+    PROTEUS_CODE,
+    PROTEUS_LINK,
+)
 from proteus.model.project import Project
 from proteus.model.object import Object
 from proteus.model.abstract_object import ProteusState
-from proteus.model.properties import Property, TraceProperty
+from proteus.model.properties import Property, TraceProperty, CodeProperty
+from proteus.model.properties.code_property import ProteusCode
 from proteus.services.project_service import ProjectService
 from proteus.tests import PROTEUS_SAMPLE_PROJECTS_PATH
 from proteus.tests.fixtures import SampleData
@@ -135,6 +146,39 @@ def test_load_project(project_service: ProjectService):
     )
 
 
+def test_load_project_parallel():
+    """
+    Test the parallel loading builds the same project index and children
+    lists as the serial loading.
+    """
+    # Act -----------------------------
+    serial_service: ProjectService = ProjectService()
+    serial_service.load_project(SAMPLE_PROJECT_PATH.as_posix(), loading_threads=1)
+
+    parallel_service: ProjectService = ProjectService()
+    parallel_service.load_project(SAMPLE_PROJECT_PATH.as_posix(), loading_threads=4)
+
+    # Assert --------------------------
+    assert list(serial_service.project_index.keys()) == list(
+        parallel_service.project_index.keys()
+    ), "Parallel loading project index is different from the serial one"
+
+    for id, element in parallel_service.project_index.items():
+        serial_children = [c.id for c in serial_service.project_index[id].get_descendants()]
+        parallel_children = [c.id for c in element.get_descendants()]
+        assert serial_children == parallel_children, (
+            f"Children of '{id}' are different: {parallel_children} != {serial_children}"
+        )
+        if isinstance(element, Object):
+            assert element.parent.id == serial_service.project_index[id].parent.id, (
+                f"Parent of '{id}' is different from the serial loading"
+            )
+
+    assert parallel_service.traces_index == serial_service.traces_index, (
+        "Parallel loading traces index is different from the serial one"
+    )
+
+
 def test_get_project_structure(project_service: ProjectService):
     """
     It tests the get_project_structure method.
@@ -227,6 +271,166 @@ def test_generate_project_xml(
     )
 
 
+# test generate_document_xml ------------------------------------------------------
+def test_generate_document_xml(project_service: ProjectService):
+    """
+    Test the generate_document_xml method. Only the given document must be
+    included in the documents tag and the objects outside the document
+    targeted by its traces must be included in the references tag.
+    """
+    # Arrange -------------------------
+    document_id: ProteusID = SampleData.get("document_1")
+    document: Object = project_service._get_element_by_id(document_id)
+
+    document_ids = document.get_ids()
+    expected_targets = set()
+    for object_id in document_ids:
+        for trace in project_service._get_element_by_id(object_id).get_traces():
+            expected_targets.update(trace.value)
+    expected_targets.difference_update(document_ids)
+
+    # Act -----------------------------
+    document_xml: ET._Element = project_service.generate_document_xml(document_id)
+
+    # Assert --------------------------
+    documents = document_xml.findall("documents/object")
+    assert (
+        len(documents) == 1 and documents[0].attrib["id"] == document_id
+    ), f"Only document '{document_id}' should be generated but found {documents}"
+
+    generated_ids = [
+        element.attrib["id"] for element in documents[0].iter("object")
+    ]
+    assert set(generated_ids) == document_ids, (
+        f"Generated document objects {generated_ids} do not match document "
+        f"objects {document_ids}"
+    )
+
+    referenced_ids = [
+        element.attrib["id"] for element in document_xml.iter("object")
+    ][len(generated_ids) :]
+    assert len(referenced_ids) == len(set(referenced_ids)), (
+        f"Referenced objects are duplicated: {referenced_ids}"
+    )
+    assert expected_targets and expected_targets <= set(referenced_ids), (
+        f"Referenced objects {referenced_ids} do not include every trace "
+        f"target {expected_targets}"
+    )
+
+
+def test_generate_document_xml_deep_tree(project_service: ProjectService):
+    """
+    Test the generate_document_xml method does not reach the recursion
+    limit on deep documents.
+    """
+    # Arrange -------------------------
+    document_id: ProteusID = SampleData.get("document_1")
+    parent: Object = project_service._get_element_by_id(document_id)
+    depth: int = sys.getrecursionlimit() + 100
+    for _ in range(depth):
+        child: Object = copy.copy(parent)
+        child.id = f"{parent.id}-child"
+        child._children = []
+        parent._children = [child]
+        parent = child
+
+    # Act -----------------------------
+    document_xml: ET._Element = project_service.generate_document_xml(document_id)
+
+    # Assert --------------------------
+    generated_ids = {
+        element.attrib["id"] for element in document_xml.iter("object")
+    }
+    assert parent.id in generated_ids, (
+        f"Deepest object '{parent.id}' should be generated"
+    )
+
+
+def test_generate_document_xml_references(project_service: ProjectService):
+    """
+    Test the references generated by the generate_document_xml method. Link
+    traces targets are generated with their descendants, the rest of the
+    targets are generated as stubs without children. Every trace target in
+    the xml is included, including the targets of the references traces.
+    """
+    # Arrange -------------------------
+    document_id: ProteusID = SampleData.get("document_with_traced_objects")
+    document: Object = project_service._get_element_by_id(document_id)
+    linked_section: Object = project_service._get_element_by_id(
+        SampleData.get("section_with_2_children_targeted")
+    )
+
+    # Section with children and object with traces of other document
+    stub_section: Object = project_service._get_element_by_id(
+        SampleData.get("section_dl_1")
+    )
+    stub_source: Object = next(
+        object
+        for object in project_service._get_element_by_id(
+            SampleData.get("document_1")
+        ).get_descendants_recursively()
+        if object.id not in linked_section.get_ids()
+        and any(trace.value for trace in object.get_traces())
+    )
+
+    # Turn the document traces into a link to the linked section and a
+    # trace to the stub section and the stub source
+    link_trace, trace = document.get_traces()[:2]
+    project_service.update_properties(
+        document.id,
+        [
+            replace(link_trace, value=[linked_section.id], type=PROTEUS_LINK),
+            replace(trace, value=[stub_section.id, stub_source.id]),
+        ],
+    )
+
+    # Act -----------------------------
+    document_xml: ET._Element = project_service.generate_document_xml(document_id)
+
+    # Assert --------------------------
+    references = document_xml.find("references")
+    reference_ids = [element.attrib["id"] for element in references]
+    assert linked_section.id in reference_ids, (
+        f"Link target '{linked_section.id}' should be in the references"
+    )
+
+    section_element = references[reference_ids.index(linked_section.id)]
+    generated_children = {
+        element.attrib["id"] for element in section_element.iter("object")
+    }
+    assert generated_children == linked_section.get_ids(), (
+        f"Link target should be generated with its descendants, generated "
+        f"{generated_children}"
+    )
+
+    assert {stub_section.id, stub_source.id} <= set(reference_ids), (
+        "Trace targets should be in the references"
+    )
+    for element in references:
+        if element.attrib["id"] != linked_section.id:
+            assert element.find("children/object") is None, (
+                f"Reference stub '{element.attrib['id']}' should not have children"
+            )
+
+    generated_ids = {element.attrib["id"] for element in document_xml.iter("object")}
+    for target_element in document_xml.iter("trace"):
+        target_id: ProteusID = target_element.attrib["target"]
+        target: Object = project_service.project_index.get(target_id)
+        if target is not None and target.state != ProteusState.DEAD:
+            assert target_id in generated_ids, (
+                f"Trace target '{target_id}' is not included in the xml"
+            )
+
+
+def test_generate_document_xml_negative(project_service: ProjectService):
+    """
+    Test the generate_document_xml method fails when the given element is
+    not a document.
+    """
+    # Act & Assert --------------------
+    with pytest.raises(AssertionError):
+        project_service.generate_document_xml(SAMPLE_OBJECT_ID)
+
 
 @pytest.mark.parametrize(
     "object_name, expected_traced_objects, expected_sources_for_each_object",
@@ -566,6 +770,47 @@ def test_change_object_position_different_parent_none(
 # --------------------------------------------------------------------------
 
 
+def test_has_unsaved_changes(project_service: ProjectService):
+    """
+    Test unsaved changes are tracked through the objects state changes.
+    DEAD objects are not considered unsaved changes.
+    """
+    # Arrange -------------------------
+    object: Object = project_service._get_element_by_id(SAMPLE_OBJECT_ID)
+    assert not project_service.has_unsaved_changes(), (
+        "Loaded project should not have unsaved changes"
+    )
+
+    # Act -----------------------------
+    object.state = ProteusState.DIRTY
+
+    # Assert --------------------------
+    assert project_service.has_unsaved_changes(), (
+        "Project should have unsaved changes after an object is DIRTY"
+    )
+    assert object in project_service.project.unsaved_objects, (
+        f"Object '{object.id}' should be in the unsaved objects registry"
+    )
+
+    # Act -----------------------------
+    object.state = ProteusState.DEAD
+
+    # Assert --------------------------
+    assert not project_service.has_unsaved_changes(), (
+        "DEAD objects should not be considered unsaved changes"
+    )
+
+    # Act -----------------------------
+    cloned_object: Object = project_service.clone_object(
+        SAMPLE_DOCUMENT_ID, project_service.project.id
+    )
+
+    # Assert --------------------------
+    assert cloned_object in project_service.project.unsaved_objects, (
+        f"Cloned object '{cloned_object.id}' should be in the unsaved objects registry"
+    )
+
+
 # test_update_properties ---------------------------------------------------
 def test_update_properties(mocker, basic_project_service: ProjectService):
     """
@@ -643,8 +888,8 @@ def test_update_traces_properties_discard_one_invalid_target(mocker, basic_proje
     """
 
     # Arrange -------------------------
-    # Mock _load_traces_index method
-    mocker.patch.object(basic_project_service, "_load_traces_index", return_value=None)
+    # Mock _update_traces_index method
+    mocker.patch.object(basic_project_service, "_update_traces_index", return_value=None)
 
     # Valid target object
     valid_target_mock: Object = mocker.MagicMock(spec=Object)
@@ -680,8 +925,8 @@ def test_update_traces_properties_discard_one_invalid_target(mocker, basic_proje
         basic_project_service, "_get_element_by_id", side_effect=get_element_by_id_side_effect
     )
 
-    # Mock load_traces_index method
-    mocker.patch.object(basic_project_service, "_load_traces_index", return_value=None)
+    # Mock update_traces_index method
+    mocker.patch.object(basic_project_service, "_update_traces_index", return_value=None)
 
     # Set valid and invalid targets
     mock_trace.name = "mock_trace_name"
@@ -717,10 +962,8 @@ def test_update_traces_properties_discard_one_invalid_target(mocker, basic_proje
         mock_element.set_property.called_once_with(mock_trace_clone)
     ), f"set_property method should be called once"
 
-    # Check that load_traces_index is called
-    assert (
-        basic_project_service._load_traces_index.call_count == 1
-    ), f"_load_traces_index should be called once"
+    # Check that the traces index is updated for the element
+    basic_project_service._update_traces_index.assert_called_once_with("element_id")
 
     # Element state is not checked since it is set_property responsibility to update it
 
@@ -775,7 +1018,7 @@ def test_update_traces_negative_document_trace(
         basic_project_service, "_get_element_by_id", return_value=mock_element
     )
 
-    mocker.patch.object(basic_project_service, "_load_traces_index", return_value=None)
+    mocker.patch.object(basic_project_service, "_update_traces_index", return_value=None)
 
     mock_trace.value = ["id"]
     trace_list = [mock_trace]
@@ -790,10 +1033,10 @@ def test_update_traces_negative_document_trace(
         len(mock_element.properties) == 0
     ), f"Object properties should be empty but it is {mock_element.properties}"
 
-    # load_traces_index should not be called
+    # update_traces_index should not be called
     assert (
-        basic_project_service._load_traces_index.call_count == 0
-    ), f"_load_traces_index should not be called"
+        basic_project_service._update_traces_index.call_count == 0
+    ), f"_update_traces_index should not be called"
 
     # Element state should remain CLEAN
     assert (
@@ -820,7 +1063,7 @@ def test_update_traces_negative_dead_object(
         basic_project_service, "_get_element_by_id", return_value=mock_element
     )
 
-    mocker.patch.object(basic_project_service, "_load_traces_index", return_value=None)
+    mocker.patch.object(basic_project_service, "_update_traces_index", return_value=None)
 
     mock_trace.value = ["id"]
     trace_list = [mock_trace]
@@ -835,13 +1078,13 @@ def test_update_traces_negative_dead_object(
         len(mock_element.properties) == 0
     ), f"Object properties should be empty but it is {mock_element.properties}"
 
-    # load_traces_index should not be called
+    # update_traces_index should not be called
     assert (
-        basic_project_service._load_traces_index.call_count == 0
-    ), f"_load_traces_index should not be called"
+        basic_project_service._update_traces_index.call_count == 0
+    ), f"_update_traces_index should not be called"
 
     # Cannot check CLEAN state because the element is tracing itself and it is a dead object
-    # Anyways, if _load_traces_index is not called, the state should remain the same. It is
+    # Anyways, if _update_traces_index is not called, the state should remain the same. It is
     # tested in previous tests.
 
 
@@ -865,7 +1108,7 @@ def test_update_traces_negative_self_tracing(
         basic_project_service, "_get_element_by_id", return_value=mock_element
     )
 
-    mocker.patch.object(basic_project_service, "_load_traces_index", return_value=None)
+    mocker.patch.object(basic_project_service, "_update_traces_index", return_value=None)
 
     mock_trace.value = ["id"]
     trace_list = [mock_trace]
@@ -880,10 +1123,10 @@ def test_update_traces_negative_self_tracing(
         len(mock_element.properties) == 0
     ), f"Object traces should be empty but it is {mock_element.properties}"
 
-    # load_traces_index should not be called
+    # update_traces_index should not be called
     assert (
-        basic_project_service._load_traces_index.call_count == 0
-    ), f"_load_traces_index should not be called"
+        basic_project_service._update_traces_index.call_count == 0
+    ), f"_update_traces_index should not be called"
 
     # Element state should remain CLEAN
     assert (
@@ -892,6 +1135,209 @@ def test_update_traces_negative_self_tracing(
 
 
 
+def test_update_properties_updates_traces_index(project_service: ProjectService):
+    """
+    Test the traces index is updated incrementally when the traces of an
+    object are modified. The result must be the same as loading the traces
+    index from scratch.
+    """
+    # Arrange -------------------------
+    source_id: ProteusID = SampleData.get("dependant_paragraph")
+    new_target_id: ProteusID = SampleData.get("simple_paragraph")
+    source: Object = project_service._get_element_by_id(source_id)
+    trace: TraceProperty = source.get_traces()[0]
+    old_targets = trace.value.copy()
+
+    # Act -----------------------------
+    project_service.update_properties(source_id, [trace.clone([new_target_id])])
+
+    # Assert --------------------------
+    assert source_id in project_service.traces_index[new_target_id], (
+        f"Source '{source_id}' should be in the traces index of '{new_target_id}'"
+    )
+    for target in old_targets:
+        assert source_id not in project_service.traces_index.get(target, set()), (
+            f"Source '{source_id}' should not be in the traces index of '{target}'"
+        )
+
+    incremental_index = project_service.traces_index
+    project_service._load_traces_index()
+    assert incremental_index == project_service.traces_index, (
+        f"Incremental traces index {incremental_index} is different from the "
+        f"loaded traces index {project_service.traces_index}"
+    )
+
+
+def test_refresh_indexes_dead_objects(project_service: ProjectService):
+    """
+    Test the traces index is updated when objects change from and to DEAD
+    state. DEAD objects must not be sources in the traces index.
+    """
+    # Arrange -------------------------
+    object_id: ProteusID = SampleData.get("section_with_dependencies_outside_and_inside")
+    object: Object = project_service._get_element_by_id(object_id)
+    ids = object.get_ids()
+    old_states = {id: project_service._get_element_by_id(id).state for id in ids}
+    original_index = {
+        target: sources.copy()
+        for target, sources in project_service.traces_index.items()
+    }
+
+    # Act -----------------------------
+    for id in ids:
+        project_service._get_element_by_id(id).state = ProteusState.DEAD
+    project_service.refresh_indexes(ids)
+
+    # Assert --------------------------
+    for target, sources in project_service.traces_index.items():
+        assert not sources & ids, (
+            f"DEAD sources {sources & ids} found in the traces index of '{target}'"
+        )
+
+    # Act -----------------------------
+    for id in ids:
+        project_service._get_element_by_id(id).state = old_states[id]
+    project_service.refresh_indexes(ids)
+
+    # Assert --------------------------
+    assert project_service.traces_index == original_index, (
+        f"Traces index {project_service.traces_index} was not restored to "
+        f"{original_index}"
+    )
+
+
+def test_refresh_indexes_dead_targets(project_service: ProjectService):
+    """
+    Test DEAD targets are removed from the traces index, even if their
+    sources still point to them, and they are added back when revived.
+    """
+    # Arrange -------------------------
+    object_id: ProteusID = SampleData.get("section_with_2_children_targeted")
+    object: Object = project_service._get_element_by_id(object_id)
+    ids = object.get_ids()
+    original_index = {
+        target: sources.copy()
+        for target, sources in project_service.traces_index.items()
+    }
+    assert project_service.get_traces_dependencies_outside(
+        object_id
+    ), f"Object '{object_id}' should have traces pointing to it from outside"
+
+    # Act -----------------------------
+    for id in ids:
+        project_service._get_element_by_id(id).state = ProteusState.DEAD
+    project_service.refresh_indexes(ids)
+
+    # Assert --------------------------
+    dead_targets = set(project_service.traces_index) & set(ids)
+    assert not dead_targets, f"DEAD targets {dead_targets} found in the traces index"
+
+    incremental_index = project_service.traces_index
+    project_service._load_traces_index()
+    assert incremental_index == project_service.traces_index, (
+        f"Incremental traces index {incremental_index} differs from the "
+        f"loaded traces index {project_service.traces_index}"
+    )
+
+    # Act -----------------------------
+    for id in ids:
+        project_service._get_element_by_id(id).state = ProteusState.CLEAN
+    project_service.refresh_indexes(ids)
+
+    # Assert --------------------------
+    assert project_service.traces_index == original_index, (
+        f"Traces index {project_service.traces_index} was not restored to "
+        f"{original_index}"
+    )
+
+
+def test_classes_index_incremental(project_service: ProjectService):
+    """
+    Test the classes index is updated when objects are cloned, deleted,
+    restored or their classes change. The result must be the same as
+    loading the classes index from scratch.
+    """
+    # Arrange -------------------------
+    object_id: ProteusID = SampleData.get("section_dl_2")
+    object: Object = project_service._get_element_by_id(object_id)
+    main_class: ProteusClassTag = object.classes[-1]
+
+    # Act -----------------------------
+    cloned_object: Object = project_service.clone_object(object_id, object.parent.id)
+    object.state = ProteusState.DEAD
+    project_service.refresh_indexes(object.get_ids())
+    cloned_object.classes = cloned_object.classes + ("new-class",)
+    project_service.refresh_indexes([cloned_object.id])
+
+    # Assert --------------------------
+    assert object_id not in project_service.classes_index[main_class], (
+        f"DEAD object '{object_id}' should not be in the classes index"
+    )
+    assert project_service.get_objects(["new-class"]) == [cloned_object], (
+        f"Only the cloned object should have the class 'new-class'"
+    )
+    assert "new-class" in project_service.get_project_available_classes(), (
+        f"'new-class' should be an available class of the project"
+    )
+
+    incremental_index = {
+        c: ids.copy() for c, ids in project_service.classes_index.items()
+    }
+    incremental_main_classes = project_service.main_classes.copy()
+    project_service._load_classes_index()
+    assert incremental_index == project_service.classes_index, (
+        f"Incremental classes index is different from the loaded classes index"
+    )
+    assert incremental_main_classes == project_service.main_classes, (
+        f"Incremental main classes {incremental_main_classes} are different "
+        f"from the loaded main classes {project_service.main_classes}"
+    )
+
+
+
+def test_codes_index_incremental(project_service: ProjectService):
+    """
+    Test the codes index is updated when objects are cloned, deleted or
+    their codes change. The biggest codes must be the same as the ones
+    calculated traversing the project.
+    """
+    # Arrange -------------------------
+    object_id: ProteusID = SampleData.get("objective_dl_1")
+    object: Object = project_service._get_element_by_id(object_id)
+    code_property: CodeProperty = object.get_property(PROTEUS_CODE)
+
+    # Act -----------------------------
+    project_service.clone_object(object_id, object.parent.id)
+    biggest_after_clone: Dict[str, ProteusCode] = project_service.get_biggest_codes()
+    traversal_after_clone: Dict[str, ProteusCode] = object._calculate_biggest_code(
+        project_service.project
+    )
+
+    new_code: ProteusCode = ProteusCode(code_property.value.prefix, 999)
+    project_service.update_properties(object_id, [code_property.clone(new_code)])
+    biggest_after_update: ProteusCode = project_service.biggest_codes[
+        new_code.prefix
+    ]
+
+    object.state = ProteusState.DEAD
+    project_service.refresh_indexes(object.get_ids())
+
+    # Assert --------------------------
+    assert biggest_after_clone == traversal_after_clone, (
+        f"Biggest codes after clone {biggest_after_clone} are different from "
+        f"the biggest codes calculated traversing the project {traversal_after_clone}"
+    )
+    assert biggest_after_update == new_code, (
+        f"The updated code '{new_code}' should be the biggest code but it is "
+        f"'{biggest_after_update}'"
+    )
+    assert project_service.get_biggest_codes() == object._calculate_biggest_code(
+        project_service.project
+    ), (
+        f"Biggest codes after delete are different from the biggest codes "
+        f"calculated traversing the project"
+    )
+
 # test_get_element_by_id ---------------------------------------------------
 def test_get_element_by_id(
     mocker,
@@ -921,24 +1367,65 @@ def test_get_element_by_id(
 
 def test_get_element_by_id_negative(
     mocker,
-    basic_project_service: ProjectService,
+    project_service: ProjectService,
 ):
     """
-    Test the _get_element_by_id method asserting and populating the index
-    when the element is not in the index.
+    Test the _get_element_by_id method asserting when the element is not in
+    the project. The index must not be populated since the id is not in the
+    project ids.
     """
     # Arrange -------------------------
-    # Mock the _populate_index method
-    mocker.patch.object(basic_project_service, "_populate_index", return_value=None)
+    # Spy the _populate_index method
+    mocker.spy(project_service, "_populate_index")
 
     # Act | Assert --------------------
     with pytest.raises(AssertionError):
-        element = basic_project_service._get_element_by_id("id")
+        project_service._get_element_by_id("id")
+
+    # Check that _populate_index is not called
+    assert (
+        project_service._populate_index.call_count == 0
+    ), f"_populate_index should not be called"
+
+
+def test_get_element_by_id_after_clone_and_save(
+    mocker,
+    project_service: ProjectService,
+):
+    """
+    Test cloned objects are added to the project index and the project ids
+    are kept after saving, so neither the index nor the ids are calculated
+    traversing the project.
+    """
+    # Arrange -------------------------
+    object: Object = project_service._get_element_by_id(SAMPLE_OBJECT_ID)
+    mocker.spy(project_service, "_populate_index")
+    mocker.patch.object(Object, "save")
+    mocker.patch.object(Object, "write_xml", return_value=False)
+    mocker.patch.object(Project, "write_xml", return_value=False)
+
+    # Act -----------------------------
+    cloned_object: Object = project_service.clone_object(
+        SAMPLE_OBJECT_ID, object.parent.id
+    )
+    project_service.save_project()
+    mocker.spy(Project, "get_ids")
 
-    # Check that _populate_index is called
+    # Assert --------------------------
+    for id in cloned_object.get_ids():
+        assert (
+            project_service._get_element_by_id(id).id == id
+        ), f"Cloned object '{id}' should be in the project index"
+        assert id in project_service.project.ids, (
+            f"Cloned object '{id}' should be in the project ids"
+        )
+
+    assert (
+        project_service._populate_index.call_count == 0
+    ), f"_populate_index should not be called"
     assert (
-        basic_project_service._populate_index.call_count == 1
-    ), f"_populate_index should be called once"
+        Project.get_ids.call_count == 0
+    ), f"Project ids should not be calculated after saving"
 
 
 @pytest.mark.parametrize(
@@ -978,6 +1465,7 @@ def test_get_objects(
         project_index[index] = mock_object
 
     basic_project_service.project_index = project_index
+    basic_project_service._load_classes_index()
 
     # Calculate expected objects
     # In the original method selected classes are iterated for each object
@@ -1032,6 +1520,7 @@ def test_get_objects_any(
         project_index[index] = mock_object
 
     basic_project_service.project_index = project_index
+    basic_project_service._load_classes_index()
 
     # Act -----------------------------
     objects = basic_project_service.get_objects(selected_classes)
@@ -18,6 +18,7 @@ from pathlib import Path
 
 import pytest
 import lxml.etree as ET
+import lxml.html as LH
 
 # --------------------------------------------------------------------------
 # Project specific imports
@@ -25,7 +26,11 @@ import lxml.etree as ET
 
 from proteus.application.configuration.config import Config
 from proteus.application.resources.plugins import Plugins
+from proteus.model.object import Object
+from proteus.model.abstract_object import ProteusState
+from proteus.model.template import Template
 from proteus.services.render_service import RenderService
+from proteus.services.project_service import ProjectService
 from proteus.tests import PROTEUS_SAMPLE_PROJECTS_PATH, PROTEUS_SAMPLE_DATA_PATH
 
 # --------------------------------------------------------------------------
@@ -65,6 +70,23 @@ def render_service():
     Config().profile_settings.xslt_directory = prev_xslt_dir
 
 
+@pytest.fixture()
+def profile_render_service():
+    """
+    Fixture for RenderService object using the templates of the current
+    profile, including the components methods used by them.
+    """
+    # Load plugins
+    Plugins().load_plugins(Config().profile_settings.plugins_directory)
+
+    # Create service
+    service = RenderService()
+
+    # Add plugins XSLT functions
+    service.add_functions_to_namespace(Plugins().get_xslt_functions())
+
+    return service
+
 
 @pytest.fixture()
 def example_xml() -> ET.Element:
@@ -98,6 +120,20 @@ def normalize_string(string: str) -> str:
     return " ".join(string.strip().split())
 
 
+def normalize_element(element: ET.Element) -> str:
+    """
+    Serialize an HTML element ignoring the whitespace around its texts
+    to compare it with another element
+    """
+    element = LH.fromstring(
+        ET.tostring(element, method="html", encoding="unicode", with_tail=False)
+    )
+    for child in element.iter():
+        child.text = (child.text or "").strip() or None
+        child.tail = (child.tail or "").strip() or None
+    return ET.tostring(element, method="html", encoding="unicode")
+
+
 # --------------------------------------------------------------------------
 # Integration tests
 # --------------------------------------------------------------------------
@@ -152,6 +188,116 @@ def test_render(
         html_string == example_html
     ), "Render result does not match with the expected result from the example HTML file"
 
+@pytest.mark.order(2)
+def test_render_fragment(
+    mocker, render_service: RenderService, example_xml: ET.Element
+):
+    """
+    Test for render_fragment method. The fragment of an object is rendered
+    by the archetype template of the object, wrapped in an element with the
+    object id. None is returned if the object is not in the document.
+    """
+    # Arrange -------------------------
+    object_id: str = "3XmcbX8umpkB"
+
+    # Mock StataManager get_current_document method
+    mocker.patch(
+        "proteus.application.state.manager.StateManager.get_current_document",
+        return_value="722GfFiezi5F",
+    )
+
+    # Act -----------------------------
+    fragment: str = render_service.render_fragment(
+        example_xml, DEFAULT_TEMPLATE, object_id
+    )
+    missing_fragment: str = render_service.render_fragment(
+        example_xml, DEFAULT_TEMPLATE, "nonexistent_id"
+    )
+
+    # Assert --------------------------
+    assert isinstance(
+        fragment, str
+    ), f"Fragment must be an instance of string but it is {type(fragment)}"
+
+    fragment_root: ET.Element = ET.fromstring(fragment, ET.HTMLParser()).find(
+        ".//body/*"
+    )
+    assert (
+        fragment_root.get("data-proteus-id") == object_id
+    ), f"Fragment root must have the object id but it has {fragment_root.attrib}"
+
+    assert (
+        missing_fragment is None
+    ), f"Fragment of a nonexistent object must be None but it is {missing_fragment}"
+
+
+@pytest.mark.order(2)
+def test_render_fragment_matches_render(
+    mocker, profile_render_service: RenderService
+):
+    """
+    Test the fragment of every object that can be patched in the view
+    (not of a full reload class nor inside an object of a full reload
+    children class) matches the element of the object in the whole
+    document render, using the default template of the profile.
+    """
+    # Arrange -------------------------
+    template_name: str = "default"
+    template: Template = [
+        t for t in profile_render_service.get_templates() if t.name == template_name
+    ][0]
+
+    project_service = ProjectService()
+    project_service.load_project(
+        (PROTEUS_SAMPLE_PROJECTS_PATH / "example_project").as_posix()
+    )
+
+    def is_patchable(object: Object) -> bool:
+        if not set(template.full_reload_classes).isdisjoint(object.classes):
+            return False
+        ancestor = object.parent
+        while isinstance(ancestor, Object):
+            if not set(template.full_reload_children_classes).isdisjoint(
+                ancestor.classes
+            ):
+                return False
+            ancestor = ancestor.parent
+        return True
+
+    get_current_document = mocker.patch(
+        "proteus.application.state.manager.StateManager.get_current_document",
+    )
+
+    for document in project_service.project.documents:
+        if document.state == ProteusState.DEAD:
+            continue
+
+        get_current_document.return_value = document.id
+        xml: ET.Element = project_service.generate_document_xml(document.id)
+
+        # Act -------------------------
+        html_string: str = profile_render_service.render(xml, template_name)
+        page: ET.Element = LH.fromstring(html_string)
+
+        for object in document.walk_preorder(skip_dead=True):
+            if object.id == document.id or not is_patchable(object):
+                continue
+
+            fragment: str = profile_render_service.render_fragment(
+                xml, template_name, object.id
+            )
+
+            # Assert ------------------
+            elements = page.xpath(f'//*[@data-proteus-id="{object.id}"]')
+            assert (
+                len(elements) == 1
+            ), f"Object '{object.id}' must be rendered once in the document but it is rendered {len(elements)} times"
+
+            assert normalize_element(elements[0]) == normalize_element(
+                LH.fromstring(fragment)
+            ), f"Fragment of object '{object.id}' {object.classes} does not match its element in the document"
+
+
 @pytest.mark.order(3)
 def test_render_error(mocker, render_service: RenderService, example_xml: ET.Element):
     """
@@ -184,3 +330,71 @@ def test_render_error(mocker, render_service: RenderService, example_xml: ET.Ele
 # --------------------------------------------------------------------------
 # Unit tests
 # --------------------------------------------------------------------------
+
+def test_render_cache_lru_eviction(mocker, render_service: RenderService):
+    """
+    Test the render cache evicts the least recently used entries when the
+    memory budget is exceeded and clear_cache removes every entry.
+    """
+    # Arrange -------------------------
+    html_string: str = "x" * 400 * 1024
+    mocker.patch.object(Config().app_settings, "render_cache_size", 1)
+    mocker.patch.object(Config().app_settings, "xslt_debug_mode", False)
+
+    # Act -----------------------------
+    render_service.cache_render("doc_1", DEFAULT_TEMPLATE, 0, html_string)
+    render_service.cache_render("doc_2", DEFAULT_TEMPLATE, 0, html_string)
+
+    # Use doc_1 so doc_2 is the least recently used entry
+    render_service.get_cached_render("doc_1", DEFAULT_TEMPLATE, 0)
+    render_service.cache_render("doc_3", DEFAULT_TEMPLATE, 0, html_string)
+
+    # Assert --------------------------
+    assert (
+        render_service.get_cached_render("doc_1", DEFAULT_TEMPLATE, 0) == html_string
+    ), "Recently used entry must be kept in the cache"
+    assert (
+        render_service.get_cached_render("doc_2", DEFAULT_TEMPLATE, 0) is None
+    ), "Least recently used entry must be evicted from the cache"
+    assert (
+        render_service.get_cached_render("doc_3", DEFAULT_TEMPLATE, 0) == html_string
+    ), "Last stored entry must be in the cache"
+    assert (
+        render_service.get_cached_render("doc_1", DEFAULT_TEMPLATE, 1) is None
+    ), "Entries of other model versions must not be returned"
+
+    render_service.clear_cache()
+
+    assert (
+        render_service.get_cached_render("doc_1", DEFAULT_TEMPLATE, 0) is None
+    ), "Cache must be empty after clear_cache"
+    assert render_service._html_cache_size == 0, "Cache size must be 0 after clear"
+
+
+def test_render_cache_disabled(mocker, render_service: RenderService):
+    """
+    Test nothing is cached if the render cache size is 0 or the XSLT debug
+    mode is enabled.
+    """
+    # Arrange -------------------------
+    mocker.patch.object(Config().app_settings, "render_cache_size", 0)
+
+    # Act -----------------------------
+    render_service.cache_render("doc_1", DEFAULT_TEMPLATE, 0, "<html></html>")
+
+    # Assert --------------------------
+    assert (
+        render_service.get_cached_render("doc_1", DEFAULT_TEMPLATE, 0) is None
+    ), "Nothing must be cached if the render cache size is 0"
+
+    # Arrange -------------------------
+    mocker.patch.object(Config().app_settings, "render_cache_size", 64)
+    mocker.patch.object(Config().app_settings, "xslt_debug_mode", True)
+
+    # Act -----------------------------
+    render_service.cache_render("doc_1", DEFAULT_TEMPLATE, 0, "<html></html>")
+
+    # Assert --------------------------
+    assert (
+        render_service.get_cached_render("doc_1", DEFAULT_TEMPLATE, 0) is None
+    ), "Nothing must be cached in XSLT debug mode"
@@ -0,0 +1,196 @@
+# ==========================================================================
+# File: test_trace_graph_service.py
+# Description: pytest file for the PROTEUS trace graph service
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------
+# Third party imports
+# --------------------------------------------------------------------------
+
+import pytest
+
+# --------------------------------------------------------------------------
+# Project specific imports
+# --------------------------------------------------------------------------
+
+from proteus.model import ProteusID, PROTEUS_DEPENDENCY
+from proteus.model.object import Object
+from proteus.model.properties import TraceProperty
+from proteus.services.project_service import ProjectService
+from proteus.services.trace_graph_service import TraceGraphService
+from proteus.tests import PROTEUS_SAMPLE_PROJECTS_PATH
+from proteus.tests.fixtures import SampleData
+
+# --------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------
+
+SAMPLE_PROJECT_PATH = PROTEUS_SAMPLE_PROJECTS_PATH / "example_project"
+OTHER_TYPE = ":Proteus-other"
+
+
+@pytest.fixture
+def trace_graph():
+    """
+    It returns a trace graph with the following edges:
+
+        a -> b (dependency), b -> c (dependency), c -> d (other),
+        e -> c (dependency), d -> a (dependency)
+    """
+    graph = TraceGraphService()
+    graph.update_source("a", {PROTEUS_DEPENDENCY: {"b"}})
+    graph.update_source("b", {PROTEUS_DEPENDENCY: {"c"}})
+    graph.update_source("c", {OTHER_TYPE: {"d"}})
+    graph.update_source("e", {PROTEUS_DEPENDENCY: {"c"}})
+    graph.update_source("d", {PROTEUS_DEPENDENCY: {"a"}})
+    return graph
+
+
+# --------------------------------------------------------------------------
+# Tests
+# --------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "id, trace_types, expected_targets, expected_sources",
+    [
+        ("c", None, {"d"}, {"b", "e"}),
+        ("c", [PROTEUS_DEPENDENCY], set(), {"b", "e"}),
+        ("c", [OTHER_TYPE], {"d"}, set()),
+        ("e", None, {"c"}, set()),
+        ("unknown", None, set(), set()),
+    ],
+)
+def test_targets_and_sources_of(
+    trace_graph: TraceGraphService,
+    id: ProteusID,
+    trace_types,
+    expected_targets,
+    expected_sources,
+):
+    """
+    Test direct targets and sources filtered by trace type.
+    """
+    targets = trace_graph.targets_of(id, trace_types)
+    sources = trace_graph.sources_of(id, trace_types)
+
+    assert targets == expected_targets, (
+        f"Targets of '{id}' should be {expected_targets} but are {targets}"
+    )
+    assert sources == expected_sources, (
+        f"Sources of '{id}' should be {expected_sources} but are {sources}"
+    )
+
+
+@pytest.mark.parametrize(
+    "id, trace_types, max_depth, expected_downstream, expected_upstream",
+    [
+        (
+            "a",
+            None,
+            None,
+            {"b": 1, "c": 2, "d": 3},
+            {"d": 1, "c": 2, "b": 3, "e": 3},
+        ),
+        ("a", None, 2, {"b": 1, "c": 2}, {"d": 1, "c": 2}),
+        ("a", [PROTEUS_DEPENDENCY], None, {"b": 1, "c": 2}, {"d": 1}),
+        ("c", None, 0, {}, {}),
+        ("e", None, None, {"c": 1, "d": 2, "a": 3, "b": 4}, {}),
+    ],
+)
+def test_closures(
+    trace_graph: TraceGraphService,
+    id: ProteusID,
+    trace_types,
+    max_depth,
+    expected_downstream,
+    expected_upstream,
+):
+    """
+    Test transitive closures with trace types and depth limits. Cycles
+    must not include the starting object.
+    """
+    downstream = trace_graph.downstream_closure(id, trace_types, max_depth)
+    upstream = trace_graph.upstream_closure(id, trace_types, max_depth)
+
+    assert downstream == expected_downstream, (
+        f"Downstream closure of '{id}' should be {expected_downstream} "
+        f"but is {downstream}"
+    )
+    assert upstream == expected_upstream, (
+        f"Upstream closure of '{id}' should be {expected_upstream} "
+        f"but is {upstream}"
+    )
+
+
+def test_closures_cache_invalidation(trace_graph: TraceGraphService):
+    """
+    Test closures are cached until the graph changes and returned results
+    are copies of the cached ones.
+    """
+    # Arrange -------------------------
+    upstream = trace_graph.upstream_closure("c")
+    upstream["modified"] = 1
+
+    # Assert --------------------------
+    assert trace_graph._closures, "Closure should be cached"
+    assert "modified" not in trace_graph.upstream_closure("c"), (
+        "Modifying a returned closure should not modify the cache"
+    )
+
+    # Same edges do not invalidate the cache
+    trace_graph.update_source("e", {PROTEUS_DEPENDENCY: {"c"}})
+    assert trace_graph._closures, "Cache should be kept if the edges are the same"
+
+    # Act -----------------------------
+    trace_graph.update_source("e", {})
+
+    # Assert --------------------------
+    assert not trace_graph._closures, "Cache should be cleared on graph changes"
+    assert "e" not in trace_graph.upstream_closure("c"), (
+        "Removed source 'e' should not be in the upstream closure of 'c'"
+    )
+    assert "e" not in trace_graph._reverse["c"][PROTEUS_DEPENDENCY], (
+        "Removed source 'e' should not be in the reverse adjacency of 'c'"
+    )
+
+
+def test_project_service_trace_graph():
+    """
+    Test the trace graph of the project service is consistent with the
+    traces index when traces are loaded and modified.
+    """
+    # Arrange -------------------------
+    project_service: ProjectService = ProjectService()
+    project_service.load_project(SAMPLE_PROJECT_PATH.as_posix())
+    graph: TraceGraphService = project_service.trace_graph
+
+    # Assert --------------------------
+    for target, sources in project_service.traces_index.items():
+        assert graph.sources_of(target) == sources, (
+            f"Sources of '{target}' in the trace graph {graph.sources_of(target)} "
+            f"are different from the traces index {sources}"
+        )
+
+    # Act -----------------------------
+    source_id: ProteusID = SampleData.get("dependant_paragraph")
+    new_target_id: ProteusID = SampleData.get("simple_paragraph")
+    source: Object = project_service._get_element_by_id(source_id)
+    trace: TraceProperty = source.get_traces()[0]
+    project_service.update_properties(source_id, [trace.clone([new_target_id])])
+
+    # Assert --------------------------
+    assert graph.targets_of(source_id, [trace.type]) == {new_target_id}, (
+        f"Targets of '{source_id}' should be {{'{new_target_id}'}} but are "
+        f"{graph.targets_of(source_id, [trace.type])}"
+    )
+    assert source_id in graph.upstream_closure(new_target_id), (
+        f"'{source_id}' should be in the upstream closure of '{new_target_id}'"
+    )
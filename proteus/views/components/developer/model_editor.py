@@ -588,7 +588,7 @@ class RawObjectEditor(ProteusDialog):
     # Description: Manage the save button clicked event. It saves the
     #              changes made to the object properties and attributes.
     # Date       : 11/10/2024
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def save_button_clicked(self):
@@ -693,9 +693,9 @@ class RawObjectEditor(ProteusDialog):
         # If there is no changes, do not update the object
         if (
             # Check attributes
-            new_classes != self.object.classes
-            or new_acceptedChildren != self.object.acceptedChildren
-            or new_acceptedParents != self.object.acceptedParents
+            tuple(new_classes) != self.object.classes
+            or tuple(new_acceptedChildren) != self.object.acceptedChildren
+            or tuple(new_acceptedParents) != self.object.acceptedParents
             or new_selectedCategory != self.object.selectedCategory
             or new_numbered != self.object.numbered
             or original_properties_changed
@@ -710,6 +710,7 @@ class RawObjectEditor(ProteusDialog):
                 new_selectedCategory,
                 new_numbered,
                 new_properties,
+                self._controller._project_service,
             )
 
             self._controller._push(command)
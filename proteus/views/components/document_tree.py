@@ -59,6 +59,7 @@ from proteus.application.events import (
     SelectObjectEvent,
     SaveProjectEvent,
     ModifyObjectEvent,
+    ModifyObjectsEvent,
     AddObjectEvent,
     DeleteObjectEvent,
     SortChildrenEvent,
@@ -220,6 +221,7 @@ class DocumentTree(QTreeWidget, ProteusComponent):
             - ADD OBJECT -> update_on_add_object
             - SAVE PROJECT -> update_on_save_project
             - MODIFY OBJECT -> update_on_modify_object
+            - MODIFY OBJECTS -> update_on_modify_objects
             - DELETE OBJECT -> update_on_delete_object
             - SELECT OBJECT -> update_on_select_object
             - SORT CHILDREN -> update_on_sort_children
@@ -228,6 +230,7 @@ class DocumentTree(QTreeWidget, ProteusComponent):
         AddObjectEvent().connect(self.update_on_add_object)
         SaveProjectEvent().connect(self.update_on_save_project)
         ModifyObjectEvent().connect(self.update_on_modify_object)
+        ModifyObjectsEvent().connect(self.update_on_modify_objects)
         DeleteObjectEvent().connect(self.update_on_delete_object)
         SelectObjectEvent().connect(self.update_on_select_object)
         SortChildrenEvent().connect(self.update_on_sort_children)
@@ -427,6 +430,37 @@ class DocumentTree(QTreeWidget, ProteusComponent):
 
         self.update_indexes()
 
+    # ----------------------------------------------------------------------
+    # Method     : update_on_modify_objects
+    # Description: Update the document tree when several objects are
+    #              modified.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def update_on_modify_objects(self, object_ids: List[ProteusID]) -> None:
+        """
+        Update the document tree when several objects are modified. The tree
+        items of the modified objects are updated and the indexes are
+        calculated once.
+
+        Triggered by: ModifyObjectsEvent
+
+        :param object_ids: The ids of the objects to update
+        """
+        tree_items_ids: List[ProteusID] = [
+            object_id for object_id in object_ids if object_id in self.tree_items
+        ]
+
+        # Skip if no object of the document was modified
+        if not tree_items_ids:
+            return
+
+        for object_id in tree_items_ids:
+            self._tree_item_setup(self.tree_items[object_id])
+
+        self.update_indexes()
+
     # ----------------------------------------------------------------------
     # Method     : update_on_save_project
     # Description: Update the document tree when a project is saved.
@@ -32,6 +32,7 @@ from proteus.application.resources.icons import Icons, ProteusIconType
 from proteus.application.events import (
     AddDocumentEvent,
     ModifyObjectEvent,
+    ModifyObjectsEvent,
     CurrentDocumentChangedEvent,
     DeleteDocumentEvent,
 )
@@ -176,11 +177,13 @@ class DocumentsContainer(QTabWidget, ProteusComponent):
         DocumentsContainer component subscribes to the following events:
             - ADD DOCUMENT -> update_on_add_document
             - MODIFY OBJECT -> update_on_modify_object
+            - MODIFY OBJECTS -> update_on_modify_objects
             - DELETE DOCUMENT -> update_on_delete_document
             - CURRENT DOCUMENT CHANGED -> update_on_current_document_changed
         """
         AddDocumentEvent().connect(self.update_on_add_document)
         ModifyObjectEvent().connect(self.update_on_modify_object)
+        ModifyObjectsEvent().connect(self.update_on_modify_objects)
         DeleteDocumentEvent().connect(self.update_on_delete_document)
         CurrentDocumentChangedEvent().connect(self.update_on_current_document_changed)
 
@@ -301,6 +304,27 @@ class DocumentsContainer(QTabWidget, ProteusComponent):
             icon = Icons().icon(ProteusIconType.Document, document_acronym)
             self.setTabIcon(tab_index, icon)
 
+    # ----------------------------------------------------------------------
+    # Method     : update_on_modify_objects
+    # Description: Update the documents tab menu component when several
+    #              objects are modified.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def update_on_modify_objects(self, object_ids: List[ProteusID]) -> None:
+        """
+        Update the documents tab menu component when several objects are
+        modified. Only the tabs of the modified documents are updated.
+
+        Triggered by: ModifyObjectsEvent
+
+        :param object_ids: Ids of the modified objects.
+        """
+        for object_id in object_ids:
+            if object_id in self.tabs:
+                self.update_on_modify_object(object_id)
+
     # ----------------------------------------------------------------------
     # Method     : update_on_current_document_changed
     # Description: Update the documents tab menu component when the current
@@ -11,6 +11,7 @@
 # --------------------------------------------------------------------------
 
 import logging
+from typing import List
 
 # --------------------------------------------------------------------------
 # Third-party library imports
@@ -36,6 +37,7 @@ from proteus.application.events import (
     SelectObjectEvent,
     OpenProjectEvent,
     ModifyObjectEvent,
+    ModifyObjectsEvent,
     ClipboardChangedEvent,
     UpdateMetricsEvent,
 )
@@ -141,11 +143,13 @@ class MainWindow(QMainWindow, ProteusComponent):
             - OPEN PROJECT -> update_on_open_project
             - SELECT OBJECT -> update_on_select_object
             - MODIFY OBJECT -> update_on_modify_object
+            - MODIFY OBJECTS -> update_on_modify_objects
         """
 
         OpenProjectEvent().connect(self.update_on_open_project)
         SelectObjectEvent().connect(self.update_on_select_object)
         ModifyObjectEvent().connect(self.update_on_modify_object)
+        ModifyObjectsEvent().connect(self.update_on_modify_objects)
 
     # ======================================================================
     # Component update methods (triggered by PROTEUS application events)
@@ -270,6 +274,28 @@ class MainWindow(QMainWindow, ProteusComponent):
                 f"{_('main_window.title')} - {project.get_property(PROTEUS_NAME).value}"
             )
 
+    # ----------------------------------------------------------------------
+    # Method     : update_on_modify_objects
+    # Description: Update the main window when several objects are
+    #              modified.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def update_on_modify_objects(self, object_ids: List[ProteusID]) -> None:
+        """
+        Update the window title if the project is one of the modified
+        objects.
+
+        Triggered by: ModifyObjectsEvent
+
+        :param object_ids: Ids of the modified objects
+        """
+        project: Project = self._controller.get_current_project()
+
+        if project.id in object_ids:
+            self.update_on_modify_object(project.id)
+
     # ======================================================================
     # Component slots methods
     # ======================================================================
@@ -475,14 +501,17 @@ class MetricsIndicator(QWidget, ProteusComponent):
         # Create the labels
         self._html_generation_time_label = QLabel()
         self._html_load_time_label = QLabel()
+        self._save_label = QLabel()
 
         self._html_generation_time_label.hide()
         self._html_load_time_label.hide()
+        self._save_label.hide()
 
         # Create an horizontal layout
         layout = QHBoxLayout()
         layout.addWidget(self._html_generation_time_label)
         layout.addWidget(self._html_load_time_label)
+        layout.addWidget(self._save_label)
         layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(layout)
 
@@ -504,3 +533,14 @@ class MetricsIndicator(QWidget, ProteusComponent):
 
         self._html_generation_time_label.show()
         self._html_load_time_label.show()
+
+        # Save metrics are only available after the first save
+        if Metrics.save_time is not None:
+            self._save_label.setText(
+                _(
+                    "main_window.statusbar.text.save",
+                    Metrics.save_files_written,
+                    Metrics.save_time,
+                )
+            )
+            self._save_label.show()
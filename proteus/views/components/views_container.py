@@ -10,14 +10,15 @@
 # Standard library imports
 # --------------------------------------------------------------------------
 
-from typing import Dict
+from typing import Dict, List, Set
 import logging
+import json
 
 # --------------------------------------------------------------------------
 # Third-party library imports
 # --------------------------------------------------------------------------
 
-from PyQt6.QtCore import Qt, QByteArray, QUrl, QSize
+from PyQt6.QtCore import Qt, QByteArray, QUrl, QSize, QTimer
 from PyQt6.QtGui import QDesktopServices
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebChannel import QWebChannel
@@ -42,6 +43,7 @@ from proteus.application.resources.icons import Icons, ProteusIconType
 from proteus.application.resources.plugins import Plugins
 from proteus.application.events import (
     ModifyObjectEvent,
+    ModifyObjectsEvent,
     AddViewEvent,
     DeleteViewEvent,
     AddObjectEvent,
@@ -55,10 +57,14 @@ from proteus.application.events import (
 from proteus.views.components.dialogs.base_dialogs import MessageBox
 from proteus.views.components.abstract_component import ProteusComponent
 from proteus.views.components.dialogs.new_view_dialog import NewViewDialog
+from proteus.views.url_scheme_handlers import RenderSchemeHandler, PROTEUS_SCHEMES
 
 # Module configuration
 log = logging.getLogger(__name__)  # Logger
 
+# Time window (ms) in which view refresh requests are coalesced
+VIEW_REFRESH_DELAY = 50
+
 
 # --------------------------------------------------------------------------
 # Class: ViewsContainer
@@ -108,6 +114,30 @@ class ViewsContainer(QTabWidget, ProteusComponent):
 
         self.add_view_button: QPushButton
 
+        # Timer to coalesce the view refresh requests. A single command may
+        # notify several events that update the view, they are rendered once
+        # when the timer times out.
+        self._refresh_timer: QTimer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(VIEW_REFRESH_DELAY)
+        self._refresh_timer.timeout.connect(self.refresh_timeout)
+
+        # Object to scroll to in the next refresh
+        self._pending_object_to_scroll: ProteusID = None
+
+        # Objects modified since the last refresh. If only objects were
+        # modified, the view may be patched instead of fully reloaded.
+        self._pending_modified_objects: Set[ProteusID] = set()
+        self._pending_full_refresh: bool = False
+
+        # Objects of the fragment render in progress, they are rendered
+        # again if the render is superseded by a newer fragment render
+        self._patching_objects: Set[ProteusID] = set()
+
+        # Views whose page is being rendered or loaded, they cannot be
+        # patched until the new page is loaded
+        self._loading_views: Set[str] = set()
+
         # Create the component
         self.create_component()
 
@@ -249,7 +279,8 @@ class ViewsContainer(QTabWidget, ProteusComponent):
 
         ViewsContainer component subscribes to the following events:
             - ADD OBJECT -> update_view
-            - MODIFY OBJECT -> update_view
+            - MODIFY OBJECT -> update_view_on_modify_object
+            - MODIFY OBJECTS -> update_view_on_modify_objects
             - DELETE OBJECT -> update_view
             - CURRENT DOCUMENT CHANGED -> update_view
             - SORT CHILDREN -> update_view
@@ -260,7 +291,8 @@ class ViewsContainer(QTabWidget, ProteusComponent):
             - CURRENT VIEW CHANGED -> update_on_current_view_changed
         """
         AddObjectEvent().connect(self.update_view_on_add_object)
-        ModifyObjectEvent().connect(self.update_view)
+        ModifyObjectEvent().connect(self.update_view_on_modify_object)
+        ModifyObjectsEvent().connect(self.update_view_on_modify_objects)
         DeleteObjectEvent().connect(self.update_view)
         CurrentDocumentChangedEvent().connect(self.update_view)
         SortChildrenEvent().connect(self.update_view)
@@ -271,6 +303,94 @@ class ViewsContainer(QTabWidget, ProteusComponent):
         SelectObjectEvent().connect(self.update_on_select_object)
         CurrentViewChangedEvent().connect(self.update_on_current_view_changed)
 
+    # ----------------------------------------------------------------------
+    # Method     : request_view_refresh
+    # Description: Request the view to be refreshed.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def request_view_refresh(
+        self,
+        object_to_scroll: ProteusID = None,
+        modified_objects: List[ProteusID] = None,
+    ) -> None:
+        """
+        Request the view to be refreshed. Requests made within the refresh
+        window (VIEW_REFRESH_DELAY) are coalesced and the view is displayed
+        once, when no request has been made during the whole window.
+
+        Events notified by the same command are notified synchronously, so
+        they always fall in the same window.
+
+        The last object to scroll given is kept until the view is displayed.
+
+        If every request in the window only modified objects, the view is
+        patched replacing the modified objects instead of reloaded (see
+        refresh_timeout). Any other request forces a full reload.
+
+        :param object_to_scroll: Id of the object to scroll to.
+        :param modified_objects: Ids of the modified objects, None if the
+                                 request is not caused by a modification.
+        """
+        if object_to_scroll is not None:
+            self._pending_object_to_scroll = object_to_scroll
+
+        if modified_objects is None:
+            self._pending_full_refresh = True
+        else:
+            self._pending_modified_objects.update(modified_objects)
+
+        # Restart the timer if already active
+        self._refresh_timer.start()
+
+    # ----------------------------------------------------------------------
+    # Method     : refresh_timeout
+    # Description: Display the view when the refresh window ends.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def refresh_timeout(self) -> None:
+        """
+        Display the view once the refresh window ends, scrolling to the
+        pending object to scroll if any.
+
+        If only objects were modified during the window, the current page
+        is loaded and the controller allows it, only the modified objects
+        are rendered and patched in the page (see patch_view).
+        """
+        object_to_scroll: ProteusID = self._pending_object_to_scroll
+        full_refresh: bool = self._pending_full_refresh
+        modified_objects: Set[ProteusID] = self._pending_modified_objects
+        self._pending_object_to_scroll = None
+        self._pending_full_refresh = False
+        self._pending_modified_objects = set()
+
+        current_view: str = self._state_manager.get_current_view()
+
+        if full_refresh or object_to_scroll is not None or not modified_objects:
+            self.display_view(object_to_scroll)
+            return
+
+        # Include the objects of a fragment render in progress, it is
+        # superseded by the new request
+        object_ids: List[ProteusID] = list(modified_objects | self._patching_objects)
+
+        if current_view in self._loading_views or not (
+            self._controller.can_update_html_fragments(current_view, object_ids)
+        ):
+            self.display_view()
+            return
+
+        self._patching_objects = set(object_ids)
+        self._controller.request_html_fragments(
+            xslt_name=current_view,
+            object_ids=object_ids,
+            on_finished=lambda fragments: self.patch_view(fragments, current_view),
+            on_failed=lambda _: self.display_view(),
+        )
+
     # ----------------------------------------------------------------------
     # Method     : display_view
     # Description: Update the view to display the current project
@@ -283,6 +403,9 @@ class ViewsContainer(QTabWidget, ProteusComponent):
         Update the view to display the current project information rendered
         using the current view template. If there is no current document
         (all documents deleted), clear the browser.
+
+        The view is rendered outside the GUI thread, the browser is updated
+        when the render finishes (see render_finished).
         """
         # Get the current document id and the current view
         current_document_id: ProteusID = self._state_manager.get_current_document()
@@ -296,34 +419,79 @@ class ViewsContainer(QTabWidget, ProteusComponent):
         # Get the browser for the current view
         browser: QWebEngineView = self.tabs[current_view]
 
-        # If there is no current document, clear the browser
+        # A full render supersedes any fragment render in progress
+        self._patching_objects = set()
+
+        # If there is no current document, clear the browser and discard
+        # any render in progress
         if current_document_id is None:
+            self._controller.cancel_html_view_requests()
+            self._loading_views.discard(current_view)
             browser.page().setContent(QByteArray(), "text/html")
             return
 
-        # Update the current view browser with the content
-        if current_view in self.tabs and current_document_id is not None:
-            # Get html from controller
-            html_path: str = self._controller.get_html_view_path(xslt_name=current_view)
+        # Request the html to the controller, it is generated outside the
+        # GUI thread and loaded when ready. Previous requests are discarded.
+        self._loading_views.add(current_view)
+        self._controller.request_html_view(
+            xslt_name=current_view,
+            on_finished=lambda html_string: self.render_finished(
+                html_string, current_view, object_to_scroll
+            ),
+            on_failed=lambda _: self._loading_views.discard(current_view),
+        )
+
+    # ----------------------------------------------------------------------
+    # Method     : render_finished
+    # Description: Load the rendered HTML in the view browser.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def render_finished(
+        self, html_string: str, view_name: str, object_to_scroll: ProteusID = None
+    ) -> None:
+        """
+        Load the HTML generated by the render worker in the browser of the
+        given view. Only called for the latest render request.
+
+        The HTML is served from memory by the render URL scheme handler,
+        assets and templates resources are resolved by their URL scheme
+        handlers when the browser requests them.
+
+        :param html_string: Rendered HTML string.
+        :param view_name: Name of the view the HTML was rendered for.
+        :param object_to_scroll: Id of the object to scroll to.
+        """
+        # The view may have been closed while rendering
+        if view_name not in self.tabs:
+            return
+
+        browser: QWebEngineView = self.tabs[view_name]
 
-            Metrics.html_load_time_start()
+        Metrics.html_load_time_start()
 
-            browser.loadFinished.connect(
-                lambda: self.load_finished(browser.loadFinished, object_to_scroll)
+        browser.loadFinished.connect(
+            lambda: self.load_finished(
+                browser.loadFinished, object_to_scroll, view_name
             )
+        )
 
-            url: QUrl = QUrl.fromLocalFile(html_path)
-            log.debug(f"Loading HTML file: {url.toString()}")
-            browser.page().load(url)
+        url: QUrl = RenderSchemeHandler.set_page(view_name, html_string)
+        log.debug(f"Loading HTML page: {url.toString()}")
+        browser.page().load(url)
 
-            # NOTE: When using onLoadFinished signal make sure to disconnect
-            # the sender using self.sender().disconnect() to avoid multiple
-            # calls when page is reloaded.
+        # NOTE: When using onLoadFinished signal make sure to disconnect
+        # the sender using self.sender().disconnect() to avoid multiple
+        # calls when page is reloaded.
 
-    def load_finished(self, sender: QWebEngineView.loadFinished, object_to_scroll: ProteusID):  # type: ignore
+    def load_finished(self, sender: QWebEngineView.loadFinished, object_to_scroll: ProteusID, view_name: str = None):  # type: ignore
         # Disconnect the signal to avoid multiple calls when page is reloaded
         sender.disconnect()
 
+        # The page of the view can be patched from now on
+        self._loading_views.discard(view_name)
+
         current_selected_object: ProteusID = self._state_manager.get_current_object()
         current_view: str = self._state_manager.get_current_view()
 
@@ -342,6 +510,57 @@ class ViewsContainer(QTabWidget, ProteusComponent):
 
         Metrics.html_load_time_end()
 
+    # ----------------------------------------------------------------------
+    # Method     : patch_view
+    # Description: Replace the rendered fragments in the view page.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def patch_view(self, fragments: Dict[ProteusID, str], view_name: str) -> None:
+        """
+        Replace the elements of the modified objects in the page of the
+        given view with their rendered fragments. The page is not reloaded,
+        so the scroll position is kept.
+
+        The replacement is done by the replaceProteusFragment function of
+        the template javascript. If the fragments could not be rendered,
+        the template does not define the function or any element cannot be
+        replaced, the view is fully reloaded.
+
+        :param fragments: Rendered fragments by object id, None if any of
+                          them could not be rendered.
+        :param view_name: Name of the view the fragments were rendered for.
+        """
+        self._patching_objects = set()
+
+        # The view may have been closed while rendering
+        if view_name not in self.tabs:
+            return
+
+        if fragments is None:
+            log.debug("Fragments could not be rendered, reloading the view")
+            self.display_view()
+            return
+
+        script: str = (
+            "(function (fragments) {"
+            "  if (typeof replaceProteusFragment !== 'function') { return false; }"
+            "  for (const id in fragments) {"
+            "    if (!replaceProteusFragment(id, fragments[id])) { return false; }"
+            "  }"
+            "  return true;"
+            f"}})({json.dumps(fragments)});"
+        )
+
+        def patched(result) -> None:
+            if result is not True:
+                log.debug(f"View {view_name} could not be patched, reloading")
+                self.display_view()
+
+        browser: QWebEngineView = self.tabs[view_name]
+        browser.page().runJavaScript(script, patched)
+
     # ======================================================================
     # Component update methods (triggered by PROTEUS application events)
     # ======================================================================
@@ -357,7 +576,8 @@ class ViewsContainer(QTabWidget, ProteusComponent):
         self, object_id: ProteusID, update_view: bool
     ) -> None:
         """
-        Update the view when an object is added to the project.
+        Update the view when an object is added to the project. The added
+        object is kept as scroll target until the coalesced refresh is done.
 
         Triggered by: AddObjectEvent
 
@@ -365,7 +585,51 @@ class ViewsContainer(QTabWidget, ProteusComponent):
         :param update_view: Flag to update the view.
         """
         if update_view is True:
-            self.display_view(object_id)
+            self.request_view_refresh(object_id)
+
+    # ----------------------------------------------------------------------
+    # Method     : update_view_on_modify_object
+    # Description: Update the view when an object is modified.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def update_view_on_modify_object(
+        self, object_id: ProteusID, update_view: bool
+    ) -> None:
+        """
+        Update the view when an object is modified. The modified object is
+        kept so the view can be patched instead of reloaded.
+
+        Triggered by: ModifyObjectEvent
+
+        :param object_id: Id of the modified object.
+        :param update_view: Flag to update the view.
+        """
+        if update_view is True:
+            self.request_view_refresh(modified_objects=[object_id])
+
+    # ----------------------------------------------------------------------
+    # Method     : update_view_on_modify_objects
+    # Description: Update the view when several objects are modified.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def update_view_on_modify_objects(
+        self, object_ids: List[ProteusID], update_view: bool
+    ) -> None:
+        """
+        Update the view when several objects are modified. The modified
+        objects are kept so the view can be patched instead of reloaded.
+
+        Triggered by: ModifyObjectsEvent
+
+        :param object_ids: Ids of the modified objects.
+        :param update_view: Flag to update the view.
+        """
+        if update_view is True:
+            self.request_view_refresh(modified_objects=object_ids)
 
     # ----------------------------------------------------------------------
     # Method     : update_view
@@ -378,14 +642,14 @@ class ViewsContainer(QTabWidget, ProteusComponent):
         """
         Update the view depending on the update_view flag.
 
-        Triggered by:   ModifyObjectEvent, DeleteObjectEvent,
-                        CurrentDocumentChangedEvent, CurrentViewChangedEvent
+        Triggered by:   DeleteObjectEvent, CurrentDocumentChangedEvent,
+                        SortChildrenEvent, ChangeObjectPositionEvent
 
         :param _: Unused parameter.
         :param update_view: Flag to update the view.
         """
         if update_view is True:
-            self.display_view()
+            self.request_view_refresh()
 
     # ----------------------------------------------------------------------
     # Method     : update_on_current_view_changed
@@ -418,7 +682,7 @@ class ViewsContainer(QTabWidget, ProteusComponent):
 
         # Check update_view flag
         if update_view is True:
-            self.display_view()
+            self.request_view_refresh()
 
     # ----------------------------------------------------------------------
     # Method     : update_on_add_view
@@ -521,6 +785,10 @@ class ViewsContainer(QTabWidget, ProteusComponent):
 
         browser: QWebEngineView = self.tabs.pop(view_name)
 
+        # Delete the rendered page and the view state
+        RenderSchemeHandler.remove_page(view_name)
+        self._loading_views.discard(view_name)
+
         # Delete from state manager
         self._state_manager.remove_opened_view(view_name)
 
@@ -611,9 +879,11 @@ class DocumentPage(QWebEnginePage):
         """
         # If the link is a link to an external page, ask the user if he
         # wants to open it in system default browser.
+        # NOTE: Rendered views are served using PROTEUS URL schemes
         if (
             _type == QWebEnginePage.NavigationType.NavigationTypeLinkClicked
             and not url.isLocalFile()
+            and url.scheme() not in PROTEUS_SCHEMES
         ):
             # Ask the user if he wants to open the link in the system
             # default browser
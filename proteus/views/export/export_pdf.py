@@ -40,12 +40,14 @@ from proteus.application.resources.translator import translate as _
 from proteus.application.state.manager import StateManager
 from proteus.controller.command_stack import Controller
 from proteus.views.export.export_strategy import ExportStrategy
+from proteus.views.url_scheme_handlers import RenderSchemeHandler
 
 
 # --------------------------------------------------------------------------
 # Constants
 # --------------------------------------------------------------------------
 FILE_EXTENSION_PDF: str = "pdf"
+EXPORT_PDF_PAGE_NAME: str = "export_pdf"
 
 
 # --------------------------------------------------------------------------
@@ -110,10 +112,10 @@ class ExportPDF(ExportStrategy):
             # Get current application state
             current_view = StateManager().get_current_view()
 
-            # Generate html view
-            html_view_path: str = self._controller.get_html_view_path(xslt_name=current_view)
+            # Generate html view, served from memory
+            html_string: str = self._controller.get_html_view(xslt_name=current_view)
 
-            url: QUrl = QUrl.fromLocalFile(html_view_path)
+            url: QUrl = RenderSchemeHandler.set_page(EXPORT_PDF_PAGE_NAME, html_string)
             self.page.load(url)
 
             self.exportProgressSignal.emit(33)
@@ -144,6 +146,9 @@ class ExportPDF(ExportStrategy):
         self.page.pdfPrintingFinished.connect(
             lambda path, success: self.exportFinishedSignal.emit(path, success)
         )
+        self.page.pdfPrintingFinished.connect(
+            lambda: RenderSchemeHandler.remove_page(EXPORT_PDF_PAGE_NAME)
+        )
 
     # ----------------------------------------------------------------------
     # Method     : exportFormWidget
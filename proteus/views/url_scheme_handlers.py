@@ -0,0 +1,283 @@
+# ==========================================================================
+# File: url_scheme_handlers.py
+# Description: Custom URL scheme handlers for the PROTEUS document views
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Standard library imports
+# --------------------------------------------------------------------------
+
+from pathlib import Path
+from typing import Callable, Dict, List
+import mimetypes
+import logging
+
+# --------------------------------------------------------------------------
+# Third-party library imports
+# --------------------------------------------------------------------------
+
+from PyQt6.QtCore import QBuffer, QFile, QIODevice, QObject, QUrl
+from PyQt6.QtWebEngineCore import (
+    QWebEngineProfile,
+    QWebEngineUrlRequestJob,
+    QWebEngineUrlScheme,
+    QWebEngineUrlSchemeHandler,
+)
+
+# --------------------------------------------------------------------------
+# Project specific imports
+# --------------------------------------------------------------------------
+
+from proteus.model import ASSETS_REPOSITORY
+from proteus.application import (
+    ASSETS_DUMMY_SEARCH_PATH,
+    TEMPLATE_DUMMY_SEARCH_PATH,
+    RENDER_SCHEME,
+)
+from proteus.application.configuration.config import Config
+from proteus.application.state.manager import StateManager
+
+# Module configuration
+log = logging.getLogger(__name__)  # Logger
+
+# Schemes served by PROTEUS, they are treated as local content
+PROTEUS_SCHEMES: List[str] = [
+    RENDER_SCHEME,
+    ASSETS_DUMMY_SEARCH_PATH,
+    TEMPLATE_DUMMY_SEARCH_PATH,
+]
+
+DEFAULT_MIME_TYPE: str = "application/octet-stream"
+
+
+# --------------------------------------------------------------------------
+# Function: register_url_schemes
+# Description: Register the PROTEUS URL schemes in QtWebEngine.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def register_url_schemes() -> None:
+    """
+    Register the PROTEUS URL schemes (rendered views, assets and templates)
+    in QtWebEngine. The URLs have no host, the path identifies the page or
+    the file (e.g. assets:///image.png).
+
+    NOTE: Schemes must be registered before the QApplication is created.
+    """
+    for scheme_name in PROTEUS_SCHEMES:
+        scheme: QWebEngineUrlScheme = QWebEngineUrlScheme(scheme_name.encode())
+        scheme.setSyntax(QWebEngineUrlScheme.Syntax.Path)
+        scheme.setFlags(
+            QWebEngineUrlScheme.Flag.SecureScheme
+            | QWebEngineUrlScheme.Flag.LocalScheme
+            | QWebEngineUrlScheme.Flag.LocalAccessAllowed
+            | QWebEngineUrlScheme.Flag.CorsEnabled
+        )
+        QWebEngineUrlScheme.registerScheme(scheme)
+
+
+# --------------------------------------------------------------------------
+# Function: install_url_scheme_handlers
+# Description: Install the PROTEUS URL scheme handlers in a profile.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+def install_url_scheme_handlers(
+    profile: QWebEngineProfile,
+) -> List[QWebEngineUrlSchemeHandler]:
+    """
+    Install the PROTEUS URL scheme handlers in the given profile. The
+    profile does not take ownership of the handlers, so they are parented
+    to the profile.
+
+    :param profile: Profile used by the document views.
+    :return: The installed handlers.
+    """
+    handlers: Dict[str, QWebEngineUrlSchemeHandler] = {
+        RENDER_SCHEME: RenderSchemeHandler(profile),
+        ASSETS_DUMMY_SEARCH_PATH: FileSchemeHandler(
+            lambda: StateManager().current_project_path / ASSETS_REPOSITORY,
+            profile,
+        ),
+        TEMPLATE_DUMMY_SEARCH_PATH: FileSchemeHandler(
+            lambda: Config().profile_settings.xslt_directory,
+            profile,
+        ),
+    }
+
+    for scheme_name, handler in handlers.items():
+        profile.installUrlSchemeHandler(scheme_name.encode(), handler)
+
+    return list(handlers.values())
+
+
+# --------------------------------------------------------------------------
+# Class: RenderSchemeHandler
+# Description: URL scheme handler that serves the rendered views.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+class RenderSchemeHandler(QWebEngineUrlSchemeHandler):
+    """
+    URL scheme handler that serves the rendered views from memory. Each
+    page is stored by name (usually the view name) and served in the URL
+    proteus-render:///<name>, so the HTML is never written to disk.
+
+    Pages are stored in a class attribute, they are shared by every
+    handler instance.
+    """
+
+    # Rendered pages (utf-8 encoded) by page name
+    _pages: Dict[str, bytes] = {}
+
+    # ----------------------------------------------------------------------
+    # Method     : set_page
+    # Description: Store a rendered page and return its URL.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def set_page(name: str, html_string: str) -> QUrl:
+        """
+        Store the given rendered page, replacing the previous page with the
+        same name.
+
+        :param name: Name of the page.
+        :param html_string: HTML string of the page.
+        :return: The URL to load the page.
+        """
+        RenderSchemeHandler._pages[name] = html_string.encode("utf-8")
+
+        url: QUrl = QUrl()
+        url.setScheme(RENDER_SCHEME)
+        url.setPath(f"/{name}")
+        return url
+
+    # ----------------------------------------------------------------------
+    # Method     : remove_page
+    # Description: Remove a stored page.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def remove_page(name: str) -> None:
+        """
+        Remove the stored page with the given name, if any.
+
+        :param name: Name of the page.
+        """
+        RenderSchemeHandler._pages.pop(name, None)
+
+    # ----------------------------------------------------------------------
+    # Method     : requestStarted
+    # Description: Serve the requested page.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def requestStarted(self, job: QWebEngineUrlRequestJob) -> None:
+        """
+        Reply with the stored page requested. Called in the GUI thread.
+
+        :param job: Request job.
+        """
+        name: str = job.requestUrl().path().lstrip("/")
+
+        page: bytes = RenderSchemeHandler._pages.get(name)
+        if page is None:
+            log.error(f"Rendered page '{name}' not found")
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+
+        # The buffer is deleted along with the job
+        buffer: QBuffer = QBuffer(job)
+        buffer.setData(page)
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        job.reply(b"text/html", buffer)
+
+
+# --------------------------------------------------------------------------
+# Class: FileSchemeHandler
+# Description: URL scheme handler that serves the files of a directory.
+# Date: 16/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# --------------------------------------------------------------------------
+class FileSchemeHandler(QWebEngineUrlSchemeHandler):
+    """
+    URL scheme handler that serves the files of a directory, resolving the
+    URL path against the directory when the resource is requested (e.g.
+    assets:///image.png is served from the project assets directory).
+
+    The directory is given as a function, so the current project and
+    profile are read on each request. Files outside the directory are not
+    served.
+    """
+
+    # ----------------------------------------------------------------------
+    # Method     : __init__
+    # Description: Class constructor, invoke the parents class constructors.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def __init__(self, get_directory: Callable[[], Path], parent: QObject = None):
+        """
+        Initialize the handler.
+
+        :param get_directory: Function that returns the served directory.
+        :param parent: Parent object.
+        """
+        super(FileSchemeHandler, self).__init__(parent)
+        self._get_directory = get_directory
+
+    # ----------------------------------------------------------------------
+    # Method     : requestStarted
+    # Description: Serve the requested file.
+    # Date       : 16/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def requestStarted(self, job: QWebEngineUrlRequestJob) -> None:
+        """
+        Reply with the requested file, which is read by QtWebEngine as
+        needed. Called in the GUI thread.
+
+        :param job: Request job.
+        """
+        url_path: str = job.requestUrl().path(
+            QUrl.ComponentFormattingOption.FullyDecoded
+        )
+
+        try:
+            directory: Path = Path(self._get_directory()).resolve()
+            file_path: Path = (directory / url_path.lstrip("/")).resolve()
+        except Exception as e:
+            log.error(f"Error resolving '{job.requestUrl().toString()}': {e}")
+            job.fail(QWebEngineUrlRequestJob.Error.RequestFailed)
+            return
+
+        if not file_path.is_relative_to(directory):
+            log.error(f"Access denied to '{file_path}', outside '{directory}'")
+            job.fail(QWebEngineUrlRequestJob.Error.RequestDenied)
+            return
+
+        # The file is deleted along with the job
+        file: QFile = QFile(file_path.as_posix(), job)
+        if not file_path.is_file() or not file.open(
+            QIODevice.OpenModeFlag.ReadOnly
+        ):
+            log.debug(f"File '{file_path}' not found")
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+
+        mime_type, _ = mimetypes.guess_type(file_path.name)
+        job.reply((mime_type or DEFAULT_MIME_TYPE).encode(), file)